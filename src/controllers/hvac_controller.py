@@ -6,13 +6,13 @@ import asyncio
 import logging
 import time
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Dict, Optional, Any, List
 
 from interfaces.vehicle import VehicleManager, VehicleParameter
 
 
-class HVACMode(Enum):
+class HVACMode(str, Enum):
     """HVAC operating modes."""
     OFF = "off"
     AUTO = "auto"
@@ -22,7 +22,7 @@ class HVACMode(Enum):
     VENT = "vent"
 
 
-class FanSpeed(Enum):
+class FanSpeed(IntEnum):
     """Fan speed levels."""
     OFF = 0
     LOW = 2
@@ -52,7 +52,7 @@ class HVACState:
     ac_enabled: bool
     auto_mode: bool
     defrost_enabled: bool
-    timestamp: float
+    timestamp: float  # time.monotonic() of last state change
 
 
 @dataclass
@@ -84,7 +84,7 @@ class HVACController:
             ac_enabled=False,
             auto_mode=False,
             defrost_enabled=False,
-            timestamp=time.time()
+            timestamp=time.monotonic()
         )
         
         # System limits
@@ -137,7 +137,7 @@ class HVACController:
             if fan_speed_param:
                 self.current_state.fan_speed = int(fan_speed_param.value)
             
-            self.current_state.timestamp = time.time()
+            self.current_state.timestamp = time.monotonic()
             
         except Exception as e:
             self.logger.warning(f"Could not read HVAC state from vehicle: {e}")
@@ -175,7 +175,7 @@ class HVACController:
             
             temp_fahrenheit = self._celsius_to_fahrenheit(temp_celsius)
             
-            self.logger.info(f"🌡️ Temperature set to {temp_celsius:.1f}°C ({temp_fahrenheit:.1f}°F) for {zone}")
+            self.logger.info(f"Temperature set to {temp_celsius:.1f}°C ({temp_fahrenheit:.1f}°F) for {zone}")
             
             return {
                 "success": True,
@@ -192,11 +192,13 @@ class HVACController:
     async def _set_driver_temperature(self, temp_celsius: float) -> None:
         """Set driver zone temperature."""
         self.current_state.driver_temp = temp_celsius
+        self.current_state.timestamp = time.monotonic()
         await self.vehicle_manager.set_parameter("hvac_driver_temp", temp_celsius)
     
     async def _set_passenger_temperature(self, temp_celsius: float) -> None:
         """Set passenger zone temperature."""
         self.current_state.passenger_temp = temp_celsius
+        self.current_state.timestamp = time.monotonic()
         await self.vehicle_manager.set_parameter("hvac_passenger_temp", temp_celsius)
     
     async def set_fan_speed(self, speed: int) -> Dict[str, Any]:
@@ -211,6 +213,7 @@ class HVACController:
             
             # Set fan speed
             self.current_state.fan_speed = speed
+            self.current_state.timestamp = time.monotonic()
             await self.vehicle_manager.set_parameter("hvac_fan_speed", speed)
             
             # Update mode if turning fan off
@@ -221,7 +224,7 @@ class HVACController:
             
             self.stats["commands_executed"] += 1
             
-            self.logger.info(f"💨 Fan speed set to {speed}")
+            self.logger.info(f"Fan speed set to {speed}")
             
             return {
                 "success": True,
@@ -251,7 +254,7 @@ class HVACController:
             self.stats["mode_changes"] += 1
             self.stats["commands_executed"] += 1
             
-            self.logger.info(f"🔄 HVAC mode set to {hvac_mode.value}")
+            self.logger.info(f"HVAC mode set to {hvac_mode.value}")
             
             return {
                 "success": True,
@@ -267,6 +270,7 @@ class HVACController:
     async def _apply_mode(self, mode: HVACMode) -> None:
         """Apply HVAC mode settings."""
         self.current_state.mode = mode
+        self.current_state.timestamp = time.monotonic()
         
         if mode == HVACMode.OFF:
             self.current_state.fan_speed = 0
@@ -307,6 +311,7 @@ class HVACController:
             self.current_state.defrost_enabled = True
             self.current_state.air_distribution = AirDistribution.DEFROST
             self.current_state.mode = HVACMode.DEFROST
+            self.current_state.timestamp = time.monotonic()
             
             # Set appropriate fan speed and temperature for defrost
             if self.current_state.fan_speed < 4:
@@ -321,7 +326,7 @@ class HVACController:
             
             self.stats["commands_executed"] += 1
             
-            self.logger.info("🌬️ Defrost activated")
+            self.logger.info("Defrost activated")
             
             return {
                 "success": True,
@@ -346,11 +351,12 @@ class HVACController:
                 }
             
             self.current_state.air_distribution = air_dist
+            self.current_state.timestamp = time.monotonic()
             await self.vehicle_manager.set_parameter("hvac_air_distribution", air_dist.value)
             
             self.stats["commands_executed"] += 1
             
-            self.logger.info(f"🌀 Air distribution set to {air_dist.value}")
+            self.logger.info(f"Air distribution set to {air_dist.value}")
             
             return {
                 "success": True,
@@ -365,6 +371,7 @@ class HVACController:
         """Toggle air conditioning on/off."""
         try:
             self.current_state.ac_enabled = not self.current_state.ac_enabled
+            self.current_state.timestamp = time.monotonic()
             await self.vehicle_manager.set_parameter("hvac_ac_enabled", self.current_state.ac_enabled)
             
             # Adjust mode based on AC state
@@ -375,7 +382,7 @@ class HVACController:
             self.stats["commands_executed"] += 1
             
             status = "on" if self.current_state.ac_enabled else "off"
-            self.logger.info(f"❄️ Air conditioning turned {status}")
+            self.logger.info(f"Air conditioning turned {status}")
             
             return {
                 "success": True,
@@ -403,6 +410,7 @@ class HVACController:
             self.target_temp = temp_celsius
             self.current_state.auto_mode = True
             self.current_state.mode = HVACMode.AUTO
+            self.current_state.timestamp = time.monotonic()
             
             # Set initial temperature
             await self._set_driver_temperature(temp_celsius)
@@ -411,7 +419,7 @@ class HVACController:
             self.stats["commands_executed"] += 1
             
             temp_fahrenheit = self._celsius_to_fahrenheit(temp_celsius)
-            self.logger.info(f"🤖 Auto mode enabled, target: {temp_celsius:.1f}°C ({temp_fahrenheit:.1f}°F)")
+            self.logger.info(f"Auto mode enabled, target: {temp_celsius:.1f}°C ({temp_fahrenheit:.1f}°F)")
             
             return {
                 "success": True,
@@ -426,9 +434,13 @@ class HVACController:
     
     async def get_status(self) -> Dict[str, Any]:
         """Get current HVAC system status."""
+        return self.get_status_sync()
+    
+    def get_status_sync(self) -> Dict[str, Any]:
+        """Get current HVAC system status without a coroutine, for pollers."""
         try:
             # Get current cabin temperature (mock for now)
-            cabin_temp = await self._get_cabin_temperature()
+            cabin_temp = self._get_cabin_temperature()
             
             return {
                 "mode": self.current_state.mode.value,
@@ -444,14 +456,15 @@ class HVACController:
                 "recirculation": self.current_state.recirculation,
                 "cabin_temperature_celsius": cabin_temp,
                 "cabin_temperature_fahrenheit": self._celsius_to_fahrenheit(cabin_temp),
-                "timestamp": self.current_state.timestamp
+                # Wall-clock time of the last state change, for consumers
+                "timestamp": time.time() - (time.monotonic() - self.current_state.timestamp)
             }
             
         except Exception as e:
             self.logger.error(f"Error getting HVAC status: {e}")
             return {"error": str(e)}
     
-    async def _get_cabin_temperature(self) -> float:
+    def _get_cabin_temperature(self) -> float:
         """Get current cabin temperature."""
         # In real implementation, would read from cabin temperature sensor
         # For now, simulate cabin temperature based on HVAC operation
@@ -469,7 +482,7 @@ class HVACController:
     
     async def _auto_select_mode(self, target_temp: float) -> None:
         """Automatically select appropriate HVAC mode based on target temperature."""
-        cabin_temp = await self._get_cabin_temperature()
+        cabin_temp = self._get_cabin_temperature()
         
         if target_temp > cabin_temp + 2:
             # Need heating
@@ -487,22 +500,24 @@ class HVACController:
             return
         
         try:
-            cabin_temp = await self._get_cabin_temperature()
+            cabin_temp = self._get_cabin_temperature()
             temp_diff = abs(cabin_temp - self.target_temp)
             
             if temp_diff > self.temp_tolerance:
+                fan_speed = self.current_state.fan_speed
+                
                 # Adjust fan speed based on temperature difference
                 if temp_diff > 5.0:
-                    new_fan_speed = min(6, self.current_state.fan_speed + 1)
+                    new_fan_speed = min(6, fan_speed + 1)
                 elif temp_diff > 2.0:
-                    new_fan_speed = min(4, max(2, self.current_state.fan_speed))
+                    new_fan_speed = min(4, max(2, fan_speed))
                 else:
-                    new_fan_speed = max(1, self.current_state.fan_speed - 1)
+                    new_fan_speed = max(1, fan_speed - 1)
                 
-                if new_fan_speed != self.current_state.fan_speed:
+                if new_fan_speed != fan_speed:
                     await self.set_fan_speed(new_fan_speed)
                     self.stats["auto_adjustments"] += 1
-                    self.logger.debug(f"🤖 Auto-adjusted fan speed to {new_fan_speed}")
+                    self.logger.debug(f"Auto-adjusted fan speed to {new_fan_speed}")
             
         except Exception as e:
             self.logger.error(f"Auto adjustment error: {e}")
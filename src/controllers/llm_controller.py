@@ -3,13 +3,19 @@ LLM Controller - Manages local language model integration and processing
 """
 
 import asyncio
+import hashlib
+import itertools
 import json
 import logging
+import os
+import re
 import time
-from dataclasses import dataclass
+from collections import Counter, OrderedDict, deque
+from dataclasses import asdict, dataclass, replace
 from enum import Enum
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Deque, Tuple
 import aiohttp
+import numpy as np
 
 try:
     import ollama
@@ -18,6 +24,101 @@ except ImportError:
     OLLAMA_AVAILABLE = False
     logging.warning("Ollama not available - using mock LLM responses")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Below this much RAM, precision="auto" moves to a smaller quantization
+LOW_MEMORY_THRESHOLD = 8 * 1024 ** 3
+LOW_MEMORY_QUANTIZATION = "q4_0"
+
+# Seconds a successful model availability check stays valid
+MODEL_CHECK_TTL = 300.0
+
+# Concurrent chat requests when OLLAMA_NUM_PARALLEL is unset, "auto" (0) or invalid
+DEFAULT_NUM_PARALLEL = 4
+
+# Seconds before a failed embedding request is tried again
+EMBEDDING_RETRY_INTERVAL = 60.0
+
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Words that choose between opposite actions; similar phrasings only share a
+# cached response when they use the same ones ("turn on" vs "turn off")
+_ACTION_WORDS = frozenset({
+    "on", "off", "up", "down", "increase", "decrease", "raise", "lower",
+    "higher", "more", "less", "warmer", "cooler", "hotter", "colder",
+    "brighter", "dimmer", "louder", "quieter", "open", "close", "start", "stop",
+    "enable", "disable", "activate", "deactivate", "lock", "unlock", "max", "min",
+})
+
+
+# Words that refer back to the conversation ("make it warmer", "do that
+# again"); only commands using them are cached per conversation history
+_CONTEXT_WORDS = frozenset({
+    "it", "that", "this", "those", "them", "there", "again", "same", "instead",
+})
+
+
+def _tokenize(text: str) -> frozenset:
+    """Lowercase word tokens of text."""
+    return frozenset(_TOKEN_PATTERN.findall(text.lower()))
+
+
+def _stem(token: str) -> str:
+    """Strip a common inflection, so "heating", "lights" and "dimmer" match their keywords."""
+    for suffix in ("ing", "er", "ed", "s"):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[:-len(suffix)]
+            # "dimmer" -> "dimm" -> "dim"
+            if suffix != "s" and len(token) > 3 and token[-1] == token[-2]:
+                token = token[:-1]
+            break
+    return token
+
+
+def _keyword_stems(text: str) -> frozenset:
+    """Stemmed word tokens of text, for keyword matching."""
+    return frozenset(_stem(token) for token in _TOKEN_PATTERN.findall(text.lower()))
+
+
+def _num_parallel() -> int:
+    """Chat requests Ollama serves in parallel, from OLLAMA_NUM_PARALLEL."""
+    try:
+        value = int(os.getenv("OLLAMA_NUM_PARALLEL", ""))
+    except ValueError:
+        return DEFAULT_NUM_PARALLEL
+    return value if value > 0 else DEFAULT_NUM_PARALLEL
+
+
+def _total_memory_bytes() -> Optional[int]:
+    """Total physical memory in bytes, or None if it cannot be determined."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _json_loads(data):
+    """Parse JSON text or bytes (orjson when available).
+    
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    catch the stdlib exception either way.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _canonical_json(data: Any) -> str:
+    """Serialize to compact JSON with sorted keys, so equal data gives equal text."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+
 
 class IntentType(Enum):
     """Types of user intents."""
@@ -64,6 +165,15 @@ class LLMResponse:
     safety_warning: Optional[str] = None
 
 
+@dataclass(slots=True)
+class LLMStats:
+    """Running LLM processing statistics."""
+    requests_processed: int = 0
+    average_processing_time: float = 0.0
+    successful_responses: int = 0
+    failed_responses: int = 0
+
+
 class AutomotivePromptTemplate:
     """Automotive-specific prompt templates."""
     
@@ -118,15 +228,22 @@ Output: {
 }
 """
 
-    CONTEXT_PROMPT = """Previous conversation:
+    # Everything that never changes goes first and is sent byte-for-byte identical
+    # on every call, so Ollama can reuse the cached prompt prefix across turns.
+    STATIC_PREFIX = SYSTEM_PROMPT + """
+Each request contains the previous conversation, the current vehicle status and the user command.
+Provide appropriate response considering the context and current vehicle state.
+"""
+
+    # Per-turn content, ordered from slowest- to fastest-changing
+    DYNAMIC_SUFFIX = """Previous conversation:
 {conversation_history}
 
 Current vehicle status:
 {vehicle_status}
 
 User command: "{user_input}"
-
-Provide appropriate response considering the context and current vehicle state."""
+"""
 
 
 class ConversationManager:
@@ -134,9 +251,14 @@ class ConversationManager:
     
     def __init__(self, max_history: int = 10):
         self.max_history = max_history
-        self.conversation_history: List[Dict[str, str]] = []
+        self.conversation_history: Deque[Dict[str, Any]] = deque(maxlen=max_history)
         self.current_context: Dict[str, Any] = {}
         
+        # Formatted prompt lines for the last 5 interactions, kept incrementally
+        self._formatted_lines: Deque[str] = deque(maxlen=10)
+        self._cached_context = "No previous conversation"
+        self.version = 0
+        
     def add_interaction(self, user_input: str, assistant_response: str) -> None:
         """Add interaction to conversation history."""
         interaction = {
@@ -145,23 +267,22 @@ class ConversationManager:
             "assistant": assistant_response
         }
         
+        # Bounded deque drops the oldest interaction automatically
         self.conversation_history.append(interaction)
         
-        # Keep only recent history
-        if len(self.conversation_history) > self.max_history:
-            self.conversation_history = self.conversation_history[-self.max_history:]
+        self._formatted_lines.append(f"User: {user_input}")
+        self._formatted_lines.append(f"Assistant: {assistant_response}")
+        self._cached_context = "\n".join(self._formatted_lines)
+        self.version += 1
     
     def get_context_string(self) -> str:
         """Get formatted conversation history."""
-        if not self.conversation_history:
-            return "No previous conversation"
-        
-        context_lines = []
-        for interaction in self.conversation_history[-5:]:  # Last 5 interactions
-            context_lines.append(f"User: {interaction['user']}")
-            context_lines.append(f"Assistant: {interaction['assistant']}")
-        
-        return "\n".join(context_lines)
+        return self._cached_context
+    
+    def get_recent(self, count: int) -> List[Dict[str, Any]]:
+        """Get the most recent interactions, oldest first."""
+        start = max(0, len(self.conversation_history) - count)
+        return list(itertools.islice(self.conversation_history, start, None))
     
     def update_context(self, key: str, value: Any) -> None:
         """Update conversation context."""
@@ -171,30 +292,242 @@ class ConversationManager:
         """Clear conversation context."""
         self.conversation_history.clear()
         self.current_context.clear()
+        self._formatted_lines.clear()
+        self._cached_context = "No previous conversation"
+        self.version += 1
+
+
+class _JsonObjectScanner:
+    """Incrementally finds where a streamed top-level JSON object ends."""
+    
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.started = False
+        self.enabled = True
+        self.consumed = 0
+    
+    def feed(self, text: str) -> Optional[int]:
+        """Scan more text; return the end offset of the object once it closes."""
+        if not self.enabled:
+            return None
+        
+        for i, ch in enumerate(text):
+            if not self.started:
+                if ch.isspace():
+                    continue
+                if ch != "{":
+                    # Not a bare JSON object, so the whole reply is needed
+                    self.enabled = False
+                    return None
+                self.started = True
+                self.depth = 1
+            elif self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch in "{[":
+                self.depth += 1
+            elif ch in "}]":
+                self.depth -= 1
+                if self.depth == 0:
+                    return self.consumed + i + 1
+        
+        self.consumed += len(text)
+        return None
+
+
+class ResponseCache:
+    """Two-tier cache of LLM responses: exact-match LRU plus embedding similarity."""
+    
+    def __init__(self, 
+                 max_entries: int = 512, 
+                 max_embeddings: int = 128,
+                 similarity_threshold: float = 0.95,
+                 ttl: float = 600.0):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.ttl = ttl
+        # Entries carry their time.monotonic() expiry
+        self._exact: "OrderedDict[str, Tuple[LLMResponse, float]]" = OrderedDict()
+        self._embeddings: Deque[Tuple[str, np.ndarray, LLMResponse, float]] = deque(maxlen=max_embeddings)
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(user_input: str, 
+                 vehicle_status: Optional[Dict[str, Any]], 
+                 history: str = "") -> Tuple[str, str]:
+        """Return (exact cache key, similarity context key) for a command.
+        
+        history is the conversation context the prompt is built with. It is
+        only part of the key for commands that refer back to it, so "make it
+        warmer" is never answered from a different conversation while "turn
+        up the volume" hits however the conversation went before.
+        """
+        status_key = _canonical_json(ResponseCache.bucket_status(vehicle_status or {}))
+        normalized = user_input.lower().strip()
+        tokens = _tokenize(normalized)
+        history_key = ""
+        if tokens & _CONTEXT_WORDS:
+            history_key = hashlib.blake2b(history.encode(), digest_size=8).hexdigest()
+        digest = hashlib.blake2b(f"{normalized}\0{status_key}\0{history_key}".encode(), digest_size=16).hexdigest()
+        
+        # Similar phrasings only match when the numbers and action words in
+        # them agree ("set temperature to 72" must never answer "set
+        # temperature to 75", nor "turn on the lights" "turn off the lights")
+        numbers = ",".join(re.findall(r"\d+(?:\.\d+)?", normalized))
+        actions = ",".join(sorted(tokens & _ACTION_WORDS))
+        return digest, f"{numbers}\0{actions}\0{status_key}\0{history_key}"
+    
+    @staticmethod
+    def bucket_status(vehicle_status: Dict[str, Any]) -> Dict[str, Any]:
+        """Coarsen live sensor values so small fluctuations share cache entries."""
+        buckets = {}
+        for name, value in vehicle_status.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                buckets[name] = value
+            elif "speed" in name:
+                buckets[name] = "stopped" if value <= 0 else "slow" if value < 50 else "fast"
+            elif "temp" in name:
+                buckets[name] = round(value / 5) * 5
+            else:
+                buckets[name] = float(f"{value:.2g}")
+        return buckets
+    
+    @staticmethod
+    def is_cacheable(response: "LLMResponse") -> bool:
+        """Only plain, understood responses are reused - never safety-relevant ones."""
+        return (response.intent is not None
+                and response.intent.intent_type != IntentType.UNKNOWN
+                and not response.requires_confirmation
+                and not response.safety_warning)
+    
+    def get(self, key: str) -> Optional["LLMResponse"]:
+        """Look up an exact match."""
+        entry = self._exact.get(key)
+        if entry is None or entry[1] < time.monotonic():
+            if entry is not None:
+                del self._exact[key]
+            self.misses += 1
+            return None
+        self._exact.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+    
+    def has_context(self, context_key: str) -> bool:
+        """Whether any live embedding was stored in this context, i.e. get_similar() can hit."""
+        now = time.monotonic()
+        return any(context == context_key and expires_at >= now
+                   for context, _, _, expires_at in self._embeddings)
+    
+    def get_similar(self, embedding: np.ndarray, context_key: str) -> Optional["LLMResponse"]:
+        """Look up the most similar previous command issued in the same context."""
+        best_response = None
+        best_similarity = self.similarity_threshold
+        now = time.monotonic()
+        
+        for cached_context, cached_embedding, response, expires_at in self._embeddings:
+            if cached_context != context_key or expires_at < now:
+                continue
+            similarity = float(np.dot(embedding, cached_embedding))
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_response = response
+        
+        if best_response is not None:
+            # Counted as a miss in get(); reclassify
+            self.misses -= 1
+            self.hits += 1
+        return best_response
+    
+    def put(self, 
+            key: str, 
+            response: "LLMResponse", 
+            context_key: str, 
+            embedding: Optional[np.ndarray] = None) -> None:
+        """Store a response if it is safe to reuse."""
+        if not self.is_cacheable(response):
+            return
+        
+        # Stored as a copy, so later changes by the caller don't leak into hits
+        intent = response.intent
+        response = replace(response, intent=replace(intent, entities=list(intent.entities)))
+        
+        expires_at = time.monotonic() + self.ttl
+        self._exact[key] = (response, expires_at)
+        self._exact.move_to_end(key)
+        if len(self._exact) > self.max_entries:
+            self._exact.popitem(last=False)
+        
+        if embedding is not None:
+            self._embeddings.append((context_key, embedding, response, expires_at))
+    
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._exact.clear()
+        self._embeddings.clear()
 
 
 class LLMController:
     """Controls local LLM processing for automotive commands."""
     
+    # Keywords for fallback intent extraction, in priority order
+    INTENT_KEYWORDS = (
+        (IntentType.CLIMATE_CONTROL, frozenset({"temperature", "heat", "cool", "ac", "air"})),
+        (IntentType.LIGHTING_CONTROL, frozenset({"lights", "lighting", "dim", "bright"})),
+        (IntentType.AUDIO_CONTROL, frozenset({"volume", "music", "audio", "radio"})),
+        (IntentType.ENGINE_MANAGEMENT, frozenset({"engine", "boost", "rpm", "performance"})),
+        (IntentType.VEHICLE_STATUS, frozenset({"status", "check", "what", "how"})),
+    )
+    
+    # Keyword stem -> index of its category in INTENT_KEYWORDS (lower wins)
+    _WORD_TO_INTENT = {
+        _stem(word): priority
+        for priority, (_, words) in enumerate(INTENT_KEYWORDS)
+        for word in words
+    }
+    
     def __init__(self, 
                  model_name: str = "llama3.1:8b-instruct-q4_K_M",
-                 ollama_host: str = "http://localhost:11434"):
+                 ollama_host: str = "http://localhost:11434",
+                 embedding_model: str = "nomic-embed-text",
+                 precision: str = "auto",
+                 simulate_latency: bool = False):
         
         self.model_name = model_name
         self.ollama_host = ollama_host
+        self.embedding_model = embedding_model
+        self.precision = precision  # "auto" or a quantization tag such as "q4_0"
+        self.simulate_latency = simulate_latency  # Fake LLM delay in mock mode, for integration tests only
         self.logger = logging.getLogger(__name__)
         self.mock_mode = not OLLAMA_AVAILABLE
         
+        # Persistent HTTP session to the Ollama server (created in initialize)
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Memoized model availability (see _verify_model)
+        self._model_ok = False
+        self._model_ok_ts = 0.0
+        
         # Conversation management
         self.conversation_manager = ConversationManager()
         
+        # Response cache for repeated commands
+        self.response_cache = ResponseCache()
+        self._embeddings_retry_at = 0.0  # time.monotonic() after a failed embedding request
+        
+        # Bound in-flight chat requests to the slots Ollama serves in parallel
+        self._request_semaphore = asyncio.Semaphore(_num_parallel())
+        
         # Performance tracking
-        self.stats = {
-            "requests_processed": 0,
-            "average_processing_time": 0.0,
-            "successful_responses": 0,
-            "failed_responses": 0
-        }
+        self.stats = LLMStats()
         
         # Mock responses for development
         self.mock_responses = {
@@ -228,15 +561,64 @@ class LLMController:
                 "response": "Volume increased"
             }
         }
+        
+        # Mock responses are static, so build their response objects once
+        self._mock_prototypes = self._build_mock_prototypes()
+        
+        # Inverted index so scoring is one dict probe per input token
+        self._mock_keyword_index = self._build_mock_keyword_index()
+    
+    def _build_mock_prototypes(self) -> Dict[str, LLMResponse]:
+        """Pre-build an LLMResponse for every mock phrase."""
+        prototypes = {}
+        for phrase, data in self.mock_responses.items():
+            intent = Intent(
+                intent_type=IntentType(data["intent"]),
+                confidence=data["confidence"],
+                entities=[],
+                raw_text="",
+                action=data["action"],
+                target=data["target"],
+                value=data.get("value")
+            )
+            prototypes[phrase] = LLMResponse(
+                text=data["response"],
+                intent=intent,
+                confidence=data["confidence"],
+                processing_time=0.0,
+                requires_confirmation=data.get("requires_confirmation", False),
+                safety_warning=data.get("safety_warning")
+            )
+        return prototypes
+    
+    def _build_mock_keyword_index(self) -> Dict[str, Tuple[Tuple[str, int], ...]]:
+        """Map each mock keyword stem to the phrases containing it."""
+        # stem -> {phrase: occurrences of stem in phrase}
+        index: Dict[str, Dict[str, int]] = {}
+        for phrase in self.mock_responses:
+            for token in _TOKEN_PATTERN.findall(phrase.lower()):
+                token = _stem(token)
+                counts = index.setdefault(token, {})
+                counts[phrase] = counts.get(phrase, 0) + 1
+        return {token: tuple(counts.items()) for token, counts in index.items()}
     
     async def initialize(self) -> bool:
         """Initialize LLM controller."""
         try:
             self.logger.info("🧠 Initializing LLM Controller...")
             
+            if not self.mock_mode and (self._session is None or self._session.closed):
+                # One long-lived session so requests reuse pooled keep-alive connections
+                self._session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=30),
+                    timeout=aiohttp.ClientTimeout(total=300, connect=10)
+                )
+            
             if not self.mock_mode:
                 # Check if Ollama is running
                 if await self._check_ollama_connection():
+                    await self._select_model_precision()
+                    
                     # Verify model is available
                     if await self._verify_model():
                         self.logger.info(f"✅ LLM ready with model: {self.model_name}")
@@ -259,20 +641,71 @@ class LLMController:
     
     async def _check_ollama_connection(self) -> bool:
         """Check if Ollama service is running."""
+        if not self._session:
+            return False
+        
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.ollama_host}/api/tags", timeout=5) as response:
-                    return response.status == 200
+            async with self._session.get(
+                f"{self.ollama_host}/api/tags",
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                return response.status == 200
         except Exception:
             return False
     
+    async def _select_model_precision(self) -> None:
+        """Switch to a smaller quantization of the model when memory is tight."""
+        target = self.precision
+        if target == "auto":
+            total_ram = _total_memory_bytes()
+            if total_ram is None or total_ram >= LOW_MEMORY_THRESHOLD:
+                return
+            target = LOW_MEMORY_QUANTIZATION
+        
+        match = re.search(r"-(q\d\w*|f16|fp16)$", self.model_name, re.IGNORECASE)
+        if not match or match.group(1).lower() == target.lower():
+            return
+        
+        candidate = self.model_name[:match.start(1)] + target
+        try:
+            async with self._session.post(
+                f"{self.ollama_host}/api/show",
+                json={"name": candidate},
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status != 200:
+                    self.logger.warning(f"Model {candidate} not available, keeping {self.model_name}")
+                    return
+                info = await response.json(loads=_json_loads)
+        except Exception as e:
+            self.logger.warning(f"Could not probe model {candidate}: {e}")
+            return
+        
+        quantization = info.get("details", {}).get("quantization_level", target)
+        self.logger.info(f"Using {candidate} ({quantization}) instead of {self.model_name}")
+        self.model_name = candidate
+        self._model_ok = False
+    
     async def _verify_model(self) -> bool:
         """Verify the specified model is available."""
+        if self._model_ok and time.monotonic() - self._model_ok_ts < MODEL_CHECK_TTL:
+            return True
+        
+        if not self._session:
+            return False
+        
         try:
-            if OLLAMA_AVAILABLE:
-                models = ollama.list()
-                model_names = [model['name'] for model in models['models']]
-                return self.model_name in model_names
+            async with self._session.get(
+                f"{self.ollama_host}/api/tags",
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                response.raise_for_status()
+                data = _json_loads(await response.read())
+            
+            model_names = frozenset(model['name'] for model in data['models'])
+            self._model_ok = self.model_name in model_names
+            self._model_ok_ts = time.monotonic()
+            return self._model_ok
         except Exception as e:
             self.logger.error(f"Error checking models: {e}")
         return False
@@ -280,14 +713,39 @@ class LLMController:
     async def process_command(self, 
                             user_input: str, 
                             vehicle_status: Optional[Dict[str, Any]] = None) -> LLMResponse:
-        """Process user command and return structured response."""
+        """Process user command and return structured response.
+        
+        Failures are logged and returned as an apology response with no
+        intent rather than raised.
+        """
         start_time = time.time()
         
         try:
-            if self.mock_mode:
-                response = await self._process_mock_command(user_input)
+            cache_key, context_key = ResponseCache.make_key(
+                user_input, vehicle_status, self.conversation_manager.get_context_string()
+            )
+            response = self.response_cache.get(cache_key)
+            
+            # The embedding round-trip is only paid when a similar command
+            # could be found, or (below) when the response will be stored
+            embedding = None
+            if response is None and not self.mock_mode and self.response_cache.has_context(context_key):
+                embedding = await self._get_embedding(user_input)
+                if embedding is not None:
+                    response = self.response_cache.get_similar(embedding, context_key)
+            
+            if response is not None:
+                self.logger.debug(f"Response cache hit for '{user_input}'")
+                response = self._clone_response(response, user_input)
             else:
-                response = await self._process_ollama_command(user_input, vehicle_status)
+                if self.mock_mode:
+                    response = await self._process_mock_command(user_input)
+                else:
+                    response = await self._process_ollama_command(user_input, vehicle_status)
+                    if embedding is None and ResponseCache.is_cacheable(response):
+                        embedding = await self._get_embedding(user_input)
+                
+                self.response_cache.put(cache_key, response, context_key, embedding)
             
             # Update conversation history
             self.conversation_manager.add_interaction(user_input, response.text)
@@ -313,43 +771,70 @@ class LLMController:
                 processing_time=time.time() - start_time
             )
     
+    async def process_commands_batch(self, 
+                                     user_inputs: List[str], 
+                                     vehicle_status: Optional[Dict[str, Any]] = None) -> List[LLMResponse]:
+        """Process independent commands concurrently, returning responses in input order."""
+        return await asyncio.gather(
+            *(self.process_command(user_input, vehicle_status) for user_input in user_inputs)
+        )
+    
+    def _clone_response(self, response: LLMResponse, user_input: str) -> LLMResponse:
+        """Copy a cached response, retargeting it at the new user input."""
+        intent = response.intent
+        if intent is not None:
+            intent = replace(intent, raw_text=user_input, entities=[])
+        return replace(response, intent=intent)
+    
+    async def _get_embedding(self, text: str) -> Optional[np.ndarray]:
+        """Get a unit-length embedding for text, or None if embeddings are unavailable."""
+        if not self._session or time.monotonic() < self._embeddings_retry_at:
+            return None
+        
+        try:
+            async with self._session.post(
+                f"{self.ollama_host}/api/embeddings",
+                json={"model": self.embedding_model, "prompt": text}
+            ) as http_response:
+                http_response.raise_for_status()
+                data = await http_response.json(loads=_json_loads)
+            
+            embedding = np.asarray(data["embedding"], dtype=np.float32)
+            norm = float(np.linalg.norm(embedding))
+            if norm == 0.0:
+                return None
+            return embedding / norm
+            
+        except Exception as e:
+            # Don't pay for a failing request on every command; try again later
+            self.logger.warning(
+                f"Embedding model '{self.embedding_model}' unavailable, using exact-match cache "
+                f"for {EMBEDDING_RETRY_INTERVAL:.0f}s: {e}"
+            )
+            self._embeddings_retry_at = time.monotonic() + EMBEDDING_RETRY_INTERVAL
+            return None
+    
     async def _process_mock_command(self, user_input: str) -> LLMResponse:
         """Process command using mock responses."""
         # Simulate processing time
-        await asyncio.sleep(0.2)
+        if self.simulate_latency:
+            await asyncio.sleep(0.2)
         
-        # Find best matching mock response
-        user_lower = user_input.lower()
-        best_match = None
-        best_score = 0
+        # Find best matching mock response by shared keyword tokens
+        scores = Counter()
+        for token in _keyword_stems(user_input):
+            for phrase, occurrences in self._mock_keyword_index.get(token, ()):
+                scores[phrase] += occurrences
         
-        for phrase, response_data in self.mock_responses.items():
-            # Simple keyword matching
-            keywords = phrase.split()
-            score = sum(1 for keyword in keywords if keyword in user_lower)
-            if score > best_score:
-                best_score = score
-                best_match = response_data
+        best_phrase = None
+        best_score = 0
+        for phrase in self.mock_responses:
+            if scores[phrase] > best_score:
+                best_score = scores[phrase]
+                best_phrase = phrase
         
-        if best_match and best_score > 0:
-            intent = Intent(
-                intent_type=IntentType(best_match["intent"]),
-                confidence=best_match["confidence"],
-                entities=[],
-                raw_text=user_input,
-                action=best_match["action"],
-                target=best_match["target"],
-                value=best_match.get("value")
-            )
-            
-            return LLMResponse(
-                text=best_match["response"],
-                intent=intent,
-                confidence=best_match["confidence"],
-                processing_time=0.0,
-                requires_confirmation=best_match.get("requires_confirmation", False),
-                safety_warning=best_match.get("safety_warning")
-            )
+        if best_phrase is not None:
+            return self._clone_response(self._mock_prototypes[best_phrase], user_input)
         else:
             return LLMResponse(
                 text="I'm not sure what you want me to do. Could you please rephrase that?",
@@ -369,40 +854,66 @@ class LLMController:
                                     user_input: str, 
                                     vehicle_status: Optional[Dict[str, Any]] = None) -> LLMResponse:
         """Process command using Ollama LLM."""
-        # Prepare context
-        context = AutomotivePromptTemplate.CONTEXT_PROMPT.format(
+        # Prepare context (canonical JSON so identical statuses serialize identically)
+        context = AutomotivePromptTemplate.DYNAMIC_SUFFIX.format(
             conversation_history=self.conversation_manager.get_context_string(),
-            vehicle_status=json.dumps(vehicle_status or {}, indent=2),
+            vehicle_status=_canonical_json(vehicle_status or {}),
             user_input=user_input
         )
         
         # Create full prompt
         messages = [
-            {"role": "system", "content": AutomotivePromptTemplate.SYSTEM_PROMPT},
+            {"role": "system", "content": AutomotivePromptTemplate.STATIC_PREFIX},
             {"role": "user", "content": context}
         ]
         
+        payload = {
+            "model": self.model_name,
+            "messages": messages,
+            "stream": True,
+            "keep_alive": "30m",  # Keep the model (and its prompt cache) resident between commands
+            "options": {
+                "temperature": 0.7,
+                "top_p": 0.9,
+                "num_ctx": 2048,      # Small context caps prefill memory traffic
+                "num_predict": 128,   # JSON replies are well under this
+                "num_batch": 256,
+                "num_thread": os.cpu_count()
+            }
+        }
+        
         try:
-            # Call Ollama API
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: ollama.chat(
-                    model=self.model_name,
-                    messages=messages,
-                    options={
-                        "temperature": 0.7,
-                        "top_p": 0.9,
-                        "max_tokens": 512
-                    }
-                )
-            )
+            chunks = []
+            scanner = _JsonObjectScanner()
+            end = None
+            
+            # Stream from Ollama on the persistent session, stopping as soon as
+            # the reply's JSON object is complete instead of waiting for the tail
+            async with self._request_semaphore:
+                async with self._session.post(f"{self.ollama_host}/api/chat", json=payload) as http_response:
+                    http_response.raise_for_status()
+                    async for line in http_response.content:
+                        if not line.strip():
+                            continue
+                        
+                        chunk = _json_loads(line)
+                        if "error" in chunk:
+                            raise RuntimeError(chunk["error"])
+                        
+                        content = chunk.get("message", {}).get("content", "")
+                        chunks.append(content)
+                        end = scanner.feed(content)
+                        if end is not None or chunk.get("done"):
+                            break
             
             # Parse LLM response
-            llm_text = response['message']['content']
+            llm_text = "".join(chunks)
+            if end is not None:
+                llm_text = llm_text[:end]
             
             # Try to parse as JSON
             try:
-                parsed_response = json.loads(llm_text)
+                parsed_response = _json_loads(llm_text)
                 return self._create_llm_response_from_json(parsed_response, user_input)
             except json.JSONDecodeError:
                 # Fallback to text response
@@ -420,23 +931,26 @@ class LLMController:
     def _create_llm_response_from_json(self, parsed_response: Dict[str, Any], user_input: str) -> LLMResponse:
         """Create LLMResponse from parsed JSON."""
         try:
+            get = parsed_response.get
+            confidence = get("confidence", 0.0)
+            
             intent = Intent(
-                intent_type=IntentType(parsed_response.get("intent", "unknown")),
-                confidence=parsed_response.get("confidence", 0.0),
+                intent_type=IntentType(get("intent", "unknown")),
+                confidence=confidence,
                 entities=[],  # Would be populated in full implementation
                 raw_text=user_input,
-                action=parsed_response.get("action", "unknown"),
-                target=parsed_response.get("target", "unknown"),
-                value=parsed_response.get("value")
+                action=get("action", "unknown"),
+                target=get("target", "unknown"),
+                value=get("value")
             )
             
             return LLMResponse(
-                text=parsed_response.get("response", "Command processed"),
+                text=get("response", "Command processed"),
                 intent=intent,
-                confidence=parsed_response.get("confidence", 0.0),
+                confidence=confidence,
                 processing_time=0.0,
-                requires_confirmation=parsed_response.get("requires_confirmation", False),
-                safety_warning=parsed_response.get("safety_warning")
+                requires_confirmation=get("requires_confirmation", False),
+                safety_warning=get("safety_warning")
             )
             
         except Exception as e:
@@ -446,18 +960,11 @@ class LLMController:
     def _extract_intent_from_text(self, user_input: str, llm_response: str) -> Intent:
         """Extract intent from text response (fallback method)."""
         # Simple keyword-based intent extraction
-        user_lower = user_input.lower()
-        
-        if any(word in user_lower for word in ["temperature", "heat", "cool", "ac", "air"]):
-            intent_type = IntentType.CLIMATE_CONTROL
-        elif any(word in user_lower for word in ["lights", "lighting", "dim", "bright"]):
-            intent_type = IntentType.LIGHTING_CONTROL
-        elif any(word in user_lower for word in ["volume", "music", "audio", "radio"]):
-            intent_type = IntentType.AUDIO_CONTROL
-        elif any(word in user_lower for word in ["engine", "boost", "rpm", "performance"]):
-            intent_type = IntentType.ENGINE_MANAGEMENT
-        elif any(word in user_lower for word in ["status", "check", "what", "how"]):
-            intent_type = IntentType.VEHICLE_STATUS
+        word_to_intent = self._WORD_TO_INTENT
+        priorities = [word_to_intent[token] for token in _keyword_stems(user_input) if token in word_to_intent]
+        
+        if priorities:
+            intent_type = self.INTENT_KEYWORDS[min(priorities)][0]
         else:
             intent_type = IntentType.UNKNOWN
         
@@ -472,18 +979,17 @@ class LLMController:
     
     def _update_stats(self, processing_time: float, success: bool) -> None:
         """Update processing statistics."""
-        self.stats["requests_processed"] += 1
+        stats = self.stats
+        stats.requests_processed += 1
         
         if success:
-            self.stats["successful_responses"] += 1
+            stats.successful_responses += 1
         else:
-            self.stats["failed_responses"] += 1
+            stats.failed_responses += 1
         
-        # Update average processing time
-        total_requests = self.stats["requests_processed"]
-        current_avg = self.stats["average_processing_time"]
-        self.stats["average_processing_time"] = (
-            (current_avg * (total_requests - 1) + processing_time) / total_requests
+        # Incremental (Welford) mean stays stable over long sessions
+        stats.average_processing_time += (
+            (processing_time - stats.average_processing_time) / stats.requests_processed
         )
     
     async def get_conversation_summary(self) -> str:
@@ -492,7 +998,7 @@ class LLMController:
             return "No conversation history"
         
         # In a full implementation, this could use the LLM to summarize
-        recent_interactions = self.conversation_manager.conversation_history[-3:]
+        recent_interactions = self.conversation_manager.get_recent(3)
         summary_parts = []
         
         for interaction in recent_interactions:
@@ -502,10 +1008,20 @@ class LLMController:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get processing statistics."""
-        return self.stats.copy()
+        return asdict(self.stats)
+    
+    def get_stats_fast(self) -> LLMStats:
+        """Get the live statistics object without copying (read only)."""
+        return self.stats
     
     async def shutdown(self) -> None:
         """Shutdown LLM controller."""
         self.logger.info("🛑 Shutting down LLM Controller...")
         self.conversation_manager.clear_context()
+        self.response_cache.clear()
+        
+        if self._session:
+            await self._session.close()
+            self._session = None
+        
         self.logger.info("✅ LLM Controller shutdown complete")
\ No newline at end of file
@@ -3,19 +3,39 @@ System Controller - Main orchestration and coordination
 """
 
 import asyncio
+import heapq
 import logging
 import time
-from typing import Dict, Optional, Any
-from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from dataclasses import asdict, dataclass, field
 
 from voice.manager import VoiceManager, VoiceCommand, AudioConfig
 from controllers.llm_controller import LLMController, LLMResponse
 from controllers.hvac_controller import HVACController
 from interfaces.vehicle import VehicleManager
-from safety.monitor import SafetyMonitor
+from safety.monitor import SafetyLevel, SafetyMonitor
 from config.settings import Settings
 
 
+# Seconds a vehicle status snapshot is reused across voice commands
+VEHICLE_STATUS_TTL = 0.5
+
+# Seconds before the driver hears an interim reply while the LLM works
+LLM_INTERIM_REPLY_DELAY = 3.0
+
+# Seconds to wait for the LLM before giving up on a voice command
+LLM_COMMAND_TIMEOUT = 10.0
+
+# Seconds a detailed status report is reused across callers
+DETAILED_STATUS_TTL = 1.0
+
+# Seconds each component gets to shut down
+SHUTDOWN_TIMEOUT = 2.0
+
+# Periodic jobs due within this many seconds of each other run together
+PERIODIC_BATCH_WINDOW = 1.0
+
+
 @dataclass
 class SystemStatus:
     """Overall system status."""
@@ -28,9 +48,35 @@ class SystemStatus:
     commands_processed: int
 
 
+@dataclass(slots=True)
+class SystemStats:
+    """System-wide command statistics."""
+    commands_processed: int = 0
+    successful_commands: int = 0
+    failed_commands: int = 0
+    voice_activations: int = 0
+    safety_violations: int = 0
+    uptime_start: float = field(default_factory=time.monotonic)  # time.monotonic() at start
+
+
 class SystemController:
     """Central system controller that orchestrates all components."""
     
+    # Vehicle parameter -> periodic job to run as soon as the car reports a change
+    _PARAMETER_JOBS = {
+        "hvac_temp_set": "hvac_auto",
+        "hvac_fan_speed": "hvac_auto",
+        "hvac_mode": "hvac_auto",
+    }
+    
+    # Fixed replies, synthesized once at startup
+    _CANNED = {
+        "not_done": "Sorry, I couldn't complete that command.",
+        "error": "Sorry, there was an error processing your command.",
+        "working": "One moment.",
+        "timeout": "Sorry, that's taking too long. Please try again."
+    }
+    
     def __init__(self, settings: Settings, safety_monitor: SafetyMonitor):
         self.settings = settings
         self.safety_monitor = safety_monitor
@@ -45,52 +91,59 @@ class SystemController:
         # System state
         self.initialized = False
         self.running = False
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        
+        # Periodic jobs (name -> (interval, job)), run by a single scheduler task;
+        # the intervals are only an upper bound, events can run a job early
+        self._periodic_jobs: Dict[str, Tuple[float, Callable[[], Awaitable[None]]]] = {}
+        self._due_now: Set[str] = set()
+        self._scheduler_wakeup = asyncio.Event()
+        
+        # Flat vehicle status snapshot: (time.monotonic(), vehicle state_version, status)
+        self._vehicle_status_cache: Optional[Tuple[float, int, Dict[str, Any]]] = None
+        
+        # Last detailed status: (time.monotonic(), status)
+        self._cached_detail: Optional[Tuple[float, Dict[str, Any]]] = None
+        
+        # Intent type value -> command executor
+        self._executors: Dict[str, Callable[[Any], Awaitable[bool]]] = {
+            "climate_control": self._execute_hvac_command,
+            "lighting_control": self._execute_lighting_command,
+            "engine_management": self._execute_engine_command,
+            "audio_control": self._execute_audio_command,
+            "vehicle_status": self._execute_status_command,
+            "emergency_action": self._execute_emergency_command
+        }
+        
+        # Voice pipeline: recognized commands -> planner (LLM, safety, execute) -> speaker
+        self._plan_q: asyncio.Queue = asyncio.Queue(maxsize=4)
+        self._speak_q: asyncio.Queue = asyncio.Queue(maxsize=2)
+        self._pipeline_tasks: List[asyncio.Task] = []
         
         # Statistics
-        self.stats = {
-            "commands_processed": 0,
-            "successful_commands": 0,
-            "failed_commands": 0,
-            "voice_activations": 0,
-            "safety_violations": 0,
-            "uptime_start": time.time()
-        }
+        self.stats = SystemStats()
     
     async def initialize(self) -> bool:
         """Initialize all system components."""
         try:
             self.logger.info("🚀 Initializing System Controller...")
             
-            # Initialize vehicle manager
+            # Create vehicle manager
             self.vehicle_manager = VehicleManager(
                 obd_port=self.settings.vehicle.obd_port,
                 can_channel=self.settings.vehicle.can_channel
             )
             
-            if not await self.vehicle_manager.initialize():
-                self.logger.warning("⚠️ Vehicle manager initialization failed - continuing with limited functionality")
-            
             # Set vehicle manager in safety monitor
             self.safety_monitor.vehicle_manager = self.vehicle_manager
             
-            # Initialize LLM controller
+            # Create LLM controller
             self.llm_controller = LLMController(
                 model_name=self.settings.llm.model_name,
                 ollama_host=self.settings.llm.ollama_host
             )
             
-            if not await self.llm_controller.initialize():
-                self.logger.error("❌ LLM controller initialization failed")
-                return False
-            
-            # Initialize HVAC controller
-            self.hvac_controller = HVACController(self.vehicle_manager)
-            
-            if not await self.hvac_controller.initialize():
-                self.logger.warning("⚠️ HVAC controller initialization failed")
-            
-            # Initialize voice manager
+            # Create voice manager
             audio_config = AudioConfig(
                 sample_rate=self.settings.audio.sample_rate,
                 channels=self.settings.audio.channels,
@@ -102,17 +155,48 @@ class SystemController:
                 config=audio_config,
                 command_callback=self._handle_voice_command
             )
+            # The voice pipeline's own replies share the speaker queue
+            self.voice_manager.reply_sink = self._say
+            
+            # Vehicle, LLM and audio are independent, so bring them up together
+            vehicle_ok, llm_ok, voice_ok = await asyncio.gather(
+                self.vehicle_manager.initialize(),
+                self.llm_controller.initialize(),
+                self.voice_manager.initialize(),
+                return_exceptions=True
+            )
             
-            if not await self.voice_manager.initialize():
+            if vehicle_ok is not True:
+                if isinstance(vehicle_ok, Exception):
+                    self.logger.error("Vehicle manager initialization error: %s", vehicle_ok)
+                self.logger.warning("⚠️ Vehicle manager initialization failed - continuing with limited functionality")
+            
+            if llm_ok is not True:
+                if isinstance(llm_ok, Exception):
+                    self.logger.error("LLM controller initialization error: %s", llm_ok)
+                self.logger.error("❌ LLM controller initialization failed")
+                return False
+            
+            # HVAC controller needs the vehicle manager to be up
+            self.hvac_controller = HVACController(self.vehicle_manager)
+            
+            if not await self.hvac_controller.initialize():
+                self.logger.warning("⚠️ HVAC controller initialization failed")
+            
+            if voice_ok is not True:
+                if isinstance(voice_ok, Exception):
+                    self.logger.error("Voice manager initialization error: %s", voice_ok)
                 self.logger.error("❌ Voice manager initialization failed")
                 return False
             
+            await self.voice_manager.pretts(self._CANNED)
+            
             self.initialized = True
             self.logger.info("✅ System Controller initialized successfully")
             return True
             
         except Exception as e:
-            self.logger.error(f"System initialization failed: {e}")
+            self.logger.error("System initialization failed: %s", e)
             return False
     
     async def start(self) -> None:
@@ -124,6 +208,12 @@ class SystemController:
         self.logger.info("🎯 Starting Automotive LLM System...")
         
         try:
+            # Start the voice pipeline workers before commands can arrive
+            self._pipeline_tasks = [
+                asyncio.create_task(self._planner_worker()),
+                asyncio.create_task(self._speaker_worker())
+            ]
+            
             # Start voice listening
             await self.voice_manager.start_listening()
             
@@ -133,118 +223,261 @@ class SystemController:
             self.logger.info("✅ System started successfully")
             
         except Exception as e:
-            self.logger.error(f"System start failed: {e}")
+            self.logger.error("System start failed: %s", e)
             self.running = False
             raise
     
     async def _start_periodic_tasks(self) -> None:
         """Start background periodic tasks."""
-        # HVAC auto-adjustment task (every 30 seconds)
+        # HVAC auto-adjustment (every 30 seconds)
         if self.hvac_controller:
-            asyncio.create_task(self._hvac_auto_task())
+            self._periodic_jobs["hvac_auto"] = (30.0, self.hvac_controller.auto_adjust)
         
-        # System health monitoring task (every 60 seconds)
-        asyncio.create_task(self._health_monitoring_task())
+        # System health monitoring (every 60 seconds)
+        self._periodic_jobs["health"] = (60.0, self._check_system_health)
         
-        # Statistics update task (every 300 seconds)
-        asyncio.create_task(self._stats_update_task())
+        # Statistics logging (every 300 seconds)
+        self._periodic_jobs["stats"] = (300.0, self._log_system_stats)
+        
+        # Changes reported by the car or the safety monitor run the matching job early
+        if self.vehicle_manager:
+            self.vehicle_manager.register_change_callback(self._on_vehicle_change)
+        self.safety_monitor.register_level_callback(self._on_safety_level_change)
+        
+        asyncio.create_task(self._periodic_scheduler())
     
-    async def _hvac_auto_task(self) -> None:
-        """Periodic HVAC auto-adjustment task."""
-        while self.running:
-            try:
-                await self.hvac_controller.auto_adjust()
-                await asyncio.sleep(30.0)  # Every 30 seconds
-            except Exception as e:
-                self.logger.error(f"HVAC auto task error: {e}")
-                await asyncio.sleep(30.0)
+    def _on_vehicle_change(self, parameter_name: str) -> None:
+        """Run the job that depends on a parameter the vehicle just changed."""
+        job = self._PARAMETER_JOBS.get(parameter_name)
+        if job in self._periodic_jobs:
+            self._wake_periodic_job(job)
+    
+    def _on_safety_level_change(self, level: SafetyLevel) -> None:
+        """Check system health as soon as the safety level changes."""
+        self._wake_periodic_job("health")
+    
+    def _wake_periodic_job(self, name: str) -> None:
+        """Run a periodic job now instead of waiting for its interval."""
+        self._due_now.add(name)
+        self._scheduler_wakeup.set()
+    
+    async def _wait_for_wakeup(self, event: asyncio.Event, timeout: float) -> None:
+        """Wait until the event is set or the timeout elapses, then reset it."""
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            event.clear()
+    
+    async def _periodic_scheduler(self) -> None:
+        """Run all periodic jobs from one task with a single pending timer."""
+        loop = asyncio.get_running_loop()
+        next_run = {name: loop.time() for name in self._periodic_jobs}
+        deadlines = [(deadline, name) for name, deadline in next_run.items()]
+        heapq.heapify(deadlines)
+        
+        while self.running and deadlines:
+            # Jobs woken by an event are due immediately
+            for name in self._due_now:
+                if name in next_run:
+                    next_run[name] = loop.time()
+                    heapq.heappush(deadlines, (next_run[name], name))
+            self._due_now.clear()
+            
+            deadline, name = deadlines[0]
+            if deadline != next_run[name]:
+                # Superseded by an earlier wakeup
+                heapq.heappop(deadlines)
+                continue
+            
+            delay = deadline - loop.time()
+            if delay > 0:
+                await self._wait_for_wakeup(self._scheduler_wakeup, delay)
+                continue
+            
+            # Run every job due within the batch window together so their I/O overlaps
+            horizon = loop.time() + PERIODIC_BATCH_WINDOW
+            due = []
+            while deadlines and deadlines[0][0] <= horizon:
+                deadline, name = heapq.heappop(deadlines)
+                if deadline == next_run[name] and name not in due:
+                    due.append(name)
+            
+            await asyncio.gather(*(self._run_periodic_job(name) for name in due))
+            
+            finished = loop.time()
+            for name in due:
+                next_run[name] = finished + self._periodic_jobs[name][0]
+                heapq.heappush(deadlines, (next_run[name], name))
+    
+    async def _run_periodic_job(self, name: str) -> None:
+        """Run one periodic job, logging any error."""
+        try:
+            await self._periodic_jobs[name][1]()
+        except Exception as e:
+            self.logger.error("Periodic task %s error: %s", name, e)
+    
+    def _handle_voice_command(self, voice_command: VoiceCommand) -> None:
+        """Queue an incoming voice command for the planner."""
+        self._enqueue_latest(self._plan_q, voice_command, "voice command")
+    
+    async def _say(self, text: str, canned_key: Optional[str] = None, droppable: bool = False) -> None:
+        """Queue text for the speaker without waiting for it to be spoken."""
+        # Droppable replies (status, "one moment") may only displace each
+        # other; safety messages and prompts wait for room and are never dropped
+        item = (text, canned_key, droppable)
+        if not droppable:
+            await self._speak_q.put(item)
+        elif not self._speak_q.full() or self._drop_oldest_droppable():
+            self._speak_q.put_nowait(item)
+        else:
+            self.logger.warning("Speech backlog full, dropping reply: %r", text)
+    
+    async def _say_canned(self, key: str) -> None:
+        """Queue one of the fixed _CANNED replies."""
+        await self._say(self._CANNED[key], canned_key=key)
+    
+    def _enqueue_latest(self, queue: asyncio.Queue, item: Any, kind: str) -> None:
+        """Put an item on a bounded queue, dropping the oldest entry when full."""
+        if queue.full():
+            dropped = queue.get_nowait()
+            self.logger.warning("Pipeline backlog full, dropping %s: %r", kind, dropped)
+        queue.put_nowait(item)
     
-    async def _health_monitoring_task(self) -> None:
-        """Periodic system health monitoring."""
+    def _drop_oldest_droppable(self) -> bool:
+        """Remove the oldest droppable reply from the speech queue, if there is one."""
+        queued = [self._speak_q.get_nowait() for _ in range(self._speak_q.qsize())]
+        dropped = next((item for item in queued if item[2]), None)
+        for item in queued:
+            if item is not dropped:
+                self._speak_q.put_nowait(item)
+        if dropped is None:
+            return False
+        self.logger.warning("Speech backlog full, dropping reply: %r", dropped[0])
+        return True
+    
+    async def _planner_worker(self) -> None:
+        """Process queued voice commands one at a time."""
         while self.running:
+            voice_command = await self._plan_q.get()
             try:
-                await self._check_system_health()
-                await asyncio.sleep(60.0)  # Every minute
-            except Exception as e:
-                self.logger.error(f"Health monitoring error: {e}")
-                await asyncio.sleep(60.0)
+                await self._process_voice_command(voice_command)
+            except Exception:
+                # Unexpected failure - keep the traceback, keep the worker alive
+                self.logger.exception("Voice command handling error")
+                await self._fail_command()
+    
+    async def _fail_command(self, reply: str = "error") -> None:
+        """Record a failed command and tell the driver."""
+        self.stats.failed_commands += 1
+        self._wake_periodic_job("health")
+        await self._say_canned(reply)
     
-    async def _stats_update_task(self) -> None:
-        """Periodic statistics logging."""
+    async def _speaker_worker(self) -> None:
+        """Speak queued responses in order."""
         while self.running:
+            text, canned_key, _ = await self._speak_q.get()
             try:
-                await self._log_system_stats()
-                await asyncio.sleep(300.0)  # Every 5 minutes
+                if canned_key:
+                    await self.voice_manager.play_cached(canned_key)
+                else:
+                    await self.voice_manager.speak(text)
             except Exception as e:
-                self.logger.error(f"Stats update error: {e}")
-                await asyncio.sleep(300.0)
+                self.logger.error("Speech output error: %s", e)
     
-    async def _handle_voice_command(self, voice_command: VoiceCommand) -> None:
-        """Handle incoming voice commands."""
-        try:
-            self.stats["voice_activations"] += 1
-            self.stats["commands_processed"] += 1
-            
-            self.logger.info(f"🎤 Processing voice command: '{voice_command.text}'")
-            
-            # Get current vehicle status for context
-            vehicle_status = {}
-            if self.vehicle_manager:
-                vehicle_status = await self.vehicle_manager.get_vehicle_status()
-                vehicle_status = {k: v.value for k, v in vehicle_status.items()}
-            
-            # Process command with LLM
-            llm_response = await self.llm_controller.process_command(
-                voice_command.text,
+    async def _process_voice_command(self, voice_command: VoiceCommand) -> None:
+        """Handle a voice command: LLM, safety validation and execution."""
+        self.stats.voice_activations += 1
+        self.stats.commands_processed += 1
+        
+        self.logger.info("🎤 Processing voice command: '%s'", voice_command.text)
+        
+        # Get current vehicle status for context
+        vehicle_status = await self._get_vehicle_status()
+        
+        # Process command with LLM. LLM errors come back as a response
+        # without an intent; only a slow model is handled here.
+        llm_response = await self._ask_llm(voice_command.text, vehicle_status)
+        if llm_response is None:
+            self.logger.warning("LLM timed out on command: '%s'", voice_command.text)
+            await self._fail_command("timeout")
+            return
+        
+        # Validate command safety
+        intent = llm_response.intent
+        if intent:
+            kind = intent.intent_type.value
+            validation = await self.safety_monitor.validate_command(
+                kind,
+                intent.target,
+                intent.value,
                 vehicle_status
             )
             
-            # Validate command safety
-            if llm_response.intent:
-                validation = await self.safety_monitor.validate_command(
-                    llm_response.intent.intent_type.value,
-                    llm_response.intent.target,
-                    llm_response.intent.value,
-                    vehicle_status
-                )
-                
-                if not validation.allowed:
-                    # Command blocked for safety
-                    await self.voice_manager.speak(
-                        f"Sorry, I cannot execute that command: {validation.blocked_reason}"
-                    )
-                    self.stats["failed_commands"] += 1
-                    return
-                
-                # Check if confirmation required
-                if validation.required_confirmations:
-                    response_text = llm_response.text + " " + " ".join(validation.warnings)
-                    if llm_response.requires_confirmation:
-                        response_text += " Please say 'confirm' to proceed."
-                    
-                    await self.voice_manager.speak(response_text)
-                    # In a full implementation, would wait for confirmation
-                    return
-            
-            # Execute the command
-            if llm_response.intent:
-                success = await self._execute_command(llm_response)
+            if not validation.allowed:
+                # Command blocked for safety
+                await self._say(f"Sorry, I cannot execute that command: {validation.blocked_reason}")
+                self.stats.failed_commands += 1
+                return
+            
+            # Check if confirmation required
+            if validation.required_confirmations:
+                parts = [llm_response.text]
+                if validation.warnings:
+                    parts.extend(validation.warnings)
+                if llm_response.requires_confirmation:
+                    parts.append("Please say 'confirm' to proceed.")
                 
-                if success:
-                    self.stats["successful_commands"] += 1
-                    await self.voice_manager.speak(llm_response.text)
-                else:
-                    self.stats["failed_commands"] += 1
-                    await self.voice_manager.speak("Sorry, I couldn't complete that command.")
+                await self._say(" ".join(parts))
+                # In a full implementation, would wait for confirmation
+                return
+        
+        # Execute the command
+        if intent:
+            success = await self._execute_command(llm_response)
+            
+            if success:
+                self.stats.successful_commands += 1
+                await self._say(
+                    llm_response.text,
+                    droppable=kind == "vehicle_status"
+                )
             else:
-                # No intent recognized
-                await self.voice_manager.speak(llm_response.text)
-                self.stats["failed_commands"] += 1
-            
-        except Exception as e:
-            self.logger.error(f"Voice command handling error: {e}")
-            self.stats["failed_commands"] += 1
-            await self.voice_manager.speak("Sorry, there was an error processing your command.")
+                self.stats.failed_commands += 1
+                await self._say_canned("not_done")
+        else:
+            # No intent recognized
+            await self._say(llm_response.text)
+            self.stats.failed_commands += 1
+    
+    async def _ask_llm(self, text: str, vehicle_status: Dict[str, Any]) -> Optional[LLMResponse]:
+        """Run the LLM on a command, saying so if it is slow; None on timeout."""
+        task = asyncio.ensure_future(self.llm_controller.process_command(text, vehicle_status))
+        try:
+            done, _ = await asyncio.wait({task}, timeout=LLM_INTERIM_REPLY_DELAY)
+            if not done:
+                await self._say(self._CANNED["working"], canned_key="working", droppable=True)
+            return await asyncio.wait_for(task, LLM_COMMAND_TIMEOUT - LLM_INTERIM_REPLY_DELAY)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            task.cancel()
+    
+    async def _get_vehicle_status(self) -> Dict[str, Any]:
+        """Get flat vehicle status values, reusing a snapshot for up to 500 ms."""
+        if not self.vehicle_manager:
+            return {}
+        
+        now = time.monotonic()
+        version = self.vehicle_manager.state_version
+        cached = self._vehicle_status_cache
+        if cached and now - cached[0] < VEHICLE_STATUS_TTL and cached[1] == version:
+            return cached[2]
+        
+        vehicle_status = await self.vehicle_manager.get_vehicle_values()
+        self._vehicle_status_cache = (now, version, vehicle_status)
+        return vehicle_status
     
     async def _execute_command(self, llm_response: LLMResponse) -> bool:
         """Execute a parsed command."""
@@ -255,30 +488,16 @@ class SystemController:
         
         try:
             # Route command to appropriate controller
-            if intent.intent_type.value == "climate_control":
-                return await self._execute_hvac_command(intent)
-            
-            elif intent.intent_type.value == "lighting_control":
-                return await self._execute_lighting_command(intent)
-            
-            elif intent.intent_type.value == "engine_management":
-                return await self._execute_engine_command(intent)
-            
-            elif intent.intent_type.value == "audio_control":
-                return await self._execute_audio_command(intent)
-            
-            elif intent.intent_type.value == "vehicle_status":
-                return await self._execute_status_command(intent)
-            
-            elif intent.intent_type.value == "emergency_action":
-                return await self._execute_emergency_command(intent)
-            
-            else:
-                self.logger.warning(f"Unknown intent type: {intent.intent_type}")
+            kind = intent.intent_type.value
+            executor = self._executors.get(kind)
+            if executor is None:
+                self.logger.warning("Unknown intent type: %s", kind)
                 return False
+            
+            return await executor(intent)
                 
         except Exception as e:
-            self.logger.error(f"Command execution error: {e}")
+            self.logger.error("Command execution error: %s", e)
             return False
     
     async def _execute_hvac_command(self, intent) -> bool:
@@ -286,31 +505,37 @@ class SystemController:
         if not self.hvac_controller:
             return False
         
-        if intent.target == "temperature":
-            if intent.action == "set" and intent.value:
-                result = await self.hvac_controller.set_temperature(float(intent.value))
-                return result.get("success", False)
+        target, action, value = intent.target, intent.action, intent.value
+        result = None
+        
+        if target == "temperature":
+            if action == "set" and value:
+                result = await self.hvac_controller.set_temperature(float(value))
         
-        elif intent.target == "air_conditioning":
-            if intent.action == "activate":
+        elif target == "air_conditioning":
+            if action == "activate":
                 result = await self.hvac_controller.toggle_ac()
-                return result.get("success", False)
         
-        elif intent.target == "fan_speed":
-            if intent.action in ["set", "increase", "decrease"] and intent.value:
-                result = await self.hvac_controller.set_fan_speed(int(intent.value))
-                return result.get("success", False)
+        elif target == "fan_speed":
+            if action in ("set", "increase", "decrease") and value:
+                result = await self.hvac_controller.set_fan_speed(int(value))
         
-        return False
+        if result is None:
+            return False
+        
+        # Let auto mode react to the new climate settings right away
+        self._wake_periodic_job("hvac_auto")
+        return result.get("success", False)
     
     async def _execute_lighting_command(self, intent) -> bool:
         """Execute lighting control commands."""
         if not self.vehicle_manager:
             return False
         
+        value = intent.value
         if intent.target == "interior_lights":
-            if intent.action == "set" and intent.value:
-                return await self.vehicle_manager.set_parameter("interior_lights", int(intent.value))
+            if intent.action == "set" and value:
+                return await self.vehicle_manager.set_parameter("interior_lights", int(value))
         
         return False
     
@@ -319,9 +544,10 @@ class SystemController:
         if not self.vehicle_manager:
             return False
         
+        value = intent.value
         if intent.target == "boost_pressure":
-            if intent.action in ["set", "increase"] and intent.value:
-                return await self.vehicle_manager.set_parameter("boost_pressure", float(intent.value))
+            if intent.action in ("set", "increase") and value:
+                return await self.vehicle_manager.set_parameter("boost_pressure", float(value))
         
         return False
     
@@ -330,9 +556,10 @@ class SystemController:
         if not self.vehicle_manager:
             return False
         
+        value = intent.value
         if intent.target == "volume":
-            if intent.action in ["set", "increase", "decrease"] and intent.value:
-                return await self.vehicle_manager.set_parameter("audio_volume", int(intent.value))
+            if intent.action in ("set", "increase", "decrease") and value:
+                return await self.vehicle_manager.set_parameter("audio_volume", int(value))
         
         return False
     
@@ -377,31 +604,30 @@ class SystemController:
             
             # Log issues
             if issues:
-                self.logger.warning(f"System health issues detected: {', '.join(issues)}")
+                self.logger.warning("System health issues detected: %s", ', '.join(issues))
             else:
                 self.logger.debug("System health check passed")
                 
         except Exception as e:
-            self.logger.error(f"System health check error: {e}")
+            self.logger.error("System health check error: %s", e)
     
     async def _log_system_stats(self) -> None:
         """Log system statistics."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         try:
-            uptime = time.time() - self.stats["uptime_start"]
-            
-            stats_summary = {
-                "uptime_hours": uptime / 3600,
-                "commands_processed": self.stats["commands_processed"],
-                "success_rate": (
-                    self.stats["successful_commands"] / max(1, self.stats["commands_processed"])
-                ) * 100,
-                "voice_activations": self.stats["voice_activations"]
-            }
+            stats = self.stats
+            uptime = time.monotonic() - stats.uptime_start
+            success_rate = stats.successful_commands / max(1, stats.commands_processed) * 100
             
-            self.logger.info(f"📊 System Stats: {stats_summary}")
+            self.logger.info(
+                "📊 System Stats: uptime_hours=%.2f commands_processed=%d success_rate=%.1f%% voice_activations=%d",
+                uptime / 3600, stats.commands_processed, success_rate, stats.voice_activations
+            )
             
         except Exception as e:
-            self.logger.error(f"Stats logging error: {e}")
+            self.logger.error("Stats logging error: %s", e)
     
     def get_system_status(self) -> SystemStatus:
         """Get current system status."""
@@ -413,16 +639,25 @@ class SystemController:
             vehicle_connected=self.vehicle_manager is not None,
             safety_level=safety_status["safety_level"],
             llm_ready=self.llm_controller is not None,
-            uptime=time.time() - self.start_time,
-            commands_processed=self.stats["commands_processed"]
+            uptime=time.monotonic() - self.start_time,
+            commands_processed=self.stats.commands_processed
         )
     
     def get_detailed_status(self) -> Dict[str, Any]:
-        """Get detailed system status."""
+        """Get detailed system status (refreshed at most once a second).
+        
+        Each call gets its own copy of the cached snapshot's sections, so a
+        caller changing its result can't corrupt what others are served.
+        """
+        now = time.monotonic()
+        cached = self._cached_detail
+        if cached and now - cached[0] < DETAILED_STATUS_TTL:
+            return self._copy_status(cached[1])
+        
         status = {
             "system": self.get_system_status().__dict__,
             "safety": self.safety_monitor.get_safety_status(),
-            "stats": self.stats.copy()
+            "stats": asdict(self.stats)
         }
         
         if self.voice_manager:
@@ -433,28 +668,55 @@ class SystemController:
         
         if self.hvac_controller:
             status["hvac"] = self.hvac_controller.get_stats()
+            status["hvac_state"] = self.hvac_controller.get_status_sync()
         
-        return status
+        self._cached_detail = (now, status)
+        return self._copy_status(status)
+    
+    @staticmethod
+    def _copy_status(status: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a detailed status snapshot down to its sections."""
+        return {section: dict(values) for section, values in status.items()}
     
     async def shutdown(self) -> None:
         """Shutdown the system gracefully."""
         self.logger.info("🛑 Shutting down System Controller...")
         self.running = False
         
-        # Stop voice manager
-        if self.voice_manager:
-            await self.voice_manager.stop_listening()
-            self.voice_manager.cleanup()
+        # Wake the periodic scheduler so it sees running=False and exits
+        self._scheduler_wakeup.set()
         
-        # Shutdown controllers
-        if self.hvac_controller:
-            await self.hvac_controller.shutdown()
+        # Stop the voice pipeline workers
+        for task in self._pipeline_tasks:
+            task.cancel()
+        await asyncio.gather(*self._pipeline_tasks, return_exceptions=True)
+        self._pipeline_tasks = []
         
+        # Shut components down concurrently so one hung device can't block the rest
+        shutdowns = {}
+        if self.voice_manager:
+            shutdowns["Voice manager"] = self._shutdown_voice()
+        if self.hvac_controller:
+            shutdowns["HVAC controller"] = self.hvac_controller.shutdown()
         if self.llm_controller:
-            await self.llm_controller.shutdown()
-        
-        # Shutdown vehicle manager
+            shutdowns["LLM controller"] = self.llm_controller.shutdown()
         if self.vehicle_manager:
-            await self.vehicle_manager.shutdown()
+            shutdowns["Vehicle manager"] = self.vehicle_manager.shutdown()
+        
+        results = await asyncio.gather(
+            *(asyncio.wait_for(shutdown, timeout=SHUTDOWN_TIMEOUT) for shutdown in shutdowns.values()),
+            return_exceptions=True
+        )
+        
+        for name, result in zip(shutdowns, results):
+            if isinstance(result, asyncio.TimeoutError):
+                self.logger.warning("⚠️ %s shutdown timed out", name)
+            elif isinstance(result, Exception):
+                self.logger.error("%s shutdown error: %s", name, result)
         
-        self.logger.info("✅ System Controller shutdown complete")
\ No newline at end of file
+        self.logger.info("✅ System Controller shutdown complete")
+    
+    async def _shutdown_voice(self) -> None:
+        """Stop listening and release audio resources."""
+        await self.voice_manager.stop_listening()
+        self.voice_manager.cleanup()
\ No newline at end of file
@@ -2,13 +2,20 @@
 Vehicle Interface - OBD-II and CAN bus communication
 """
 
+import asyncio
+import json
 import logging
+import struct
+import threading
 import time
-import can
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Union, Any
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Tuple, Union, Any
+
+import numpy as np
 
 try:
     import obd
@@ -17,6 +24,163 @@ except ImportError:
     OBD_AVAILABLE = False
     logging.warning("python-obd not available - using mock OBD interface")
 
+# python-can is imported on first CANInterface construction (see _load_can):
+# it probes every bus backend at import, which is slow on a Pi and wasted
+# on modules that only need the dataclasses below
+can = None
+
+# OBD-II PIDs we can read; empty when python-obd is missing
+OBD_PIDS = {
+    "engine_rpm": obd.commands.RPM,
+    "vehicle_speed": obd.commands.SPEED,
+    "engine_temp": obd.commands.COOLANT_TEMP,
+    "throttle_pos": obd.commands.THROTTLE_POS,
+    "fuel_level": obd.commands.FUEL_LEVEL,
+    "intake_temp": obd.commands.INTAKE_TEMP,
+    "maf_rate": obd.commands.MAF,
+    "fuel_pressure": obd.commands.FUEL_PRESSURE,
+} if OBD_AVAILABLE else {}
+
+# Seconds a streamed OBD reading counts as fresh; one watcher pass over
+# all PIDs takes around a second on an ELM327, so nothing goes below that
+OBD_READING_TTL = {
+    "engine_rpm": 1.0,
+    "vehicle_speed": 1.0,
+    "throttle_pos": 1.0,
+    "maf_rate": 1.0,
+    "fuel_pressure": 2.0,
+    "engine_temp": 5.0,
+    "intake_temp": 5.0,
+    "fuel_level": 30.0,
+}
+DEFAULT_OBD_READING_TTL = 1.0
+
+# Seconds past its TTL a reading is still served while it is refreshed
+OBD_STALE_WINDOW = 2.0
+
+# ELM327 settings sent after connecting: aggressive adaptive timing and
+# no spaces in responses (python-obd strips them anyway)
+ELM327_TUNING_COMMANDS = (b"ATAT2", b"ATS0")
+
+# Where the ELM327 protocol that last worked, and the PIDs the car said it
+# supports, are remembered, so the next connect can skip the protocol
+# search, the voltage check and PID discovery
+OBD_PROBE_CACHE = Path.home() / ".automotive-llm" / "obd_cache.json"
+
+# Mock OBD readings are regenerated at most this often (seconds),
+# each with up to this much relative variation
+MOCK_TICK_INTERVAL = 0.1
+MOCK_VARIATION = 0.05
+
+MOCK_UNITS = {
+    "engine_rpm": "rpm",
+    "vehicle_speed": "km/h",
+    "engine_temp": "°C",
+    "throttle_pos": "%",
+    "fuel_level": "%",
+    "intake_temp": "°C",
+    "maf_rate": "g/s",
+    "fuel_pressure": "kPa",
+}
+
+# Units for cached CAN parameters
+CAN_UNITS = {
+    "hvac_temp_set": "°C",
+    "hvac_fan_speed": "level",
+    "interior_lights": "%",
+    "audio_volume": "level",
+    "boost_pressure": "PSI",
+}
+
+# Inbound CAN frames kept for listen_for_messages; oldest are dropped first
+CAN_RX_BUFFER_SIZE = 4096
+
+# Seconds each bus.recv waits, which also bounds how long shutdown waits
+CAN_RX_POLL_TIMEOUT = 0.1
+
+# Most frames taken from the bus per worker-thread hop
+CAN_RX_BATCH_SIZE = 64
+
+# Seconds before a value decoded from a received frame is dropped as stale
+# (values we set ourselves are kept), and how often that is checked
+CAN_STATE_MAX_AGE = 10.0
+CAN_STATE_PRUNE_INTERVAL = 1.0
+
+# Outgoing CAN messages that may wait for the writer before set_parameter blocks
+CAN_TX_QUEUE_SIZE = 64
+
+# Seconds a send waits for a free mailbox, and disconnect waits to flush
+CAN_TX_TIMEOUT = 0.1
+CAN_TX_FLUSH_TIMEOUT = 1.0
+
+# Seconds set_parameter waits for its message to be queued and sent
+CAN_SET_TIMEOUT = 2.0
+
+# 8-byte CAN payload layouts: one unsigned byte, or a little-endian uint16,
+# followed by zero padding
+_U8_FRAME = struct.Struct("<B7x")
+_U16_FRAME = struct.Struct("<H6x")
+
+
+# Vehicle-specific CAN payload encoders (writing in place into the
+# message buffer) and their inverses
+
+def _encode_hvac_temp_set(data: bytearray, value: Any) -> None:
+    # Temperature in Celsius, offset by 40, scale by 2
+    _U8_FRAME.pack_into(data, 0, int((float(value) + 40) * 2) & 0xFF)
+
+
+def _encode_level(data: bytearray, value: Any) -> None:
+    # Fan speed 0-8, brightness percentage 0-100, volume level 0-30
+    _U8_FRAME.pack_into(data, 0, int(value) & 0xFF)
+
+
+def _encode_boost_pressure(data: bytearray, value: Any) -> None:
+    # Boost pressure in 0.1 PSI units
+    _U16_FRAME.pack_into(data, 0, int(float(value) * 10) & 0xFFFF)
+
+
+def _decode_hvac_temp_set(data: bytes) -> float:
+    return _U8_FRAME.unpack_from(data)[0] / 2 - 40
+
+
+def _decode_level(data: bytes) -> int:
+    return _U8_FRAME.unpack_from(data)[0]
+
+
+def _decode_boost_pressure(data: bytes) -> float:
+    return _U16_FRAME.unpack_from(data)[0] / 10
+
+
+CAN_ENCODERS = {
+    "hvac_temp_set": _encode_hvac_temp_set,
+    "hvac_fan_speed": _encode_level,
+    "interior_lights": _encode_level,
+    "audio_volume": _encode_level,
+    "boost_pressure": _encode_boost_pressure,
+}
+
+CAN_DECODERS = {
+    "hvac_temp_set": _decode_hvac_temp_set,
+    "hvac_fan_speed": _decode_level,
+    "interior_lights": _decode_level,
+    "audio_volume": _decode_level,
+    "boost_pressure": _decode_boost_pressure,
+}
+
+
+def _load_can():
+    """Import python-can on first use; returns None if it is not installed."""
+    global can
+    if can is None:
+        try:
+            import can as can_module
+        except ImportError:
+            logging.warning("python-can not available - using mock CAN interface")
+            return None
+        can = can_module
+    return can
+
 
 class VehicleSystemType(Enum):
     """Types of vehicle systems."""
@@ -28,18 +192,18 @@ class VehicleSystemType(Enum):
     AUDIO = "audio"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VehicleParameter:
     """Represents a vehicle parameter with metadata."""
     name: str
     value: Union[float, int, str, bool]
     unit: str
-    timestamp: float
+    timestamp: float  # time.monotonic() when read, not wall-clock time
     system_type: VehicleSystemType
     source: str  # "obd", "can", "gpio"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CANMessage:
     """Represents a CAN bus message."""
     arbitration_id: int
@@ -72,27 +236,46 @@ class VehicleInterface(ABC):
         pass
 
 
+if OBD_AVAILABLE:
+    class _CachedPidAsync(obd.Async):
+        """obd.Async that takes the supported PIDs from a cache instead of querying the car."""
+        
+        def __init__(self, *args, cached_pids: Optional[List[str]] = None, **kwargs):
+            self._cached_pids = cached_pids
+            super().__init__(*args, **kwargs)
+        
+        def _OBD__load_commands(self):
+            # Overrides the name-mangled OBD.__load_commands run by __init__
+            if not self._cached_pids:
+                return super()._OBD__load_commands()
+            if self.status() == obd.OBDStatus.CAR_CONNECTED:
+                self.supported_commands.update(
+                    obd.commands[name] for name in self._cached_pids if obd.commands.has_name(name)
+                )
+
+
 class OBDInterface(VehicleInterface):
     """OBD-II interface for reading vehicle diagnostics."""
     
     def __init__(self, port: str = "/dev/ttyUSB0", baudrate: int = 38400):
         self.port = port
         self.baudrate = baudrate
-        self.connection: Optional[obd.OBD] = None
+        self.connection: Optional[obd.Async] = None
         self.logger = logging.getLogger(__name__)
         self.mock_mode = not OBD_AVAILABLE
         
-        # OBD-II PIDs we can read
-        self.supported_pids = {
-            "engine_rpm": obd.commands.RPM if OBD_AVAILABLE else None,
-            "vehicle_speed": obd.commands.SPEED if OBD_AVAILABLE else None,
-            "engine_temp": obd.commands.COOLANT_TEMP if OBD_AVAILABLE else None,
-            "throttle_pos": obd.commands.THROTTLE_POS if OBD_AVAILABLE else None,
-            "fuel_level": obd.commands.FUEL_LEVEL if OBD_AVAILABLE else None,
-            "intake_temp": obd.commands.INTAKE_TEMP if OBD_AVAILABLE else None,
-            "maf_rate": obd.commands.MAF if OBD_AVAILABLE else None,
-            "fuel_pressure": obd.commands.FUEL_PRESSURE if OBD_AVAILABLE else None,
-        }
+        # Latest streamed readings, written by the python-obd watcher thread:
+        # name -> (value, unit, timestamp)
+        self._readings: Dict[str, Tuple[Any, str, float]] = {}
+        self._readings_lock = threading.Lock()
+        self._pid_names = {}
+        
+        # Direct queries pause the watcher, so only one may run at a time
+        self._query_lock = threading.Lock()
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+        
+        # OBD-II PIDs we can read (shared, read-only)
+        self.supported_pids = OBD_PIDS
         
         # Mock data for development
         self.mock_data = {
@@ -105,6 +288,11 @@ class OBDInterface(VehicleInterface):
             "maf_rate": 2.5,
             "fuel_pressure": 350.0,
         }
+        self._mock_index = {name: i for i, name in enumerate(self.mock_data)}
+        self._mock_bases = np.array(list(self.mock_data.values()))
+        self._mock_current: List[float] = []
+        self._mock_tick = float("-inf")
+        self._rng = np.random.default_rng()
     
     async def connect(self) -> bool:
         """Connect to OBD-II interface."""
@@ -113,9 +301,34 @@ class OBDInterface(VehicleInterface):
             return True
         
         try:
-            self.connection = obd.OBD(self.port, baudrate=self.baudrate)
+            # The ELM327 handshake blocks for seconds; keep it off the event loop
+            protocol, pids = self._load_probe_cache()
+            self.connection = await asyncio.to_thread(self._open, protocol, pids)
+            
+            if protocol and self.connection.status() != obd.OBDStatus.CAR_CONNECTED:
+                # Different car or adapter since last time: do the full search
+                self.logger.info("Cached OBD-II protocol failed, probing again")
+                await asyncio.to_thread(self.connection.close)
+                protocol = pids = None
+                self.connection = await asyncio.to_thread(self._open, None, None)
             
             if self.connection.status() == obd.OBDStatus.CAR_CONNECTED:
+                if self.connection.protocol_id() != protocol or not pids:
+                    self._save_probe_cache(
+                        self.connection.protocol_id(),
+                        sorted(cmd.name for cmd in self.connection.supported_commands)
+                    )
+                
+                # Serial round trips, so also off the event loop
+                await asyncio.to_thread(self._tune_adapter)
+                
+                # Stream every supported PID in the background instead of
+                # paying a serial round trip on each read
+                for name, cmd in self.supported_pids.items():
+                    self._pid_names[cmd] = name
+                    self.connection.watch(cmd, callback=self._on_pid)
+                self.connection.start()
+                
                 self.logger.info(f"✅ OBD-II connected on {self.port}")
                 return True
             else:
@@ -126,68 +339,191 @@ class OBDInterface(VehicleInterface):
             self.logger.error(f"OBD-II connection error: {e}")
             return False
     
+    def _open(self, protocol: Optional[str], pids: Optional[List[str]]):
+        """Open the ELM327 connection (blocking), trusting a cached protocol and PIDs if given."""
+        return _CachedPidAsync(
+            self.port,
+            baudrate=self.baudrate,
+            protocol=protocol,
+            fast=True,
+            check_voltage=protocol is None,
+            cached_pids=pids if protocol else None
+        )
+    
+    def _tune_adapter(self) -> None:
+        """Send the ELM327 tuning commands (blocking)."""
+        for command in ELM327_TUNING_COMMANDS:
+            self.connection.interface.send_and_parse(command)
+    
+    def _load_probe_cache(self) -> Tuple[Optional[str], Optional[List[str]]]:
+        """Get the protocol ID and supported PID names cached for this port and baud rate."""
+        try:
+            with open(OBD_PROBE_CACHE) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None, None
+        
+        if cached.get("port") == self.port and cached.get("baudrate") == self.baudrate:
+            return cached.get("protocol"), cached.get("pids")
+        return None, None
+    
+    def _save_probe_cache(self, protocol: str, pids: List[str]) -> None:
+        """Remember the protocol that worked, and the car's PIDs, for this port and baud rate."""
+        try:
+            OBD_PROBE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            with open(OBD_PROBE_CACHE, "w") as f:
+                json.dump({"port": self.port, "baudrate": self.baudrate,
+                           "protocol": protocol, "pids": pids}, f)
+        except OSError as e:
+            self.logger.warning(f"Could not save OBD-II probe cache: {e}")
+    
     async def disconnect(self) -> None:
         """Disconnect from OBD-II interface."""
         if self.connection and not self.mock_mode:
-            self.connection.close()
+            # Joins the watcher thread, which may be mid-query
+            await asyncio.to_thread(self.connection.close)
             self.connection = None
+        with self._readings_lock:
+            self._readings.clear()
         self.logger.info("🔌 OBD-II disconnected")
     
-    async def get_parameter(self, parameter_name: str) -> Optional[VehicleParameter]:
-        """Get OBD-II parameter."""
-        if self.mock_mode:
-            return self._get_mock_parameter(parameter_name)
+    def _on_pid(self, response) -> Optional[Tuple[Any, str, float]]:
+        """Store a PID response (usually runs on the python-obd thread)."""
+        value = response.value
+        if value is None:
+            return None
         
-        if not self.connection or parameter_name not in self.supported_pids:
+        name = self._pid_names.get(response.command)
+        if name is None:
             return None
         
+        reading = (
+            float(value.magnitude) if hasattr(value, 'magnitude') else value,
+            str(value.units) if hasattr(value, 'units') else "",
+            time.monotonic()
+        )
+        with self._readings_lock:
+            self._readings[name] = reading
+        return reading
+    
+    def _query_now(self, *cmds) -> list:
+        """Blocking direct queries in one watcher pause, restarting it if it has died."""
+        with self._query_lock:
+            with self.connection.paused():
+                # Async.query only returns watched values
+                responses = [obd.OBD.query(self.connection, cmd) for cmd in cmds]
+            if not self.connection.running:
+                self.connection.start()
+        return responses
+    
+    async def _refresh(self, parameter_names: List[str]) -> Dict[str, Tuple[Any, str, float]]:
+        """Read PIDs directly instead of waiting for the watcher."""
         try:
-            cmd = self.supported_pids[parameter_name]
-            response = self.connection.query(cmd)
-            
-            if response.value is not None:
-                return VehicleParameter(
-                    name=parameter_name,
-                    value=float(response.value.magnitude) if hasattr(response.value, 'magnitude') else response.value,
-                    unit=str(response.value.units) if hasattr(response.value, 'units') else "",
-                    timestamp=time.time(),
-                    system_type=VehicleSystemType.ENGINE,
-                    source="obd"
-                )
+            responses = await asyncio.to_thread(
+                self._query_now, *(self.supported_pids[name] for name in parameter_names)
+            )
         except Exception as e:
-            self.logger.error(f"Error reading OBD parameter {parameter_name}: {e}")
+            self.logger.error(f"Error reading OBD parameters {parameter_names}: {e}")
+            return {}
         
-        return None
+        readings = {}
+        for name, response in zip(parameter_names, responses):
+            reading = self._on_pid(response)
+            if reading is not None:
+                readings[name] = reading
+        return readings
     
-    def _get_mock_parameter(self, parameter_name: str) -> Optional[VehicleParameter]:
-        """Get mock parameter data for development."""
-        if parameter_name in self.mock_data:
-            # Add some variation to mock data
-            base_value = self.mock_data[parameter_name]
-            variation = base_value * 0.05  # 5% variation
-            import random
-            value = base_value + random.uniform(-variation, variation)
-            
-            units_map = {
-                "engine_rpm": "rpm",
-                "vehicle_speed": "km/h",
-                "engine_temp": "°C",
-                "throttle_pos": "%",
-                "fuel_level": "%",
-                "intake_temp": "°C",
-                "maf_rate": "g/s",
-                "fuel_pressure": "kPa"
-            }
-            
-            return VehicleParameter(
-                name=parameter_name,
-                value=round(value, 1),
-                unit=units_map.get(parameter_name, ""),
-                timestamp=time.time(),
+    def _refresh_in_background(self, parameter_names: List[str]) -> None:
+        """Start one refresh for stale readings that are not already being refreshed."""
+        names = [name for name in parameter_names if name not in self._refresh_tasks]
+        if not names:
+            return
+        
+        task = asyncio.create_task(self._refresh(names))
+        for name in names:
+            self._refresh_tasks[name] = task
+        
+        def _done(_):
+            for name in names:
+                self._refresh_tasks.pop(name, None)
+        task.add_done_callback(_done)
+    
+    async def get_parameters_batch(self, parameter_names) -> Dict[str, VehicleParameter]:
+        """Get several OBD-II parameters, with at most one direct query round."""
+        if self.mock_mode:
+            parameters = (self._get_mock_parameter(name) for name in parameter_names)
+            return {param.name: param for param in parameters if param}
+        
+        if not self.connection:
+            return {}
+        
+        names = [name for name in parameter_names if name in self.supported_pids]
+        with self._readings_lock:
+            readings = {name: self._readings.get(name) for name in names}
+        
+        # Fresh: serve it. Stale: serve it and refresh behind the caller.
+        # Expired (or never seen): wait for a direct read.
+        now = time.monotonic()
+        stale = []
+        expired = []
+        for name, reading in readings.items():
+            if reading is None:
+                expired.append(name)
+                continue
+            age = now - reading[2]
+            ttl = OBD_READING_TTL.get(name, DEFAULT_OBD_READING_TTL)
+            if age > ttl + OBD_STALE_WINDOW:
+                expired.append(name)
+            elif age > ttl:
+                stale.append(name)
+        
+        if stale:
+            self._refresh_in_background(stale)
+        if expired:
+            for name in expired:
+                readings[name] = None
+            readings.update(await self._refresh(expired))
+        
+        return {
+            name: VehicleParameter(
+                name=name,
+                value=reading[0],
+                unit=reading[1],
+                timestamp=reading[2],
                 system_type=VehicleSystemType.ENGINE,
                 source="obd"
             )
-        return None
+            for name, reading in readings.items() if reading is not None
+        }
+    
+    async def get_parameter(self, parameter_name: str) -> Optional[VehicleParameter]:
+        """Get OBD-II parameter from the latest streamed reading."""
+        return (await self.get_parameters_batch((parameter_name,))).get(parameter_name)
+    
+    def _tick_mock_data(self, now: float) -> None:
+        """Regenerate every mock reading with one batched RNG call."""
+        noise = self._rng.uniform(-MOCK_VARIATION, MOCK_VARIATION, size=len(self._mock_bases))
+        self._mock_current = np.round(self._mock_bases * (1 + noise), 1).tolist()
+        self._mock_tick = now
+    
+    def _get_mock_parameter(self, parameter_name: str) -> Optional[VehicleParameter]:
+        """Get mock parameter data for development."""
+        index = self._mock_index.get(parameter_name)
+        if index is None:
+            return None
+        
+        now = time.monotonic()
+        if now - self._mock_tick >= MOCK_TICK_INTERVAL:
+            self._tick_mock_data(now)
+        
+        return VehicleParameter(
+            name=parameter_name,
+            value=self._mock_current[index],
+            unit=MOCK_UNITS.get(parameter_name, ""),
+            timestamp=self._mock_tick,
+            system_type=VehicleSystemType.ENGINE,
+            source="obd"
+        )
     
     async def set_parameter(self, parameter_name: str, value: Any) -> bool:
         """OBD-II is read-only, cannot set parameters."""
@@ -203,7 +539,7 @@ class OBDInterface(VehicleInterface):
             return []
         
         try:
-            response = self.connection.query(obd.commands.GET_DTC)
+            response, = await asyncio.to_thread(self._query_now, obd.commands.GET_DTC)
             if response.value:
                 return [str(code) for code in response.value]
         except Exception as e:
@@ -221,6 +557,7 @@ class CANInterface(VehicleInterface):
         self.bus: Optional[can.Bus] = None
         self.logger = logging.getLogger(__name__)
         self.mock_mode = True  # Start in mock mode until CAN is detected
+        self.can_available = _load_can() is not None
         
         # Vehicle-specific CAN message definitions
         self.message_definitions = {
@@ -242,11 +579,65 @@ class CANInterface(VehicleInterface):
             "audio_source": {"id": 0x5B2, "dlc": 8},
         }
         
-        # Current vehicle state cache
-        self.vehicle_state = {}
+        # One reusable outgoing message per parameter, paired with its encoder
+        # (None keeps the all-zero payload); only the writer task fills and
+        # sends them. The scratch buffer just validates values.
+        self._tx_messages = {
+            name: (
+                can.Message(
+                    arbitration_id=msg_def["id"],
+                    data=bytearray(msg_def["dlc"]),
+                    is_extended_id=False
+                ),
+                CAN_ENCODERS.get(name)
+            )
+            for name, msg_def in self.message_definitions.items()
+        } if self.can_available else {}
+        self._encode_scratch = bytearray(8)
+        
+        # Parameter name -> system type, classified once up front
+        self._system_types = {
+            name: self._classify_parameter(name) for name in self.message_definitions
+        }
+        
+        # Arbitration ID -> (parameter name, decoder, expected length) for
+        # the inbound frames we know how to decode
+        self._rx_decoders = {
+            msg_def["id"]: (name, CAN_DECODERS[name], msg_def["dlc"])
+            for name, msg_def in self.message_definitions.items()
+            if name in CAN_DECODERS
+        }
+        
+        # Current vehicle state cache, one row per defined parameter (so it
+        # cannot grow): columns are values (any type), units, timestamps
+        # (NaN = never set or pruned) and whether the value came off the bus
+        self._state_index = {name: i for i, name in enumerate(self.message_definitions)}
+        self._state_values: List[Any] = [None] * len(self._state_index)
+        self._state_units = tuple(CAN_UNITS.get(name, "") for name in self._state_index)
+        self._state_ts = np.full(len(self._state_index), np.nan)
+        self._state_received = np.zeros(len(self._state_index), dtype=bool)
+        self._last_prune = 0.0
+        
+        # Inbound frames drained from the bus by _rx_loop. Only touched on
+        # the event loop, so no lock is needed.
+        self._rx_buffer: Deque[CANMessage] = deque(maxlen=CAN_RX_BUFFER_SIZE)
+        self._rx_ready = asyncio.Event()
+        self._rx_task: Optional[asyncio.Task] = None
+        
+        # Outgoing (parameter_name, value, future) entries, encoded and sent
+        # by _tx_loop, which resolves each future with whether it went out
+        self._tx_q: asyncio.Queue = asyncio.Queue(maxsize=CAN_TX_QUEUE_SIZE)
+        self._tx_task: Optional[asyncio.Task] = None
+        
+        # Called with a parameter's name when a frame off the bus changes its value
+        self.on_change: Optional[Callable[[str], None]] = None
     
     async def connect(self) -> bool:
         """Connect to CAN bus."""
+        if not self.can_available:
+            self.logger.warning("🔧 Using mock CAN interface")
+            return True
+        
         try:
             # Try to initialize CAN interface
             self.bus = can.Bus(
@@ -262,8 +653,10 @@ class CANInterface(VehicleInterface):
                 is_extended_id=False
             )
             
-            self.bus.send(test_msg, timeout=1.0)
+            await asyncio.to_thread(self.bus.send, test_msg, 1.0)
             self.mock_mode = False
+            self._rx_task = asyncio.create_task(self._rx_loop())
+            self._tx_task = asyncio.create_task(self._tx_loop())
             self.logger.info(f"✅ CAN bus connected on {self.channel}")
             return True
             
@@ -274,6 +667,30 @@ class CANInterface(VehicleInterface):
     
     async def disconnect(self) -> None:
         """Disconnect from CAN bus."""
+        if self._tx_task:
+            # Give queued sets a chance to go out first
+            try:
+                await asyncio.wait_for(self._tx_q.join(), CAN_TX_FLUSH_TIMEOUT)
+            except asyncio.TimeoutError:
+                self.logger.warning(f"Dropping {self._tx_q.qsize()} unsent CAN messages")
+        
+        for task in (self._rx_task, self._tx_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._rx_task = None
+        self._tx_task = None
+        
+        # Fail whatever never went out, so no caller waits forever
+        while not self._tx_q.empty():
+            _, _, sent = self._tx_q.get_nowait()
+            if not sent.done():
+                sent.set_result(False)
+            self._tx_q.task_done()
+        
         if self.bus and not self.mock_mode:
             self.bus.shutdown()
             self.bus = None
@@ -281,17 +698,22 @@ class CANInterface(VehicleInterface):
     
     async def get_parameter(self, parameter_name: str) -> Optional[VehicleParameter]:
         """Get parameter from CAN bus or cache."""
-        if parameter_name in self.vehicle_state:
-            cached_value = self.vehicle_state[parameter_name]
-            return VehicleParameter(
-                name=parameter_name,
-                value=cached_value["value"],
-                unit=cached_value.get("unit", ""),
-                timestamp=cached_value["timestamp"],
-                system_type=self._get_system_type(parameter_name),
-                source="can"
-            )
-        return None
+        index = self._state_index.get(parameter_name)
+        if index is None:
+            return None
+        
+        timestamp = float(self._state_ts[index])
+        if np.isnan(timestamp):  # never set or received
+            return None
+        
+        return VehicleParameter(
+            name=parameter_name,
+            value=self._state_values[index],
+            unit=self._state_units[index],
+            timestamp=timestamp,
+            system_type=self._get_system_type(parameter_name),
+            source="can"
+        )
     
     async def set_parameter(self, parameter_name: str, value: Any) -> bool:
         """Set vehicle parameter via CAN bus."""
@@ -299,17 +721,9 @@ class CANInterface(VehicleInterface):
             self.logger.error(f"Unknown CAN parameter: {parameter_name}")
             return False
         
-        msg_def = self.message_definitions[parameter_name]
-        
         try:
-            # Create CAN message based on parameter
-            data = self._encode_parameter(parameter_name, value)
-            
-            message = can.Message(
-                arbitration_id=msg_def["id"],
-                data=data,
-                is_extended_id=False
-            )
+            # Reject values that cannot be encoded before touching any state
+            self._encode_parameter(parameter_name, value, self._encode_scratch)
             
             if self.mock_mode:
                 # Simulate successful transmission
@@ -317,64 +731,62 @@ class CANInterface(VehicleInterface):
                 self._update_vehicle_state(parameter_name, value)
                 return True
             else:
-                # Send actual CAN message
-                self.bus.send(message, timeout=1.0)
-                self.logger.info(f"📡 CAN message sent: {parameter_name} = {value}")
-                self._update_vehicle_state(parameter_name, value)
-                return True
+                # Hand off to the writer task and wait for the send; state is
+                # only cached once the message is actually on the bus
+                if self._tx_task is None or self._tx_task.done():
+                    self.logger.error(f"Cannot set CAN parameter {parameter_name}: bus writer not running")
+                    return False
+                sent = asyncio.get_running_loop().create_future()
+                try:
+                    return await asyncio.wait_for(
+                        self._queue_and_wait(parameter_name, value, sent), CAN_SET_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    # Cancelled, so the writer skips it if it is still queued
+                    sent.cancel()
+                    self.logger.error(f"Timed out setting CAN parameter {parameter_name}")
+                    return False
                 
         except Exception as e:
             self.logger.error(f"Failed to set CAN parameter {parameter_name}: {e}")
             return False
     
-    def _encode_parameter(self, parameter_name: str, value: Any) -> bytes:
-        """Encode parameter value into CAN message data."""
-        # This would contain vehicle-specific encoding logic
-        data = [0x00] * 8  # Initialize 8-byte array
-        
-        if parameter_name == "hvac_temp_set":
-            # Temperature in Celsius, offset by 40, scale by 2
-            temp_encoded = int((float(value) + 40) * 2)
-            data[0] = temp_encoded & 0xFF
-        
-        elif parameter_name == "hvac_fan_speed":
-            # Fan speed 0-8
-            data[0] = int(value) & 0xFF
-        
-        elif parameter_name == "interior_lights":
-            # Brightness percentage 0-100
-            data[0] = int(value) & 0xFF
-        
-        elif parameter_name == "audio_volume":
-            # Volume level 0-30
-            data[0] = int(value) & 0xFF
-        
-        elif parameter_name == "boost_pressure":
-            # Boost pressure in 0.1 PSI units
-            pressure_encoded = int(float(value) * 10)
-            data[0] = pressure_encoded & 0xFF
-            data[1] = (pressure_encoded >> 8) & 0xFF
-        
-        return bytes(data)
-    
-    def _update_vehicle_state(self, parameter_name: str, value: Any) -> None:
-        """Update cached vehicle state."""
-        unit_map = {
-            "hvac_temp_set": "°C",
-            "hvac_fan_speed": "level",
-            "interior_lights": "%",
-            "audio_volume": "level",
-            "boost_pressure": "PSI"
-        }
-        
-        self.vehicle_state[parameter_name] = {
-            "value": value,
-            "unit": unit_map.get(parameter_name, ""),
-            "timestamp": time.time()
-        }
+    async def _queue_and_wait(self, parameter_name: str, value: Any, sent: asyncio.Future) -> bool:
+        """Queue a write for the writer task and wait until it has gone out (or failed)."""
+        await self._tx_q.put((parameter_name, value, sent))
+        return await sent
+    
+    def _encode_parameter(self, parameter_name: str, value: Any, data: bytearray) -> None:
+        """Encode parameter value into CAN message data, in place."""
+        # Parameters without a known encoding keep their all-zero payload
+        encoder = CAN_ENCODERS.get(parameter_name)
+        if encoder:
+            encoder(data, value)
+    
+    def _update_vehicle_state(self, parameter_name: str, value: Any,
+                              timestamp: Optional[float] = None, received: bool = False) -> None:
+        """Update cached vehicle state; timestamp defaults to time.monotonic()."""
+        index = self._state_index[parameter_name]
+        self._state_values[index] = value
+        self._state_ts[index] = time.monotonic() if timestamp is None else timestamp
+        self._state_received[index] = received
+    
+    def _prune_vehicle_state(self, now: float) -> None:
+        """Forget received values older than CAN_STATE_MAX_AGE."""
+        stale = np.flatnonzero(self._state_received & (self._state_ts < now - CAN_STATE_MAX_AGE))
+        for index in stale:
+            self._state_values[index] = None
+        self._state_ts[stale] = np.nan
+        self._state_received[stale] = False
+        self._last_prune = now
     
     def _get_system_type(self, parameter_name: str) -> VehicleSystemType:
         """Get system type for parameter."""
+        return self._system_types.get(parameter_name, VehicleSystemType.ENGINE)
+    
+    @staticmethod
+    def _classify_parameter(parameter_name: str) -> VehicleSystemType:
+        """Work out the system type from a parameter's name."""
         if parameter_name.startswith("hvac_"):
             return VehicleSystemType.HVAC
         elif parameter_name.startswith("audio_"):
@@ -386,34 +798,108 @@ class CANInterface(VehicleInterface):
         else:
             return VehicleSystemType.ENGINE
     
+    def _recv_batch(self) -> List["can.Message"]:
+        """Wait for one frame, then take whatever else is already queued (blocking)."""
+        batch = []
+        message = self.bus.recv(CAN_RX_POLL_TIMEOUT)
+        while message is not None:
+            batch.append(message)
+            if len(batch) >= CAN_RX_BATCH_SIZE:
+                break
+            message = self.bus.recv(0)
+        return batch
+    
+    async def _rx_loop(self) -> None:
+        """Drain the bus into the receive buffer and cache decoded state."""
+        while True:
+            try:
+                batch = await asyncio.to_thread(self._recv_batch)
+            except Exception as e:
+                self.logger.debug(f"CAN message receive error: {e}")
+                await asyncio.sleep(CAN_RX_POLL_TIMEOUT)
+                continue
+            
+            # One clock read for the whole batch
+            now = time.monotonic()
+            if now - self._last_prune >= CAN_STATE_PRUNE_INTERVAL:
+                self._prune_vehicle_state(now)
+            
+            if not batch:
+                continue
+            
+            for message in batch:
+                self._rx_buffer.append(CANMessage(
+                    arbitration_id=message.arbitration_id,
+                    data=bytes(message.data),
+                    timestamp=message.timestamp,
+                    is_extended_id=message.is_extended_id
+                ))
+                
+                # Skip frames that are unknown or shorter than their definition
+                decoding = self._rx_decoders.get(message.arbitration_id)
+                if decoding is not None and len(message.data) >= decoding[2]:
+                    parameter_name, decoder, _ = decoding
+                    value = decoder(message.data)
+                    changed = self._state_values[self._state_index[parameter_name]] != value
+                    self._update_vehicle_state(parameter_name, value, now, received=True)
+                    if changed and self.on_change:
+                        self.on_change(parameter_name)
+            
+            self._rx_ready.set()
+    
+    async def _tx_loop(self) -> None:
+        """Send queued CAN messages in order."""
+        while True:
+            parameter_name, value, sent = await self._tx_q.get()
+            if sent.done():
+                # Its caller timed out; sending now would apply a write reported as failed
+                self._tx_q.task_done()
+                continue
+            success = False
+            try:
+                message, encoder = self._tx_messages[parameter_name]
+                if encoder:
+                    encoder(message.data, value)
+                await asyncio.to_thread(self.bus.send, message, CAN_TX_TIMEOUT)
+                self._update_vehicle_state(parameter_name, value)
+                success = True
+                self.logger.info(f"📡 CAN message sent: {parameter_name} = {value}")
+            except Exception as e:
+                self.logger.error(f"Failed to send CAN parameter {parameter_name}: {e}")
+            finally:
+                if not sent.done():
+                    sent.set_result(success)
+                self._tx_q.task_done()
+    
     async def listen_for_messages(self, timeout: float = 1.0) -> List[CANMessage]:
-        """Listen for incoming CAN messages."""
+        """Take buffered CAN messages, waiting up to timeout if there are none."""
         if self.mock_mode:
             return []  # No mock messages for now
         
         if not self.bus:
             return []
         
-        messages = []
-        try:
-            message = self.bus.recv(timeout=timeout)
-            if message:
-                can_msg = CANMessage(
-                    arbitration_id=message.arbitration_id,
-                    data=message.data,
-                    timestamp=message.timestamp,
-                    is_extended_id=message.is_extended_id
-                )
-                messages.append(can_msg)
-        except Exception as e:
-            self.logger.debug(f"CAN message receive timeout or error: {e}")
+        if not self._rx_buffer:
+            self._rx_ready.clear()
+            try:
+                await asyncio.wait_for(self._rx_ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
         
+        messages = list(self._rx_buffer)
+        self._rx_buffer.clear()
         return messages
 
 
 class VehicleManager:
     """Unified vehicle interface manager."""
     
+    # Common OBD parameters reported in the vehicle status
+    STATUS_PARAMETERS = (
+        "engine_rpm", "vehicle_speed", "engine_temp",
+        "throttle_pos", "fuel_level", "intake_temp"
+    )
+    
     def __init__(self, obd_port: str = "/dev/ttyUSB0", can_channel: str = "can0"):
         self.logger = logging.getLogger(__name__)
         
@@ -427,18 +913,31 @@ class VehicleManager:
         
         # Combined vehicle state
         self.vehicle_parameters = {}
+        
+        # Plain values from the last status refresh (see get_vehicle_values)
+        self.vehicle_values: Dict[str, Any] = {}
+        
+        # Bumped whenever a parameter is written, so cached status can be invalidated
+        self.state_version = 0
+        
+        # Called with a parameter's name when the vehicle reports a new value
+        # for it (a control changed in the car, not one of our own writes)
+        self.change_callbacks: List[Callable[[str], None]] = []
+        self.can.on_change = self._notify_change
     
     async def initialize(self) -> bool:
         """Initialize all vehicle interfaces."""
         self.logger.info("🚗 Initializing Vehicle Manager...")
         
-        # Try to connect to OBD-II
-        self.obd_connected = await self.obd.connect()
+        # Connect OBD-II and CAN bus concurrently; neither depends on the other
+        self.obd_connected, self.can_connected = await asyncio.gather(
+            self.obd.connect(),
+            self.can.connect()
+        )
+        
         if self.obd_connected:
             self.logger.info("✅ OBD-II interface ready")
         
-        # Try to connect to CAN bus
-        self.can_connected = await self.can.connect()
         if self.can_connected:
             self.logger.info("✅ CAN bus interface ready")
         
@@ -449,6 +948,18 @@ class VehicleManager:
             self.logger.error("❌ No vehicle interfaces available")
             return False
     
+    def register_change_callback(self, callback: Callable[[str], None]) -> None:
+        """Register callback(parameter_name) for parameter changes reported by the vehicle."""
+        self.change_callbacks.append(callback)
+    
+    def _notify_change(self, parameter_name: str) -> None:
+        """Tell the registered callbacks that a parameter changed."""
+        for callback in self.change_callbacks:
+            try:
+                callback(parameter_name)
+            except Exception as e:
+                self.logger.error(f"Parameter change callback error: {e}")
+    
     async def get_parameter(self, parameter_name: str) -> Optional[VehicleParameter]:
         """Get parameter from appropriate interface."""
         # Try OBD first for engine parameters
@@ -469,28 +980,43 @@ class VehicleManager:
         """Set parameter via appropriate interface."""
         # Most set operations go through CAN
         if self.can_connected:
-            return await self.can.set_parameter(parameter_name, value)
+            success = await self.can.set_parameter(parameter_name, value)
+            if success:
+                self.state_version += 1
+            return success
         
         self.logger.warning(f"Cannot set parameter {parameter_name}: no writable interface available")
         return False
     
-    async def get_vehicle_status(self) -> Dict[str, VehicleParameter]:
-        """Get comprehensive vehicle status."""
-        status = {}
+    async def get_parameters(self, parameter_names) -> Dict[str, VehicleParameter]:
+        """Get several parameters at once, skipping any that are unavailable."""
+        parameters = {}
         
-        # Common OBD parameters
-        obd_params = [
-            "engine_rpm", "vehicle_speed", "engine_temp", 
-            "throttle_pos", "fuel_level", "intake_temp"
-        ]
+        # All OBD parameters in one call (at most one direct query round)
+        if self.obd_connected:
+            parameters = await self.obd.get_parameters_batch(parameter_names)
         
-        for param in obd_params:
-            value = await self.get_parameter(param)
-            if value:
-                status[param] = value
+        # Anything OBD could not supply falls back to CAN, concurrently
+        missing = [name for name in parameter_names if name not in parameters]
+        if missing and self.can_connected:
+            results = await asyncio.gather(*(self.can.get_parameter(name) for name in missing))
+            for name, param in zip(missing, results):
+                if param:
+                    parameters[name] = param
         
+        return {name: parameters[name] for name in parameter_names if name in parameters}
+    
+    async def get_vehicle_status(self) -> Dict[str, VehicleParameter]:
+        """Get comprehensive vehicle status."""
+        status = await self.get_parameters(self.STATUS_PARAMETERS)
+        self.vehicle_values = {param: value.value for param, value in status.items()}
         return status
     
+    async def get_vehicle_values(self) -> Dict[str, Any]:
+        """Get comprehensive vehicle status as plain {name: value} pairs."""
+        await self.get_vehicle_status()
+        return self.vehicle_values
+    
     async def get_diagnostic_codes(self) -> List[str]:
         """Get diagnostic trouble codes."""
         if self.obd_connected:
@@ -6,8 +6,10 @@ Local AI assistant for classic cars with voice control and vehicle integration.
 
 import asyncio
 import logging
+import queue
 import signal
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
@@ -15,28 +17,52 @@ from controllers.system_controller import SystemController
 from config.settings import Settings
 from safety.monitor import SafetyMonitor
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Seconds between safety monitor health checks
+HEALTH_CHECK_INTERVAL = 5.0
+
 
 class AutomotiveLLMSystem:
     """Main system coordinator for the Automotive LLM Assistant."""
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, debug: bool = False):
         self.settings = Settings(config_path)
+        self.debug = debug
+        self.log_listener: Optional[QueueListener] = None
         self.logger = self._setup_logging()
         self.system_controller: Optional[SystemController] = None
         self.safety_monitor: Optional[SafetyMonitor] = None
         self.running = False
+        self._shutdown_event = asyncio.Event()
+        self._health_handle: Optional[asyncio.TimerHandle] = None
+        self._health_task: Optional[asyncio.Task] = None
         
     def _setup_logging(self) -> logging.Logger:
         """Configure system logging."""
-        log_level = getattr(logging, self.settings.log_level.upper())
+        log_level = logging.DEBUG if self.debug else getattr(logging, self.settings.log_level.upper())
+        
+        # Log calls only enqueue the formatted record; file and console
+        # writes happen on the listener's thread, off the event loop
+        log_queue = queue.Queue(-1)
+        self.log_listener = QueueListener(
+            log_queue,
+            logging.FileHandler(self.settings.log_file),
+            logging.StreamHandler(sys.stdout)
+        )
+        self.log_listener.start()
         
         logging.basicConfig(
             level=log_level,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.settings.log_file),
-                logging.StreamHandler(sys.stdout)
-            ]
+            handlers=[QueueHandler(log_queue)],
+            # Import-time logging.warning calls for missing optional
+            # dependencies already installed a default stderr handler
+            force=True
         )
         
         return logging.getLogger(__name__)
@@ -80,35 +106,61 @@ class AutomotiveLLMSystem:
         
         try:
             # Setup signal handlers for graceful shutdown
+            loop = asyncio.get_running_loop()
             for sig in [signal.SIGINT, signal.SIGTERM]:
-                signal.signal(sig, self._signal_handler)
+                loop.add_signal_handler(sig, self._signal_handler, sig)
             
             # Start main system loop
             await self.system_controller.start()
             
-            # Keep running until shutdown signal
-            while self.running:
-                await asyncio.sleep(1.0)
-                
-                # Periodic health checks
-                if not await self.safety_monitor.health_check():
-                    self.logger.warning("⚠️ Safety monitor health check failed")
-                    await self._emergency_shutdown()
-                    break
+            # Sleep until a shutdown signal; health checks run on their own timer
+            self._schedule_health_check()
+            await self._shutdown_event.wait()
                     
         except Exception as e:
             self.logger.error(f"💥 Runtime error: {e}")
             await self._emergency_shutdown()
+        
+        finally:
+            if self._health_handle:
+                self._health_handle.cancel()
+    
+    def _schedule_health_check(self) -> None:
+        """Arm the timer for the next health check."""
+        self._health_handle = asyncio.get_running_loop().call_later(
+            HEALTH_CHECK_INTERVAL, self._health_tick
+        )
+    
+    def _health_tick(self) -> None:
+        """Timer callback: run a health check in the background."""
+        self._health_task = asyncio.create_task(self._run_health_check())
+    
+    async def _run_health_check(self) -> None:
+        """Check safety monitor health, re-arming the timer while healthy."""
+        try:
+            healthy = await self.safety_monitor.health_check()
+        except Exception as e:
+            self.logger.error(f"💥 Runtime error: {e}")
+            healthy = False
+        
+        if not healthy:
+            self.logger.warning("⚠️ Safety monitor health check failed")
+            await self._emergency_shutdown()
+            self._shutdown_event.set()
+        elif self.running:
+            self._schedule_health_check()
     
-    def _signal_handler(self, signum, frame):
+    def _signal_handler(self, signum):
         """Handle shutdown signals gracefully."""
         self.logger.info(f"📡 Received signal {signum}, initiating graceful shutdown...")
         self.running = False
+        self._shutdown_event.set()
     
     async def shutdown(self) -> None:
         """Graceful system shutdown."""
         self.logger.info("🛑 Shutting down Automotive LLM System...")
         self.running = False
+        self._shutdown_event.set()
         
         if self.system_controller:
             await self.system_controller.shutdown()
@@ -147,12 +199,12 @@ def main():
     
     args = parser.parse_args()
     
-    # Override log level if debug flag is set
-    if args.debug:
-        logging.getLogger().setLevel(logging.DEBUG)
+    # Faster event loop for all the asyncio coordination, when installed
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     
     # Create and run the system
-    system = AutomotiveLLMSystem(config_path=args.config)
+    system = AutomotiveLLMSystem(config_path=args.config, debug=args.debug)
     
     try:
         asyncio.run(system.start())
@@ -161,6 +213,10 @@ def main():
     except Exception as e:
         print(f"💥 Fatal error: {e}")
         sys.exit(1)
+    finally:
+        # Flush any queued log records
+        if system.log_listener:
+            system.log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -4,10 +4,15 @@ Safety Monitor - System safety validation and monitoring
 
 import asyncio
 import logging
+import sys
 import time
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Callable, Any
+from types import MappingProxyType
+from typing import Deque, Dict, List, Mapping, Optional, Callable, Any, Tuple
+
+import numpy as np
 
 from interfaces.vehicle import VehicleManager, VehicleParameter
 
@@ -21,6 +26,35 @@ class SafetyLevel(Enum):
     EMERGENCY = "emergency"
 
 
+# Most recent violations kept in the history ring buffer
+VIOLATION_HISTORY_SIZE = 1000
+
+# Monitoring backs off to the idle interval after this many ticks with every
+# value outside the near-limit band (a fraction of each limit's magnitude)
+MONITOR_IDLE_INTERVAL = 5.0
+MONITOR_QUIET_TICKS = 5
+MONITOR_NEAR_LIMIT_BAND = 0.1
+
+# Emergency callbacks allowed to run at the same time
+EMERGENCY_CALLBACK_CONCURRENCY = 8
+
+# Engine tuning parameters that may not be changed at highway speed
+_SPEED_RESTRICTED_PARAMS = frozenset({"boost_pressure", "fuel_trim", "ignition_timing"})
+
+# Vehicle state keys that may carry the vehicle speed, in lookup order
+_SPEED_KEYS = ("vehicle_speed", "speed", "mph", "kph")
+
+# Violation levels that block commands on the affected parameter
+_BLOCKING_LEVELS = frozenset({SafetyLevel.CRITICAL, SafetyLevel.EMERGENCY})
+
+# Severity order of the safety levels, so the worst one can be found with max()
+_LEVELS_BY_RANK = tuple(SafetyLevel)
+_LEVEL_RANK = {level: rank for rank, level in enumerate(_LEVELS_BY_RANK)}
+
+# Reported string for each safety level, looked up instead of going through .value
+_LEVEL_STR = {level: level.value for level in SafetyLevel}
+
+
 class SafetyViolationType(Enum):
     """Types of safety violations."""
     TEMPERATURE_LIMIT = "temperature_limit"
@@ -34,7 +68,7 @@ class SafetyViolationType(Enum):
     SYSTEM_INTEGRITY = "system_integrity"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SafetyRule:
     """Defines a safety rule with limits and actions."""
     name: str
@@ -45,6 +79,10 @@ class SafetyRule:
     violation_type: SafetyViolationType
     action_required: bool
     description: str
+    
+    def __post_init__(self):
+        # Rules loaded from config carry fresh strings; intern the parameter key
+        object.__setattr__(self, "parameter", sys.intern(self.parameter))
 
 
 @dataclass
@@ -56,7 +94,7 @@ class SafetyViolation:
     limit_value: float
     safety_level: SafetyLevel
     violation_type: SafetyViolationType
-    timestamp: float
+    timestamp: int  # time.monotonic_ns() when detected, not wall-clock time
     description: str
     action_taken: Optional[str] = None
 
@@ -71,6 +109,48 @@ class CommandValidationResult:
     blocked_reason: Optional[str] = None
 
 
+def _validate_boost_pressure(value: float, warnings: List[str],
+                             confirmations: List[str]) -> Tuple[Optional[SafetyLevel], Optional[str]]:
+    """Boost pressure: confirm above 15 PSI, block above 20 PSI."""
+    if value > 20.0:
+        return None, "Boost pressure exceeds maximum safe limit"
+    if value > 15.0:
+        warnings.append(f"Boost pressure {value} PSI is high - ensure engine can handle it")
+        confirmations.append("Confirm boost pressure increase is safe for your engine")
+        return SafetyLevel.CAUTION, None
+    return None, None
+
+
+def _validate_hvac_temp_set(value: float, warnings: List[str],
+                            confirmations: List[str]) -> Tuple[Optional[SafetyLevel], Optional[str]]:
+    """Cabin temperature: warn outside 15-35 °C."""
+    if value > 35.0:
+        warnings.append("High cabin temperature may cause discomfort")
+        return SafetyLevel.CAUTION, None
+    if value < 15.0:
+        warnings.append("Low cabin temperature may cause discomfort")
+        return SafetyLevel.CAUTION, None
+    return None, None
+
+
+def _validate_engine_rpm(value: float, warnings: List[str],
+                         confirmations: List[str]) -> Tuple[Optional[SafetyLevel], Optional[str]]:
+    """Engine RPM: confirm above 6000."""
+    if value > 6000:
+        warnings.append("High RPM operation can cause engine damage")
+        confirmations.append("Confirm high RPM operation is safe")
+        return SafetyLevel.WARNING, None
+    return None, None
+
+
+# Numeric command validators by parameter; each returns (new level, blocked reason)
+_PARAMETER_VALIDATORS = {
+    "boost_pressure": _validate_boost_pressure,
+    "hvac_temp_set": _validate_hvac_temp_set,
+    "engine_rpm": _validate_engine_rpm,
+}
+
+
 class SafetyMonitor:
     """Central safety monitoring and validation system."""
     
@@ -82,19 +162,26 @@ class SafetyMonitor:
         # Safety state
         self.current_safety_level = SafetyLevel.SAFE
         self.active_violations: List[SafetyViolation] = []
-        self.violation_history: List[SafetyViolation] = []
+        self._active_by_param: Dict[str, List[SafetyViolation]] = {}
+        self._fired_rank = 0  # severity rank of the worst rule that fired last tick
+        self._recent_violations: Optional[Tuple[Dict[str, Any], ...]] = None  # status entries, rebuilt when stale
+        self.violation_history: Deque[SafetyViolation] = deque(maxlen=VIOLATION_HISTORY_SIZE)
         
         # Emergency state
         self.emergency_mode = False
         self.emergency_callbacks: List[Callable] = []
+        self.level_callbacks: List[Callable[[SafetyLevel], None]] = []
+        self._callback_slots = asyncio.Semaphore(EMERGENCY_CALLBACK_CONCURRENCY)
         
         # Monitoring control
         self.monitoring_active = False
         self.monitoring_task: Optional[asyncio.Task] = None
         self.monitoring_interval = 1.0  # seconds
+        self._quiet_ticks = 0
         
         # Safety rules
         self.safety_rules = self._initialize_safety_rules()
+        self._build_rule_arrays()
         
         # Statistics
         self.stats = {
@@ -103,6 +190,7 @@ class SafetyMonitor:
             "commands_blocked": 0,
             "emergency_activations": 0
         }
+        self._stats_view = MappingProxyType(self.stats)
     
     def _initialize_safety_rules(self) -> List[SafetyRule]:
         """Initialize safety rules for vehicle systems."""
@@ -196,6 +284,35 @@ class SafetyMonitor:
             )
         ]
     
+    def _build_rule_arrays(self) -> None:
+        """Lay the rule limits out as arrays so every rule is checked in one pass."""
+        rules = self.safety_rules
+        self._rule_params = np.array([r.parameter for r in rules], dtype=object)
+        self._rule_min = np.array(
+            [-np.inf if r.min_value is None else r.min_value for r in rules], dtype=np.float64
+        )
+        self._rule_max = np.array(
+            [np.inf if r.max_value is None else r.max_value for r in rules], dtype=np.float64
+        )
+        self._rule_rank = np.array([_LEVEL_RANK[r.safety_level] for r in rules], dtype=np.int8)
+        self._rule_parameter_names = tuple(dict.fromkeys(r.parameter for r in rules))
+        # Rules whose parameter has been read at least once; a rule for a
+        # parameter the vehicle never reports doesn't count as missing data
+        self._rule_reported = np.zeros(len(rules), dtype=bool)
+        
+        # Edges of the near-limit band; unbounded sides stay at infinity
+        with np.errstate(invalid="ignore"):
+            self._rule_near_min = np.where(
+                np.isfinite(self._rule_min),
+                self._rule_min + np.abs(self._rule_min) * MONITOR_NEAR_LIMIT_BAND,
+                -np.inf
+            )
+            self._rule_near_max = np.where(
+                np.isfinite(self._rule_max),
+                self._rule_max - np.abs(self._rule_max) * MONITOR_NEAR_LIMIT_BAND,
+                np.inf
+            )
+    
     async def initialize(self) -> bool:
         """Initialize safety monitoring system."""
         try:
@@ -203,6 +320,7 @@ class SafetyMonitor:
             
             # Load custom safety rules from config if available
             await self._load_custom_safety_rules()
+            self._build_rule_arrays()
             
             # Start monitoring if vehicle manager is available
             if self.vehicle_manager:
@@ -257,80 +375,116 @@ class SafetyMonitor:
                 if self.current_safety_level == SafetyLevel.EMERGENCY:
                     await self._handle_emergency()
                 
-                await asyncio.sleep(self.monitoring_interval)
+                await asyncio.sleep(self._next_interval())
                 
             except Exception as e:
                 self.logger.error(f"Safety monitoring error: {e}")
                 await asyncio.sleep(self.monitoring_interval)
     
+    def _next_interval(self) -> float:
+        """Sleep before the next tick; longer once readings have stayed clear of every limit."""
+        if self._quiet_ticks >= MONITOR_QUIET_TICKS and not self.emergency_mode:
+            return max(self.monitoring_interval, MONITOR_IDLE_INTERVAL)
+        return self.monitoring_interval
+    
     async def _check_safety_rules(self) -> None:
         """Check all safety rules against current vehicle state."""
         if not self.vehicle_manager:
             return
         
-        current_violations = []
+        # One snapshot of every distinct parameter; several rules can share one
+        try:
+            params = await self.vehicle_manager.get_parameters(self._rule_parameter_names)
+        except Exception as e:
+            self.logger.error(f"Error reading safety parameters: {e}")
+            params = {}
+        
+        # Missing or unreadable values are NaN, which never compares true
+        values = np.fromiter(
+            (self._parameter_value(params.get(name)) for name in self._rule_params),
+            dtype=np.float64,
+            count=len(self._rule_params)
+        )
+        too_high = values > self._rule_max
+        too_low = values < self._rule_min
+        fired = too_high | too_low
+        
+        # A reported parameter dropping out (a failed read, or OBD/CAN going
+        # away) or any value close to a limit keeps the monitor at full rate
+        missing = np.isnan(values)
+        dropped = missing & self._rule_reported
+        self._rule_reported |= ~missing
+        near = (values > self._rule_near_max) | (values < self._rule_near_min)
+        if near.any() or dropped.any():
+            self._quiet_ticks = 0
+        else:
+            self._quiet_ticks += 1
         
-        for rule in self.safety_rules:
+        # Overall level comes straight from the fired rules' severity column
+        self._fired_rank = int(self._rule_rank[fired].max(initial=0))
+        
+        # Steady state: nothing fired, so there is nothing to build or record
+        if not fired.any():
+            if self.active_violations:
+                self.active_violations = []
+                self._active_by_param = {}
+                self._recent_violations = None
+            return
+        
+        # Violation objects are only built for the rules that fired
+        current_violations = []
+        detected_at = time.monotonic_ns()
+        for index in np.flatnonzero(fired):
+            rule = self.safety_rules[index]
             try:
-                # Get current parameter value
-                param = await self.vehicle_manager.get_parameter(rule.parameter)
-                if not param:
-                    continue
+                violation = self._build_violation(
+                    rule, float(values[index]), bool(too_high[index]), detected_at
+                )
+                current_violations.append(violation)
+                
+                # Log violation
+                self.logger.warning(f"⚠️ Safety violation: {violation.description}")
                 
-                violation = self._check_rule_violation(rule, param)
-                if violation:
-                    current_violations.append(violation)
-                    self.stats["violations_detected"] += 1
-                    
-                    # Log violation
-                    self.logger.warning(f"⚠️ Safety violation: {violation.description}")
-                    
-                    # Take action if required
-                    if rule.action_required:
-                        await self._take_safety_action(violation)
+                # Take action if required
+                if rule.action_required:
+                    await self._take_safety_action(violation)
             
             except Exception as e:
                 self.logger.error(f"Error checking safety rule {rule.name}: {e}")
         
-        # Update active violations
+        # Update active violations, also indexed by parameter for validate_command
+        self.stats["violations_detected"] += len(current_violations)
         self.active_violations = current_violations
+        self._active_by_param = {}
+        self._recent_violations = None
+        for violation in current_violations:
+            self._active_by_param.setdefault(violation.parameter, []).append(violation)
         self.violation_history.extend(current_violations)
-        
-        # Keep violation history manageable
-        if len(self.violation_history) > 1000:
-            self.violation_history = self.violation_history[-500:]
     
-    def _check_rule_violation(self, rule: SafetyRule, param: VehicleParameter) -> Optional[SafetyViolation]:
-        """Check if a parameter violates a safety rule."""
-        value = float(param.value)
-        
-        # Check maximum limit
-        if rule.max_value is not None and value > rule.max_value:
-            return SafetyViolation(
-                rule_name=rule.name,
-                parameter=rule.parameter,
-                current_value=value,
-                limit_value=rule.max_value,
-                safety_level=rule.safety_level,
-                violation_type=rule.violation_type,
-                timestamp=time.time(),
-                description=f"{rule.description}: {value} > {rule.max_value}"
-            )
-        
-        # Check minimum limit
-        if rule.min_value is not None and value < rule.min_value:
-            return SafetyViolation(
-                rule_name=rule.name,
-                parameter=rule.parameter,
-                current_value=value,
-                limit_value=rule.min_value,
-                safety_level=rule.safety_level,
-                violation_type=rule.violation_type,
-                timestamp=time.time(),
-                description=f"{rule.description}: {value} < {rule.min_value}"
-            )
-        
-        return None
+    def _parameter_value(self, param: Optional[VehicleParameter]) -> float:
+        """Numeric value of a parameter for the rule scan; NaN if missing or non-numeric."""
+        if param is None:
+            return np.nan
+        try:
+            return float(param.value)
+        except (TypeError, ValueError):
+            self.logger.error(f"Non-numeric value for safety parameter {param.name}: {param.value!r}")
+            return np.nan
+    
+    def _build_violation(self, rule: SafetyRule, value: float, too_high: bool,
+                         timestamp: int) -> SafetyViolation:
+        """Create the violation record for a rule that fired."""
+        limit = rule.max_value if too_high else rule.min_value
+        return SafetyViolation(
+            rule_name=rule.name,
+            parameter=rule.parameter,
+            current_value=value,
+            limit_value=limit,
+            safety_level=rule.safety_level,
+            violation_type=rule.violation_type,
+            timestamp=timestamp,
+            description=f"{rule.description}: {value} {'>' if too_high else '<'} {limit}"
+        )
     
     async def _take_safety_action(self, violation: SafetyViolation) -> None:
         """Take appropriate action for a safety violation."""
@@ -360,25 +514,26 @@ class SafetyMonitor:
     def _update_safety_level(self) -> None:
         """Update overall system safety level based on active violations."""
         if not self.active_violations:
-            self.current_safety_level = SafetyLevel.SAFE
+            self._set_safety_level(SafetyLevel.SAFE)
             return
         
-        # Find highest severity violation
-        max_level = SafetyLevel.SAFE
-        for violation in self.active_violations:
-            if violation.safety_level.value == "emergency":
-                max_level = SafetyLevel.EMERGENCY
-                break
-            elif violation.safety_level.value == "critical" and max_level.value != "emergency":
-                max_level = SafetyLevel.CRITICAL
-            elif violation.safety_level.value == "warning" and max_level.value not in ["emergency", "critical"]:
-                max_level = SafetyLevel.WARNING
-            elif violation.safety_level.value == "caution" and max_level.value == "safe":
-                max_level = SafetyLevel.CAUTION
+        # Highest severity among the rules that fired, reduced during the rule scan
+        max_level = _LEVELS_BY_RANK[self._fired_rank]
         
         if max_level != self.current_safety_level:
-            self.logger.info(f"🔄 Safety level changed: {self.current_safety_level.value} -> {max_level.value}")
-            self.current_safety_level = max_level
+            self.logger.info(f"🔄 Safety level changed: {_LEVEL_STR[self.current_safety_level]} -> {_LEVEL_STR[max_level]}")
+            self._set_safety_level(max_level)
+    
+    def _set_safety_level(self, level: SafetyLevel) -> None:
+        """Change the overall safety level, telling the level callbacks when it changes."""
+        if level == self.current_safety_level:
+            return
+        self.current_safety_level = level
+        for callback in self.level_callbacks:
+            try:
+                callback(level)
+            except Exception as e:
+                self.logger.error(f"Safety level callback error: {e}")
     
     async def _handle_emergency(self) -> None:
         """Handle emergency safety conditions."""
@@ -387,12 +542,16 @@ class SafetyMonitor:
             self.stats["emergency_activations"] += 1
             self.logger.critical("🚨 EMERGENCY MODE ACTIVATED")
             
-            # Notify all emergency callbacks
-            for callback in self.emergency_callbacks:
-                try:
-                    await callback()
-                except Exception as e:
-                    self.logger.error(f"Emergency callback error: {e}")
+            # Notify all emergency callbacks concurrently; a slow one doesn't hold up the rest
+            await asyncio.gather(*(self._run_emergency_callback(cb) for cb in self.emergency_callbacks))
+    
+    async def _run_emergency_callback(self, callback: Callable) -> None:
+        """Run one emergency callback within the concurrency limit."""
+        async with self._callback_slots:
+            try:
+                await callback()
+            except Exception as e:
+                self.logger.error(f"Emergency callback error: {e}")
     
     async def validate_command(self, 
                               intent_type: str, 
@@ -409,13 +568,8 @@ class SafetyMonitor:
         try:
             # Check if in emergency mode
             if self.emergency_mode:
-                self.stats["commands_blocked"] += 1
-                return CommandValidationResult(
-                    allowed=False,
-                    safety_level=SafetyLevel.EMERGENCY,
-                    warnings=[],
-                    required_confirmations=[],
-                    blocked_reason="System in emergency mode - only emergency commands allowed"
+                return self._blocked(
+                    SafetyLevel.EMERGENCY, "System in emergency mode - only emergency commands allowed"
                 )
             
             # Vehicle speed restrictions
@@ -426,63 +580,27 @@ class SafetyMonitor:
                     confirmations.append("Confirm you want to modify engine parameters while driving")
                     safety_level = SafetyLevel.WARNING
                 
-                if parameter in ["boost_pressure", "fuel_trim", "ignition_timing"]:
+                if parameter in _SPEED_RESTRICTED_PARAMS:
                     if vehicle_speed > 50.0:
-                        self.stats["commands_blocked"] += 1
-                        return CommandValidationResult(
-                            allowed=False,
-                            safety_level=SafetyLevel.CRITICAL,
-                            warnings=[],
-                            required_confirmations=[],
-                            blocked_reason="Engine tuning not allowed at highway speeds"
-                        )
+                        return self._blocked(SafetyLevel.CRITICAL, "Engine tuning not allowed at highway speeds")
             
             # Parameter-specific validations
-            if parameter == "boost_pressure":
-                if isinstance(value, (int, float)) and value > 15.0:
-                    warnings.append(f"Boost pressure {value} PSI is high - ensure engine can handle it")
-                    confirmations.append("Confirm boost pressure increase is safe for your engine")
-                    safety_level = SafetyLevel.CAUTION
-                    
-                if isinstance(value, (int, float)) and value > 20.0:
-                    self.stats["commands_blocked"] += 1
-                    return CommandValidationResult(
-                        allowed=False,
-                        safety_level=SafetyLevel.CRITICAL,
-                        warnings=[],
-                        required_confirmations=[],
-                        blocked_reason="Boost pressure exceeds maximum safe limit"
-                    )
-            
-            elif parameter == "hvac_temp_set":
-                if isinstance(value, (int, float)):
-                    if value > 35.0:
-                        warnings.append("High cabin temperature may cause discomfort")
-                        safety_level = SafetyLevel.CAUTION
-                    elif value < 15.0:
-                        warnings.append("Low cabin temperature may cause discomfort")
-                        safety_level = SafetyLevel.CAUTION
-            
-            elif parameter == "engine_rpm":
-                if isinstance(value, (int, float)) and value > 6000:
-                    warnings.append("High RPM operation can cause engine damage")
-                    confirmations.append("Confirm high RPM operation is safe")
-                    safety_level = SafetyLevel.WARNING
+            validator = _PARAMETER_VALIDATORS.get(parameter)
+            if validator and isinstance(value, (int, float)):
+                level, blocked_reason = validator(value, warnings, confirmations)
+                if blocked_reason:
+                    return self._blocked(SafetyLevel.CRITICAL, blocked_reason)
+                if level:
+                    safety_level = level
             
             # Check against active safety violations
-            for violation in self.active_violations:
-                if violation.parameter == parameter:
-                    if violation.safety_level in [SafetyLevel.CRITICAL, SafetyLevel.EMERGENCY]:
-                        self.stats["commands_blocked"] += 1
-                        return CommandValidationResult(
-                            allowed=False,
-                            safety_level=violation.safety_level,
-                            warnings=[],
-                            required_confirmations=[],
-                            blocked_reason=f"Parameter {parameter} has active safety violation"
-                        )
-                    else:
-                        warnings.append(f"Active safety concern with {parameter}: {violation.description}")
+            for violation in self._active_by_param.get(parameter, ()):
+                if violation.safety_level in _BLOCKING_LEVELS:
+                    return self._blocked(
+                        violation.safety_level, f"Parameter {parameter} has active safety violation"
+                    )
+                else:
+                    warnings.append(f"Active safety concern with {parameter}: {violation.description}")
             
             return CommandValidationResult(
                 allowed=True,
@@ -493,14 +611,18 @@ class SafetyMonitor:
             
         except Exception as e:
             self.logger.error(f"Command validation error: {e}")
-            self.stats["commands_blocked"] += 1
-            return CommandValidationResult(
-                allowed=False,
-                safety_level=SafetyLevel.CRITICAL,
-                warnings=[],
-                required_confirmations=[],
-                blocked_reason="Safety validation system error"
-            )
+            return self._blocked(SafetyLevel.CRITICAL, "Safety validation system error")
+    
+    def _blocked(self, safety_level: SafetyLevel, reason: str) -> CommandValidationResult:
+        """Count a blocked command and build its validation result."""
+        self.stats["commands_blocked"] += 1
+        return CommandValidationResult(
+            allowed=False,
+            safety_level=safety_level,
+            warnings=[],
+            required_confirmations=[],
+            blocked_reason=reason
+        )
     
     def _get_vehicle_speed(self, vehicle_state: Optional[Dict[str, Any]]) -> Optional[float]:
         """Extract vehicle speed from state data."""
@@ -508,8 +630,7 @@ class SafetyMonitor:
             return None
         
         # Try different possible keys for vehicle speed
-        speed_keys = ["vehicle_speed", "speed", "mph", "kph"]
-        for key in speed_keys:
+        for key in _SPEED_KEYS:
             if key in vehicle_state:
                 return float(vehicle_state[key])
         
@@ -520,7 +641,7 @@ class SafetyMonitor:
         self.logger.critical("🚨 EXECUTING EMERGENCY SAFETY PROTOCOL")
         
         self.emergency_mode = True
-        self.current_safety_level = SafetyLevel.EMERGENCY
+        self._set_safety_level(SafetyLevel.EMERGENCY)
         
         # Emergency actions would include:
         # - Disable all performance modifications
@@ -532,7 +653,7 @@ class SafetyMonitor:
             "timestamp": time.time(),
             "reason": "Emergency protocol activated",
             "active_violations": len(self.active_violations),
-            "safety_level": self.current_safety_level.value
+            "safety_level": _LEVEL_STR[self.current_safety_level]
         }
         
         self.logger.critical(f"Emergency action logged: {emergency_action}")
@@ -541,26 +662,37 @@ class SafetyMonitor:
         """Register callback for emergency conditions."""
         self.emergency_callbacks.append(callback)
     
+    def register_level_callback(self, callback: Callable[[SafetyLevel], None]) -> None:
+        """Register callback(level) for changes of the overall safety level."""
+        self.level_callbacks.append(callback)
+    
     def get_safety_status(self) -> Dict[str, Any]:
         """Get current safety system status."""
         return {
-            "safety_level": self.current_safety_level.value,
+            "safety_level": _LEVEL_STR[self.current_safety_level],
             "emergency_mode": self.emergency_mode,
             "active_violations": len(self.active_violations),
             "monitoring_active": self.monitoring_active,
-            "recent_violations": [
+            # Copied, so callers can't change the cached entries
+            "recent_violations": [dict(entry) for entry in self._recent_violation_view()],
+            "stats": self.stats.copy()
+        }
+    
+    def _recent_violation_view(self) -> Tuple[Dict[str, Any], ...]:
+        """Status entries for the active violations, rebuilt only after they change."""
+        if self._recent_violations is None:
+            self._recent_violations = tuple(
                 {
                     "rule": v.rule_name,
                     "parameter": v.parameter,
                     "current_value": v.current_value,
                     "limit_value": v.limit_value,
-                    "level": v.safety_level.value,
+                    "level": _LEVEL_STR[v.safety_level],
                     "description": v.description
                 }
                 for v in self.active_violations
-            ],
-            "stats": self.stats.copy()
-        }
+            )
+        return self._recent_violations
     
     async def health_check(self) -> bool:
         """Perform safety system health check."""
@@ -573,7 +705,7 @@ class SafetyMonitor:
             # Check for critical violations
             critical_violations = [
                 v for v in self.active_violations 
-                if v.safety_level in [SafetyLevel.CRITICAL, SafetyLevel.EMERGENCY]
+                if v.safety_level in _BLOCKING_LEVELS
             ]
             
             if critical_violations:
@@ -585,9 +717,13 @@ class SafetyMonitor:
             self.logger.error(f"Safety health check failed: {e}")
             return False
     
-    def get_stats(self) -> Dict[str, Any]:
-        """Get safety monitoring statistics."""
-        return self.stats.copy()
+    def get_stats(self) -> Mapping[str, Any]:
+        """Get safety monitoring statistics as a read-only live view.
+        
+        The view keeps changing as the monitor runs; take dict(...) of it for
+        a snapshot, or to serialize it.
+        """
+        return self._stats_view
     
     async def shutdown(self) -> None:
         """Shutdown safety monitoring system."""
@@ -3,13 +3,19 @@ Voice Manager - Handles wake word detection, STT, TTS, and voice pipeline
 """
 
 import asyncio
+import ctypes
 import logging
+import math
+import multiprocessing
+import os
 import numpy as np
 import pyaudio
 import queue
 import threading
 import time
-from typing import Optional, Callable, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Awaitable, Callable, Dict, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -20,20 +26,120 @@ except ImportError:
     PORCUPINE_AVAILABLE = False
     logging.warning("Porcupine not available - using mock wake word detection")
 
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+try:
+    from pywhispercpp.model import Model as WhisperCppModel
+    WHISPERCPP_AVAILABLE = True
+except ImportError:
+    WHISPERCPP_AVAILABLE = False
+
 try:
     import whisper
     WHISPER_AVAILABLE = True
 except ImportError:
     WHISPER_AVAILABLE = False
-    logging.warning("Whisper not available - using mock STT")
+    if not (FASTER_WHISPER_AVAILABLE or WHISPERCPP_AVAILABLE):
+        logging.warning("Whisper not available - using mock STT")
 
 try:
-    import piper
+    import webrtcvad
+    WEBRTCVAD_AVAILABLE = True
+except ImportError:
+    WEBRTCVAD_AVAILABLE = False
+
+try:
+    from piper import PiperVoice
     PIPER_AVAILABLE = True
 except ImportError:
     PIPER_AVAILABLE = False
     logging.warning("Piper not available - using mock TTS")
 
+try:
+    import onnxruntime
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+try:
+    import sounddevice
+    SOUNDDEVICE_AVAILABLE = True
+except (ImportError, OSError):  # OSError when the PortAudio library is missing
+    SOUNDDEVICE_AVAILABLE = False
+
+
+# STT backends by name, in the order tried when none is selected
+STT_BACKENDS = {
+    "faster_whisper": FASTER_WHISPER_AVAILABLE,
+    "whispercpp": WHISPERCPP_AVAILABLE,
+    "whisper": WHISPER_AVAILABLE,
+}
+
+# Environment variable that pins the STT backend
+STT_BACKEND_ENV = "AUTOMOTIVE_LLM_STT_BACKEND"
+
+# Lowest transcription confidence accepted as a command, per STT backend.
+# faster-whisper reports exp(mean avg_logprob), so its cutoff is Whisper's
+# own avg_logprob > -1.0; the others report fixed or no-speech based scores.
+STT_MIN_CONFIDENCE = {"faster_whisper": math.exp(-1.0)}
+DEFAULT_STT_MIN_CONFIDENCE = 0.7
+
+# whisper.cpp runs the GGML Q5_1 build of the configured model with this many threads
+WHISPERCPP_MODEL_SUFFIX = "-q5_1"
+WHISPERCPP_THREADS = 4
+
+
+# Seconds of audio held in the capture ring: the pre-roll, a full command and
+# some backlog, so chunks can be used in place instead of copied out
+AUDIO_RING_SECONDS = 16.0
+
+# STT worker processes start from a fresh interpreter; forking a process that
+# already runs audio, OBD and logging threads can deadlock the child
+STT_WORKER_START_METHOD = "spawn"
+
+# Piper voices, as <voice>.onnx with its <voice>.onnx.json config
+PIPER_VOICE_DIR = "models/piper"
+
+# INT8 (dynamically quantized) copy of a voice, built at install time next
+# to the original (see the installation guide) and used when present
+PIPER_INT8_SUFFIX = ".int8.onnx"
+
+# Seconds streamed speech may run past its own length before playback is
+# given up on as stalled
+TTS_PLAYBACK_GRACE = 2.0
+
+# Synthesized replies kept (by text) for when they are spoken again
+TTS_CACHE_SIZE = 64
+
+# Replies the voice pipeline speaks itself, synthesized once at startup
+VOICE_REPLIES = {
+    "not_understood": "Sorry, I didn't understand that command.",
+    "error": "Sorry, there was an error processing your command.",
+}
+
+# Audio kept from before the wake word so the command starts at its onset
+PRE_ROLL_SECONDS = 1.0
+
+# Command capture ends after this much trailing silence, if nothing is said
+# within COMMAND_START_TIMEOUT, or at COMMAND_MAX_SECONDS regardless
+END_OF_SPEECH_SILENCE = 0.6
+COMMAND_START_TIMEOUT = 3.0
+COMMAND_MAX_SECONDS = 10.0
+
+# webrtcvad aggressiveness (0-3) and frame length; RMS level used when it isn't installed
+VAD_AGGRESSIVENESS = 2
+VAD_FRAME_MS = 30
+VAD_RMS_THRESHOLD = 500.0
+
+# Post-wake audio quieter than this RMS, or with fewer sign changes per sample
+# than this (engine hum, wind), is not sent to speech-to-text
+SPEECH_RMS_THRESHOLD = 200.0
+SPEECH_ZCR_THRESHOLD = 0.01
+
 
 class VoiceState(Enum):
     """Voice system states."""
@@ -67,19 +173,30 @@ class AudioConfig:
 class WakeWordDetector:
     """Wake word detection using Porcupine or mock implementation."""
     
+    # Idle Porcupine engines kept for the next detector with the same
+    # configuration: (keywords, sensitivity) -> engine. An engine keeps state
+    # across frames, so each one is owned by a single detector (and so a
+    # single audio stream) at a time; it is never fed two streams at once.
+    _engines: Dict[Tuple[Tuple[str, ...], float], Any] = {}
+    _engines_lock = threading.Lock()
+    
     def __init__(self, keywords: list, sensitivity: float = 0.7):
         self.keywords = keywords
         self.sensitivity = sensitivity
         self.logger = logging.getLogger(__name__)
+        self._engine_key = None
         
         if PORCUPINE_AVAILABLE:
             try:
-                self.porcupine = pvporcupine.create(
-                    keywords=keywords,
-                    sensitivities=[sensitivity] * len(keywords)
-                )
+                self.porcupine = self._acquire_engine(tuple(keywords), sensitivity)
+                self._engine_key = (tuple(keywords), sensitivity)
                 self.frame_length = self.porcupine.frame_length
                 self.sample_rate = self.porcupine.sample_rate
+                
+                # Reused frame buffer; audio chunks are copied in and cut to frame_length
+                self._frame = (ctypes.c_int16 * self.frame_length)()
+                self._frame_addr = ctypes.addressof(self._frame)
+                self._frame_fill = 0
                 self.mock_mode = False
                 self.logger.info(f"✅ Porcupine initialized with keywords: {keywords}")
             except Exception as e:
@@ -88,6 +205,27 @@ class WakeWordDetector:
         else:
             self._init_mock_mode()
     
+    @classmethod
+    def _acquire_engine(cls, keywords: Tuple[str, ...], sensitivity: float):
+        """Take the idle Porcupine engine for this configuration, or create one."""
+        with cls._engines_lock:
+            engine = cls._engines.pop((keywords, sensitivity), None)
+        if engine is None:
+            engine = pvporcupine.create(
+                keywords=list(keywords),
+                sensitivities=[sensitivity] * len(keywords)
+            )
+        return engine
+    
+    @classmethod
+    def _release_engine(cls, key: Tuple[Tuple[str, ...], float], engine) -> None:
+        """Keep an engine for reuse, unless one with its configuration is already idle."""
+        with cls._engines_lock:
+            if key not in cls._engines:
+                cls._engines[key] = engine
+                return
+        engine.delete()
+    
     def _init_mock_mode(self):
         """Initialize mock wake word detection for development."""
         self.mock_mode = True
@@ -97,7 +235,7 @@ class WakeWordDetector:
         self.logger.warning("🔧 Using mock wake word detection")
     
     def process_audio(self, audio_frame: np.ndarray) -> Optional[str]:
-        """Process audio frame and return detected wake word if any."""
+        """Process an int16 audio chunk and return detected wake word if any."""
         if self.mock_mode:
             # Mock detection every 5 seconds for testing
             self.mock_counter += 1
@@ -105,40 +243,152 @@ class WakeWordDetector:
                 return self.keywords[0] if self.keywords else "hey-car"
             return None
         
+        detected_keyword = None
         try:
-            keyword_index = self.porcupine.process(audio_frame)
-            if keyword_index >= 0:
-                detected_keyword = self.keywords[keyword_index]
-                self.logger.info(f"🎤 Wake word detected: {detected_keyword}")
-                return detected_keyword
+            # Porcupine takes exactly frame_length samples; capture chunks rarely
+            # match, so copy them through the frame buffer and carry the remainder.
+            # Handing it a ctypes buffer also avoids boxing every sample as a NumPy scalar.
+            audio_frame = np.ascontiguousarray(audio_frame, dtype=np.int16)
+            src = audio_frame.ctypes.data
+            pos, total = 0, len(audio_frame)
+            while pos < total:
+                take = min(self.frame_length - self._frame_fill, total - pos)
+                ctypes.memmove(self._frame_addr + self._frame_fill * 2, src + pos * 2, take * 2)
+                self._frame_fill += take
+                pos += take
+                if self._frame_fill < self.frame_length:
+                    break
+                
+                self._frame_fill = 0
+                keyword_index = self.porcupine.process(self._frame)
+                if keyword_index >= 0 and detected_keyword is None:
+                    detected_keyword = self.keywords[keyword_index]
+                    self.logger.info(f"🎤 Wake word detected: {detected_keyword}")
         except Exception as e:
             self.logger.error(f"Wake word processing error: {e}")
         
-        return None
+        return detected_keyword
     
     def cleanup(self):
         """Clean up resources."""
-        if hasattr(self, 'porcupine') and not self.mock_mode:
-            self.porcupine.delete()
+        if self._engine_key is not None:
+            self._release_engine(self._engine_key, self.porcupine)
+            self._engine_key = None
+            self.porcupine = None
 
 
 class SpeechToText:
     """Speech-to-text processing using Whisper or mock implementation."""
     
+    # Worker processes shared by every instance: (backend, model name) ->
+    # [pool, reference count]. Each worker loads the model once, off the
+    # wake-word process's GIL, and is shut down with the last reference.
+    _pools: Dict[Tuple[str, str], list] = {}
+    _pools_lock = threading.Lock()
+    
     def __init__(self, model_name: str = "base"):
         self.logger = logging.getLogger(__name__)
+        self.model_name = model_name
+        self._pool: Optional[ProcessPoolExecutor] = None
         
-        if WHISPER_AVAILABLE:
-            try:
-                self.model = whisper.load_model(model_name)
-                self.mock_mode = False
-                self.logger.info(f"✅ Whisper model '{model_name}' loaded")
-            except Exception as e:
-                self.logger.error(f"Failed to load Whisper model: {e}")
-                self._init_mock_mode()
+        self.backend = self._select_backend()
+        if self.backend:
+            self.mock_mode = False
         else:
             self._init_mock_mode()
     
+    async def start(self) -> None:
+        """Start the STT worker process and load the model in it."""
+        if self.mock_mode or self._pool:
+            return
+        
+        key = (self.backend, self.model_name)
+        try:
+            self._pool = self._acquire_pool(key)
+            await asyncio.get_running_loop().run_in_executor(self._pool, _stt_worker_ready)
+            self.logger.info(f"✅ {self.backend} model '{self.model_name}' loaded in worker process")
+        except Exception as e:
+            self.logger.error(f"Failed to load {self.backend} model: {e}")
+            self._discard_pool(key)
+            self._pool = None
+            self._init_mock_mode()
+    
+    @property
+    def min_confidence(self) -> float:
+        """Lowest confidence from this backend that counts as understood."""
+        if self.mock_mode:
+            return DEFAULT_STT_MIN_CONFIDENCE
+        return STT_MIN_CONFIDENCE.get(self.backend, DEFAULT_STT_MIN_CONFIDENCE)
+    
+    def _select_backend(self) -> Optional[str]:
+        """Pick the configured STT backend, else the first one installed."""
+        requested = os.getenv(STT_BACKEND_ENV)
+        if requested:
+            if STT_BACKENDS.get(requested):
+                return requested
+            self.logger.warning(f"STT backend '{requested}' is not available - using default")
+        return next((name for name, available in STT_BACKENDS.items() if available), None)
+    
+    @classmethod
+    def _acquire_pool(cls, key: Tuple[str, str]) -> ProcessPoolExecutor:
+        """Return the worker pool for this backend and model, creating it once."""
+        with cls._pools_lock:
+            entry = cls._pools.get(key)
+            if entry is None:
+                pool = ProcessPoolExecutor(
+                    max_workers=1,
+                    mp_context=multiprocessing.get_context(STT_WORKER_START_METHOD),
+                    initializer=_load_stt_worker,
+                    initargs=key
+                )
+                entry = cls._pools[key] = [pool, 0]
+            entry[1] += 1
+            return entry[0]
+    
+    @classmethod
+    def _release_pool(cls, key: Tuple[str, str], pool: ProcessPoolExecutor) -> None:
+        """Drop one reference to a worker pool, shutting it down with the last one."""
+        with cls._pools_lock:
+            entry = cls._pools.get(key)
+            if entry is None or entry[0] is not pool:
+                return  # already discarded
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            del cls._pools[key]
+        pool.shutdown(wait=False, cancel_futures=True)
+    
+    @classmethod
+    def _discard_pool(cls, key: Tuple[str, str]) -> None:
+        """Drop a worker pool whose model failed to load."""
+        with cls._pools_lock:
+            entry = cls._pools.pop(key, None)
+        if entry:
+            entry[0].shutdown(wait=False, cancel_futures=True)
+    
+    def cleanup(self) -> None:
+        """Release this instance's worker process."""
+        if self._pool:
+            self._release_pool((self.backend, self.model_name), self._pool)
+            self._pool = None
+    
+    @staticmethod
+    def _load_model(backend: str, model_name: str):
+        """Load the model for the chosen backend."""
+        if backend == "faster_whisper":
+            # CTranslate2 with INT8 weights: the fast CPU path on Pi-class hardware
+            return WhisperModel(
+                model_name,
+                device="cpu",
+                compute_type="int8",
+                num_workers=1,
+                cpu_threads=os.cpu_count() or 0
+            )
+        if backend == "whispercpp":
+            # NEON-accelerated GGML inference on ARM, no PyTorch needed
+            return WhisperCppModel(model_name + WHISPERCPP_MODEL_SUFFIX, n_threads=WHISPERCPP_THREADS)
+        return whisper.load_model(model_name)
+    
     def _init_mock_mode(self):
         """Initialize mock STT for development."""
         self.mock_mode = True
@@ -162,15 +412,17 @@ class SpeechToText:
             return text, 0.95
         
         try:
-            # Run Whisper in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, 
-                lambda: self.model.transcribe(audio_data, language="en")
-            )
+            await self.start()
+            if self.mock_mode:
+                return await self.transcribe(audio_data)
             
-            text = result["text"].strip()
-            confidence = 0.9  # Whisper doesn't provide confidence, use default
+            # Run Whisper in the worker process; the int16 clip pickles in one copy
+            loop = asyncio.get_running_loop()
+            text, confidence = await loop.run_in_executor(
+                self._pool,
+                _stt_worker_transcribe,
+                audio_data
+            )
             
             self.logger.info(f"🗣️ Transcribed: '{text}' (confidence: {confidence:.2f})")
             return text, confidence
@@ -178,6 +430,64 @@ class SpeechToText:
         except Exception as e:
             self.logger.error(f"Speech transcription error: {e}")
             return "", 0.0
+    
+    @staticmethod
+    def _run_model(backend: str, model, audio_data: np.ndarray) -> tuple[str, float]:
+        """Run a loaded model on audio; called in the worker process."""
+        if audio_data.dtype == np.int16:
+            # Captured PCM; the models expect float32 in [-1, 1]
+            audio_data = audio_data.astype(np.float32) / 32768.0
+        
+        if backend == "faster_whisper":
+            segments, _info = model.transcribe(
+                audio_data,
+                language="en",
+                beam_size=1,
+                vad_filter=True,
+                condition_on_previous_text=False
+            )
+            # Segments are generated lazily; decoding happens while iterating here
+            segments = list(segments)
+            if not segments:
+                return "", 0.0
+            text = "".join(seg.text for seg in segments).strip()
+            confidence = math.exp(sum(seg.avg_logprob for seg in segments) / len(segments))
+            return text, confidence
+        
+        if backend == "whispercpp":
+            segments = model.transcribe(audio_data)
+            if not segments:
+                return "", 0.0
+            text = "".join(seg.text for seg in segments).strip()
+            # Newer pywhispercpp builds report no_speech_prob; older ones give no score
+            no_speech = [seg.no_speech_prob for seg in segments if hasattr(seg, "no_speech_prob")]
+            confidence = 1.0 - sum(no_speech) / len(no_speech) if no_speech else 0.9
+            return text, confidence
+        
+        result = model.transcribe(audio_data, language="en")
+        return result["text"].strip(), 0.9  # Whisper doesn't provide confidence, use default
+
+
+# STT model of this worker process, set by the pool initializer
+_worker_backend: Optional[str] = None
+_worker_model = None
+
+
+def _load_stt_worker(backend: str, model_name: str) -> None:
+    """Worker process initializer: load the STT model once."""
+    global _worker_backend, _worker_model
+    _worker_backend = backend
+    _worker_model = SpeechToText._load_model(backend, model_name)
+
+
+def _stt_worker_ready() -> bool:
+    """No-op task whose completion means the worker has loaded its model."""
+    return True
+
+
+def _stt_worker_transcribe(audio_data: np.ndarray) -> tuple[str, float]:
+    """Transcribe with the worker's model."""
+    return SpeechToText._run_model(_worker_backend, _worker_model, audio_data)
 
 
 class TextToSpeech:
@@ -186,9 +496,17 @@ class TextToSpeech:
     def __init__(self, voice_model: str = "en_US-lessac-medium"):
         self.logger = logging.getLogger(__name__)
         
+        self.sample_rate = 22050
+        
+        # Synthesized PCM by text, most recently used last. Filled by both the
+        # streaming and the whole-clip paths, which run in executor threads.
+        self._speech_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._speech_cache_lock = threading.Lock()
+        
         if PIPER_AVAILABLE:
             try:
-                # Initialize Piper TTS
+                self.voice = self._load_voice(voice_model)
+                self.sample_rate = self.voice.config.sample_rate
                 self.mock_mode = False
                 self.logger.info(f"✅ Piper TTS initialized with voice: {voice_model}")
             except Exception as e:
@@ -202,6 +520,31 @@ class TextToSpeech:
         self.mock_mode = True
         self.logger.warning("🔧 Using mock text-to-speech")
     
+    def _load_voice(self, voice_model: str) -> "PiperVoice":
+        """Load a Piper voice, running its INT8 build on a fully optimized ONNX session."""
+        model_path = os.path.join(PIPER_VOICE_DIR, f"{voice_model}.onnx")
+        voice = PiperVoice.load(model_path, config_path=f"{model_path}.json")
+        
+        int8_path = model_path[:-len(".onnx")] + PIPER_INT8_SUFFIX
+        if not ONNXRUNTIME_AVAILABLE or not os.path.exists(int8_path):
+            self.logger.info(f"No INT8 Piper voice at {int8_path}, using {model_path}")
+            return voice
+        
+        try:
+            opts = onnxruntime.SessionOptions()
+            opts.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+            voice.session = onnxruntime.InferenceSession(
+                int8_path, sess_options=opts, providers=["CPUExecutionProvider"]
+            )
+        except Exception as e:
+            self.logger.warning(f"INT8 Piper voice unavailable, using {model_path}: {e}")
+        return voice
+    
+    @property
+    def can_stream(self) -> bool:
+        """Whether speech can be played while it is still being synthesized."""
+        return not self.mock_mode and SOUNDDEVICE_AVAILABLE
+    
     async def synthesize(self, text: str) -> Optional[np.ndarray]:
         """Synthesize text to speech audio."""
         if self.mock_mode:
@@ -212,21 +555,107 @@ class TextToSpeech:
         
         try:
             # Run TTS in thread pool
-            loop = asyncio.get_event_loop()
-            audio_data = await loop.run_in_executor(
-                None,
-                lambda: self._generate_speech(text)
-            )
+            loop = asyncio.get_running_loop()
+            audio_data = await loop.run_in_executor(None, self._synthesize_cached, text)
             return audio_data
             
         except Exception as e:
             self.logger.error(f"Speech synthesis error: {e}")
             return None
     
+    async def stream(self, text: str) -> None:
+        """Synthesize text and play it as it is produced, returning once playback ends."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._stream_speech, text)
+    
+    def _cached_speech(self, text: str) -> Optional[np.ndarray]:
+        """Previously synthesized audio for text, if still cached."""
+        with self._speech_cache_lock:
+            audio = self._speech_cache.get(text)
+            if audio is not None:
+                self._speech_cache.move_to_end(text)
+            return audio
+    
+    def _cache_speech(self, text: str, audio: np.ndarray) -> None:
+        """Keep synthesized audio for text, evicting the least recently used."""
+        audio.flags.writeable = False  # shared by every cache hit
+        with self._speech_cache_lock:
+            self._speech_cache[text] = audio
+            self._speech_cache.move_to_end(text)
+            if len(self._speech_cache) > TTS_CACHE_SIZE:
+                self._speech_cache.popitem(last=False)
+    
+    def _synthesize_cached(self, text: str) -> np.ndarray:
+        """Audio for text, synthesizing it only on a cache miss."""
+        audio = self._cached_speech(text)
+        if audio is None:
+            audio = self._generate_speech(text)
+            self._cache_speech(text, audio)
+        return audio
+    
     def _generate_speech(self, text: str) -> np.ndarray:
         """Generate speech audio from text."""
-        # Placeholder for actual Piper TTS implementation
-        return np.array([])
+        return np.frombuffer(b"".join(self.voice.synthesize_stream_raw(text)), dtype=np.int16)
+    
+    def _stream_speech(self, text: str) -> None:
+        """Play Piper's output sentence by sentence from the audio device's callback."""
+        chunks: "queue.SimpleQueue[Optional[np.ndarray]]" = queue.SimpleQueue()
+        current = np.zeros(0, dtype=np.int16)
+        synthesized = False
+        finished = threading.Event()
+        problems = []
+        
+        def callback(outdata, frames, time_info, status):
+            nonlocal current, synthesized
+            if status:
+                problems.append(status)
+            out = outdata[:, 0]
+            filled = 0
+            while filled < frames:
+                if not len(current):
+                    if synthesized:
+                        break
+                    try:
+                        chunk = chunks.get_nowait()
+                    except queue.Empty:
+                        break  # synthesis is behind; pad with silence
+                    if chunk is None:
+                        synthesized = True
+                        continue
+                    current = chunk
+                n = min(frames - filled, len(current))
+                out[filled:filled + n] = current[:n]
+                current = current[n:]
+                filled += n
+            out[filled:] = 0
+            if synthesized and not len(current):
+                raise sounddevice.CallbackStop
+        
+        with sounddevice.OutputStream(samplerate=self.sample_rate, channels=1, dtype="int16",
+                                      callback=callback, finished_callback=finished.set) as stream:
+            samples = 0
+            try:
+                cached = self._cached_speech(text)
+                if cached is not None:
+                    chunks.put(cached)
+                    samples = len(cached)
+                else:
+                    parts = []
+                    for raw in self.voice.synthesize_stream_raw(text):
+                        # Views over Piper's output bytes; the callback copies straight from them
+                        parts.append(np.frombuffer(raw, dtype=np.int16))
+                        chunks.put(parts[-1])
+                        samples += len(parts[-1])
+                    self._cache_speech(text, np.concatenate(parts) if parts else np.zeros(0, dtype=np.int16))
+            finally:
+                chunks.put(None)
+            
+            # A stream that errors or is aborted never calls finished_callback
+            if not finished.wait(samples / self.sample_rate + TTS_PLAYBACK_GRACE):
+                stream.abort()
+                raise RuntimeError(f"audio output stalled (stream active: {stream.active})")
+        if problems:
+            self.logger.warning(f"Audio output reported {len(problems)} problem(s), last: {problems[-1]}")
 
 
 class VoiceManager:
@@ -249,13 +678,58 @@ class VoiceManager:
         
         # Audio processing
         self.audio = pyaudio.PyAudio()
-        self.audio_queue = queue.Queue()
         self.recording = False
         
-        # State management
+        # Single-producer/single-consumer ring: the capture thread copies each
+        # chunk into a preallocated slot and advances the head, the processing
+        # loop reads at the tail. Plain int stores are atomic under the GIL.
+        # Chunks are addressed by sequence number (slot = seq % size) and read
+        # in place; the writer never overwrites anything from _ring_keep on,
+        # which covers the pre-roll and the command being collected.
+        chunk_samples = config.chunk_size * config.channels
+        self._ring_size = max(1, int(AUDIO_RING_SECONDS * config.sample_rate / config.chunk_size))
+        self._ring = np.zeros((self._ring_size, chunk_samples), dtype=np.int16)
+        self._ring_slots = [memoryview(row).cast("B") for row in self._ring]
+        self._ring_head = 0
+        self._ring_tail = 0
+        self._ring_keep = 0
+        self.dropped_chunks = 0
+        
+        # Set from the capture thread (via the loop) whenever a chunk lands in the
+        # ring for the processing loop, i.e. while a command is being collected
+        self._audio_ready = asyncio.Event()
+        
+        # The capture thread runs wake word detection itself and only hands the
+        # loop a detected wake word; until the loop has handled it, chunks are
+        # left in the ring for command collection instead
+        self._wake_words: asyncio.Queue = asyncio.Queue()
+        self._wake_pending = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pre_roll_chunks = max(1, int(PRE_ROLL_SECONDS * config.sample_rate / config.chunk_size))
+        self._pre_roll_floor = 0  # pre-roll never reaches back past this chunk
+        
+        # Voice activity detection for finding the end of a command
+        self.vad = None
+        if WEBRTCVAD_AVAILABLE and config.sample_rate in (8000, 16000, 32000, 48000):
+            self.vad = webrtcvad.Vad(VAD_AGGRESSIVENESS)
+        self.vad_frame_bytes = config.sample_rate * VAD_FRAME_MS // 1000 * 2  # 16-bit PCM
+        
+        # State management. Playback is counted separately rather than stored
+        # in state, so a reply finishing late never restores a stale state.
         self.state = VoiceState.IDLE
+        self._speaking = 0
+        
+        # Where the pipeline's own replies go; the system controller points
+        # this at its speaker queue so only one thing plays at a time
+        self.reply_sink: Optional[Callable[[str, Optional[str]], Awaitable[None]]] = None
         self.listening_task: Optional[asyncio.Task] = None
         
+        # Background transcription of a command still being spoken
+        self._draft_task: Optional[asyncio.Task] = None
+        
+        # Pre-synthesized fixed phrases: key -> (text, audio)
+        self.cached_speech: Dict[str, tuple] = {}
+        
         # Performance metrics
         self.stats = {
             "wake_words_detected": 0,
@@ -268,10 +742,17 @@ class VoiceManager:
         try:
             self.logger.info("🎤 Initializing Voice Manager...")
             
-            # Test audio input
-            if not self._test_audio_input():
+            # Test audio input off the event loop while the STT worker loads its model
+            self._loop = asyncio.get_running_loop()
+            audio_ok, _ = await asyncio.gather(
+                self._loop.run_in_executor(None, self._test_audio_input),
+                self.stt.start()
+            )
+            if not audio_ok:
                 return False
             
+            await self.pretts(VOICE_REPLIES)
+            
             self.state = VoiceState.IDLE
             self.logger.info("✅ Voice Manager initialized successfully")
             return True
@@ -312,6 +793,9 @@ class VoiceManager:
         
         self.state = VoiceState.LISTENING
         self.recording = True
+        self._ring_tail = self._ring_keep = self._pre_roll_floor = self._ring_head
+        self._wake_pending = False
+        self._loop = asyncio.get_running_loop()
         
         # Start audio capture in separate thread
         audio_thread = threading.Thread(target=self._audio_capture_thread)
@@ -335,6 +819,13 @@ class VoiceManager:
                 frames_per_buffer=self.config.chunk_size
             )
             
+            ring = self._ring
+            slots = self._ring_slots
+            size = self._ring_size
+            pre_roll = self._pre_roll_chunks
+            detector = self.wake_word_detector
+            loop = self._loop
+            ready = self._audio_ready
             while self.recording:
                 try:
                     data = stream.read(
@@ -342,9 +833,30 @@ class VoiceManager:
                         exception_on_overflow=False
                     )
                     
-                    # Convert to numpy array
-                    audio_array = np.frombuffer(data, dtype=np.int16)
-                    self.audio_queue.put(audio_array)
+                    # Copy straight into the next ring slot; drop the chunk if that slot is still in use
+                    head = self._ring_head
+                    if head - self._ring_keep >= size:
+                        self.dropped_chunks += 1
+                        continue
+                    slots[head % size][:] = data
+                    self._ring_head = head + 1
+                    
+                    if self._wake_pending:
+                        # Collecting a command: wake the processing loop, unless it is already due to wake
+                        if not ready.is_set():
+                            loop.call_soon_threadsafe(ready.set)
+                        continue
+                    
+                    # Consume the chunk here, keeping only the pre-roll. Porcupine
+                    # is a C call that releases the GIL, so the event loop isn't
+                    # woken for every chunk just to hand it to the detector.
+                    self._ring_tail = head + 1
+                    self._ring_keep = head + 1 - pre_roll
+                    if self.state == VoiceState.LISTENING and not self._speaking:
+                        wake_word = detector.process_audio(ring[head % size])
+                        if wake_word:
+                            self._wake_pending = True
+                            loop.call_soon_threadsafe(self._wake_words.put_nowait, wake_word)
                     
                 except Exception as e:
                     self.logger.error(f"Audio capture error: {e}")
@@ -360,19 +872,13 @@ class VoiceManager:
         """Main audio processing loop."""
         while self.recording and self.state != VoiceState.ERROR:
             try:
-                # Get audio data (non-blocking)
+                # Wait for the capture thread to detect a wake word
+                wake_word = await self._wake_words.get()
                 try:
-                    audio_data = self.audio_queue.get_nowait()
-                except queue.Empty:
-                    await asyncio.sleep(0.01)
-                    continue
-                
-                # Process for wake words
-                if self.state == VoiceState.LISTENING:
-                    wake_word = self.wake_word_detector.process_audio(audio_data)
-                    
-                    if wake_word:
-                        await self._handle_wake_word(wake_word)
+                    await self._handle_wake_word(wake_word)
+                finally:
+                    # Hand the ring back to the capture thread
+                    self._wake_pending = False
                 
             except Exception as e:
                 self.logger.error(f"Processing loop error: {e}")
@@ -384,29 +890,34 @@ class VoiceManager:
         self.stats["wake_words_detected"] += 1
         self.state = VoiceState.PROCESSING
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
-            # Collect audio for command (simulate 3 seconds)
             self.logger.info(f"🔊 Wake word '{wake_word}' detected, listening for command...")
             
-            # In real implementation, would collect audio until silence
-            await asyncio.sleep(3.0)  # Simulate command collection
+            # Collect the command until the speaker goes quiet
+            command_audio, pre_roll_samples, draft = await self._collect_command()
             
-            # Mock audio data for STT
-            command_audio = np.array([])  # Would be actual audio data
+            # Don't wake the model for silence or noise after the wake word
+            spoken = command_audio[pre_roll_samples:]
+            if not self.stt.mock_mode and not self._has_speech(spoken):
+                self.logger.info("No speech after wake word - skipping transcription")
+                return
             
-            # Transcribe command
-            text, confidence = await self.stt.transcribe(command_audio)
+            # Transcribe command, or collect the transcription started at the final pause
+            if draft:
+                text, confidence = await draft
+            else:
+                text, confidence = await self.stt.transcribe(command_audio)
             
-            if text and confidence > 0.7:
-                processing_time = time.time() - start_time
+            if text and confidence > self.stt.min_confidence:
+                processing_time = time.monotonic() - start_time
                 
                 # Create voice command object
                 voice_command = VoiceCommand(
                     text=text,
                     confidence=confidence,
-                    timestamp=time.time(),
+                    timestamp=time.time(),  # wall clock, for display
                     wake_word=wake_word,
                     processing_time=processing_time
                 )
@@ -424,36 +935,194 @@ class VoiceManager:
                 
             else:
                 self.logger.warning(f"Command not understood (confidence: {confidence:.2f})")
-                await self.speak("Sorry, I didn't understand that command.")
+                await self._reply("not_understood")
             
         except Exception as e:
             self.logger.error(f"Command processing error: {e}")
-            await self.speak("Sorry, there was an error processing your command.")
+            await self._reply("error")
         
         finally:
             self.state = VoiceState.LISTENING
     
+    async def _collect_command(self) -> Tuple[np.ndarray, int, Optional[asyncio.Task]]:
+        """Gather command audio, starting from the pre-roll, until end of speech.
+        
+        Returns the audio (trailing silence dropped), how many of its samples
+        came from the pre-roll, and a transcription already running on exactly
+        that audio, if one was started.
+        """
+        # The pre-roll and the command stay in the ring until the next chunk is
+        # processed in the listening state, so they're only copied out once
+        start = max(self._ring_tail - self._pre_roll_chunks, self._pre_roll_floor)
+        self._ring_keep = start
+        pre_roll_samples = (self._ring_tail - start) * self._ring.shape[1]
+        
+        chunk_seconds = self.config.chunk_size / self.config.sample_rate
+        started = time.monotonic()
+        silence = 0.0
+        heard_speech = False
+        speech_end = self._ring_tail
+        draft: Optional[Tuple[int, asyncio.Task]] = None
+        
+        while True:
+            limit = COMMAND_MAX_SECONDS if heard_speech else COMMAND_START_TIMEOUT
+            frame = await self._next_frame(started + limit - time.monotonic())
+            if frame is None:
+                break
+            
+            if self._is_speech(frame):
+                heard_speech = True
+                silence = 0.0
+                speech_end = self._ring_tail
+            else:
+                if heard_speech and silence == 0.0:
+                    # The speaker paused: start transcribing what was said so
+                    # far, so the result is ready if this pause ends the command
+                    draft = self._start_draft(start, speech_end, pre_roll_samples, draft)
+                silence += chunk_seconds
+                if heard_speech and silence >= END_OF_SPEECH_SILENCE:
+                    break
+        
+        end = speech_end if heard_speech else self._ring_tail
+        self._pre_roll_floor = self._ring_tail
+        if draft and draft[0] == end:
+            return self._ring_audio(start, end), pre_roll_samples, draft[1]
+        return self._ring_audio(start, end), pre_roll_samples, None
+    
+    def _ring_audio(self, start: int, end: int) -> np.ndarray:
+        """Copy chunks start..end-1 out of the ring as one contiguous clip."""
+        return self._ring[np.arange(start, end) % self._ring_size].reshape(-1)
+    
+    def _start_draft(self, start: int, end: int, pre_roll_samples: int,
+                     draft: Optional[Tuple[int, asyncio.Task]]) -> Optional[Tuple[int, asyncio.Task]]:
+        """Transcribe the utterance so far in the background, one draft at a time."""
+        if self.stt.mock_mode or (draft and not draft[1].done()):
+            return draft
+        
+        audio = self._ring_audio(start, end)
+        if not self._has_speech(audio[pre_roll_samples:]):
+            return draft
+        # Kept on self as well so a superseded draft isn't collected while it runs
+        self._draft_task = asyncio.create_task(self.stt.transcribe(audio))
+        return end, self._draft_task
+    
+    @staticmethod
+    def _has_speech(audio: np.ndarray) -> bool:
+        """Cheap whole-clip check for speech: enough energy and enough zero crossings."""
+        if audio.size < 2:
+            return False
+        samples = audio.astype(np.float32)
+        rms = math.sqrt(float(np.dot(samples, samples)) / samples.size)
+        signs = np.signbit(audio)
+        zcr = np.count_nonzero(signs[1:] != signs[:-1]) / (audio.size - 1)
+        return rms >= SPEECH_RMS_THRESHOLD and zcr >= SPEECH_ZCR_THRESHOLD
+    
+    async def _next_frame(self, timeout: float) -> Optional[np.ndarray]:
+        """Next captured audio chunk, or None if none arrives within timeout."""
+        if not self.recording:
+            return None
+        try:
+            return await asyncio.wait_for(self._wait_chunk(), timeout)
+        except asyncio.TimeoutError:
+            return None
+    
+    async def _wait_chunk(self) -> np.ndarray:
+        """Next chunk from the capture ring, sleeping until the capture thread signals one."""
+        while True:
+            chunk = self._read_chunk()
+            if chunk is not None:
+                return chunk
+            # Clear, then look again, so a chunk published in between isn't missed
+            self._audio_ready.clear()
+            chunk = self._read_chunk()
+            if chunk is not None:
+                return chunk
+            await self._audio_ready.wait()
+    
+    def _read_chunk(self) -> Optional[np.ndarray]:
+        """Take the oldest unread chunk from the capture ring, if any.
+        
+        The chunk is a view of its ring slot, valid while it is at or after _ring_keep.
+        """
+        tail = self._ring_tail
+        if tail == self._ring_head:
+            return None
+        self._ring_tail = tail + 1
+        return self._ring[tail % self._ring_size]
+    
+    def _is_speech(self, frame: np.ndarray) -> bool:
+        """Whether an audio chunk contains voice."""
+        if self.vad is None:
+            return float(np.sqrt(np.mean(frame.astype(np.float32) ** 2))) >= VAD_RMS_THRESHOLD
+        
+        pcm = frame.tobytes()
+        step = self.vad_frame_bytes
+        return any(
+            self.vad.is_speech(pcm[i:i + step], self.config.sample_rate)
+            for i in range(0, len(pcm) - step + 1, step)
+        )
+    
     async def speak(self, text: str) -> None:
         """Synthesize and play speech."""
         if self.state == VoiceState.ERROR:
             return
         
-        prev_state = self.state
-        self.state = VoiceState.SPEAKING
-        
+        self._speaking += 1
         try:
             self.logger.info(f"🔊 Speaking: '{text}'")
-            audio_data = await self.tts.synthesize(text)
-            
-            if audio_data is not None:
-                # In real implementation, would play audio
-                pass
+            if self.tts.can_stream:
+                await self.tts.stream(text)
+            else:
+                audio_data = await self.tts.synthesize(text)
+                await self._play_audio(audio_data)
             
         except Exception as e:
             self.logger.error(f"Speech synthesis error: {e}")
         
         finally:
-            self.state = prev_state
+            self._speaking -= 1
+    
+    async def pretts(self, phrases: Dict[str, str]) -> None:
+        """Synthesize fixed phrases once so they can be replayed with play_cached()."""
+        audio = await asyncio.gather(*(self.tts.synthesize(text) for text in phrases.values()))
+        for (key, text), audio_data in zip(phrases.items(), audio):
+            self.cached_speech[key] = (text, audio_data)
+    
+    async def _reply(self, key: str) -> None:
+        """Speak one of the pipeline's own VOICE_REPLIES, from cache when prepared."""
+        if self.reply_sink:
+            await self.reply_sink(VOICE_REPLIES[key], key if key in self.cached_speech else None)
+        elif key in self.cached_speech:
+            await self.play_cached(key)
+        else:
+            await self.speak(VOICE_REPLIES[key])
+    
+    async def play_cached(self, key: str) -> None:
+        """Play a phrase prepared by pretts(), synthesizing only if no audio was cached."""
+        text, audio_data = self.cached_speech[key]
+        if audio_data is None or self.state == VoiceState.ERROR:
+            await self.speak(text)
+            return
+        
+        self._speaking += 1
+        try:
+            self.logger.info(f"🔊 Speaking (cached): '{text}'")
+            await self._play_audio(audio_data)
+        finally:
+            self._speaking -= 1
+    
+    async def _play_audio(self, audio_data: Optional[np.ndarray]) -> None:
+        """Play synthesized audio, returning once playback has finished."""
+        if audio_data is not None and len(audio_data) and SOUNDDEVICE_AVAILABLE:
+            # Returning only at the end keeps the wake word detector paused
+            # for the whole reply, so it never hears the assistant's own voice
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._play_blocking, audio_data)
+    
+    def _play_blocking(self, audio_data: np.ndarray) -> None:
+        """Play audio on the default output device and wait for it to finish."""
+        sounddevice.play(audio_data, self.tts.sample_rate)
+        sounddevice.wait()
     
     async def stop_listening(self) -> None:
         """Stop listening and clean up."""
@@ -476,4 +1145,5 @@ class VoiceManager:
     def cleanup(self) -> None:
         """Clean up resources."""
         self.wake_word_detector.cleanup()
+        self.stt.cleanup()
         self.audio.terminate()
\ No newline at end of file
@@ -0,0 +1,184 @@
+"""Unit tests for the LLM controller's response cache and stream scanner."""
+
+import numpy as np
+import pytest
+
+import controllers.llm_controller as llm_controller
+from controllers.llm_controller import (
+    Entity, Intent, IntentType, LLMController, LLMResponse, ResponseCache, _JsonObjectScanner
+)
+
+STATUS = {"vehicle_speed": 42.0, "engine_temp": 91.0}
+
+
+def _response(text="Setting temperature to 72", intent_type=IntentType.CLIMATE_CONTROL, **kwargs):
+    intent = Intent(
+        intent_type=intent_type,
+        confidence=0.9,
+        entities=[Entity(name="temperature", value=72, confidence=0.9, start_pos=0, end_pos=2)],
+        raw_text="set temperature to 72",
+        action="set",
+        target="temperature",
+        value=72
+    )
+    return LLMResponse(text=text, intent=intent, confidence=0.9, processing_time=0.1, **kwargs)
+
+
+def _unit(vector):
+    vector = np.asarray(vector, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def test_exact_hit():
+    cache = ResponseCache()
+    key, context = ResponseCache.make_key("Set temperature to 72", STATUS)
+    cache.put(key, _response(), context)
+
+    again, _ = ResponseCache.make_key("  set temperature to 72 ", STATUS)
+    assert cache.get(again).text == "Setting temperature to 72"
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_expired_entry_misses():
+    cache = ResponseCache(ttl=-1.0)
+    key, context = ResponseCache.make_key("set temperature to 72", STATUS)
+    cache.put(key, _response(), context)
+    assert cache.get(key) is None
+    assert cache.misses == 1
+
+
+def test_lru_evicts_oldest():
+    cache = ResponseCache(max_entries=2)
+    keys = [ResponseCache.make_key(f"volume {n}", STATUS) for n in range(3)]
+    for key, context in keys:
+        cache.put(key, _response(), context)
+    assert cache.get(keys[0][0]) is None
+    assert cache.get(keys[2][0]) is not None
+
+
+@pytest.mark.parametrize("response", [
+    _response(intent_type=IntentType.UNKNOWN),
+    _response(requires_confirmation=True),
+    _response(safety_warning="Engine temperature is high"),
+    LLMResponse(text="Sorry", intent=None, confidence=0.0, processing_time=0.1),
+])
+def test_safety_relevant_responses_are_not_cached(response):
+    cache = ResponseCache()
+    key, context = ResponseCache.make_key("set temperature to 72", STATUS)
+    cache.put(key, response, context)
+    assert cache.get(key) is None
+
+
+def test_put_stores_a_copy():
+    cache = ResponseCache()
+    key, context = ResponseCache.make_key("set temperature to 72", STATUS)
+    response = _response()
+    cache.put(key, response, context)
+
+    response.intent.entities.clear()
+    response.intent.value = 99
+    cached = cache.get(key)
+    assert len(cached.intent.entities) == 1
+    assert cached.intent.value == 72
+
+
+def test_status_buckets_share_keys():
+    a, _ = ResponseCache.make_key("what is my speed", {"vehicle_speed": 42.0, "engine_temp": 91.0})
+    b, _ = ResponseCache.make_key("what is my speed", {"vehicle_speed": 44.0, "engine_temp": 89.0})
+    c, _ = ResponseCache.make_key("what is my speed", {"vehicle_speed": 0.0, "engine_temp": 89.0})
+    assert a == b
+    assert a != c
+
+
+def test_history_is_part_of_the_key_for_references_back():
+    a = ResponseCache.make_key("make it warmer", STATUS, "User: set temperature to 70")
+    b = ResponseCache.make_key("make it warmer", STATUS, "User: turn up the volume")
+    assert a[0] != b[0]
+    assert a[1] != b[1]
+
+
+def test_history_is_ignored_for_self_contained_commands():
+    a = ResponseCache.make_key("turn up the volume", STATUS, "User: set temperature to 70")
+    b = ResponseCache.make_key("turn up the volume", STATUS, "User: turn up the volume")
+    assert a == b
+
+
+@pytest.mark.asyncio
+async def test_repeated_command_hits_cache():
+    controller = LLMController()
+    controller.mock_mode = True
+    for _ in range(7):
+        response = await controller.process_command("turn up the volume", STATUS)
+        assert response.intent.intent_type == IntentType.AUDIO_CONTROL
+    assert (controller.response_cache.hits, controller.response_cache.misses) == (6, 1)
+
+
+class FailingSession:
+    """aiohttp session stand-in whose requests all fail."""
+    
+    def __init__(self):
+        self.requests = 0
+    
+    def post(self, *args, **kwargs):
+        self.requests += 1
+        raise ConnectionError("embedding model not loaded")
+
+
+@pytest.mark.asyncio
+async def test_embedding_failure_backs_off_then_retries(monkeypatch):
+    controller = LLMController()
+    controller._session = FailingSession()
+    assert await controller._get_embedding("turn up the volume") is None
+    assert await controller._get_embedding("turn up the volume") is None
+    assert controller._session.requests == 1
+    
+    monkeypatch.setattr(llm_controller.time, "monotonic", lambda: controller._embeddings_retry_at + 1)
+    assert await controller._get_embedding("turn up the volume") is None
+    assert controller._session.requests == 2
+
+
+def test_has_context_only_for_live_embeddings():
+    cache = ResponseCache()
+    key, context = ResponseCache.make_key("set the temperature to 72", STATUS)
+    assert not cache.has_context(context)
+    cache.put(key, _response(), context, embedding=_unit([1.0, 0.0]))
+    assert cache.has_context(context)
+    assert not cache.has_context(ResponseCache.make_key("set the temperature to 75", STATUS)[1])
+
+
+def test_similar_command_hit():
+    cache = ResponseCache(similarity_threshold=0.9)
+    key, context = ResponseCache.make_key("set the temperature to 72", STATUS)
+    cache.put(key, _response(), context, embedding=_unit([1.0, 0.1, 0.0]))
+
+    other_key, other_context = ResponseCache.make_key("please set temperature to 72", STATUS)
+    assert other_context == context
+    assert cache.get(other_key) is None
+    assert cache.get_similar(_unit([1.0, 0.12, 0.0]), other_context) is not None
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert cache.get_similar(_unit([0.0, 1.0, 0.0]), other_context) is None
+
+
+@pytest.mark.parametrize("first, second", [
+    ("set temperature to 72", "set temperature to 75"),
+    ("turn on the lights", "turn off the lights"),
+])
+def test_numbers_and_actions_separate_contexts(first, second):
+    assert ResponseCache.make_key(first, STATUS)[1] != ResponseCache.make_key(second, STATUS)[1]
+
+
+def test_scanner_finds_object_end_across_chunks():
+    scanner = _JsonObjectScanner()
+    chunks = ['  {"text": "a } in a string \\" ', 'still", "list": [1, {"x": 2}]', '}', ' trailing']
+    ends = [scanner.feed(chunk) for chunk in chunks]
+    assert ends[:2] == [None, None]
+    assert ends[2] == len(chunks[0]) + len(chunks[1]) + 1
+    text = "".join(chunks)
+    assert text[:ends[2]].strip().endswith("]}")
+
+
+def test_scanner_gives_up_on_non_object():
+    scanner = _JsonObjectScanner()
+    assert scanner.feed("Sure! {\"text\": \"hi\"}") is None
+    assert not scanner.enabled
+    assert scanner.feed("}") is None
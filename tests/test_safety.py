@@ -0,0 +1,195 @@
+"""Unit tests for the safety monitor's rule scan."""
+
+import time
+
+import numpy as np
+import pytest
+
+from interfaces.vehicle import VehicleManager, VehicleParameter, VehicleSystemType
+from safety.monitor import MONITOR_IDLE_INTERVAL, MONITOR_QUIET_TICKS, SafetyLevel, SafetyMonitor
+
+# Readings comfortably inside every default rule's limits
+NORMAL_READINGS = {
+    "engine_temp": 90.0,
+    "engine_rpm": 2500.0,
+    "oil_pressure": 40.0,
+    "boost_pressure": 8.0,
+    "hvac_temp_set": 22.0,
+    "vehicle_speed": 50.0,
+}
+
+
+class FakeVehicleManager:
+    """Serves fixed readings to the monitor."""
+
+    def __init__(self, readings):
+        self.readings = dict(readings)
+        self.fail = False
+
+    async def get_parameters(self, parameter_names):
+        if self.fail:
+            raise ConnectionError("adapter unplugged")
+        return {
+            name: VehicleParameter(
+                name=name,
+                value=self.readings[name],
+                unit="",
+                timestamp=time.monotonic(),
+                system_type=VehicleSystemType.ENGINE,
+                source="obd"
+            )
+            for name in parameter_names if name in self.readings
+        }
+
+
+@pytest.fixture
+def vehicle():
+    return FakeVehicleManager(NORMAL_READINGS)
+
+
+@pytest.fixture
+def monitor(vehicle):
+    return SafetyMonitor(settings=None, vehicle_manager=vehicle)
+
+
+async def _tick(monitor):
+    await monitor._check_safety_rules()
+    monitor._update_safety_level()
+
+
+@pytest.mark.asyncio
+async def test_normal_readings_are_safe(monitor):
+    await _tick(monitor)
+    assert monitor.active_violations == []
+    assert monitor.current_safety_level == SafetyLevel.SAFE
+
+
+@pytest.mark.asyncio
+async def test_worst_fired_rule_sets_level(monitor, vehicle):
+    vehicle.readings["engine_temp"] = 112.0  # past both the warning and critical limits
+    await _tick(monitor)
+
+    fired = {v.rule_name for v in monitor.active_violations}
+    assert fired == {"engine_temp_critical", "engine_temp_warning"}
+    assert monitor.current_safety_level == SafetyLevel.CRITICAL
+    assert monitor.stats["violations_detected"] == 2
+    assert len(monitor.violation_history) == 2
+
+
+@pytest.mark.asyncio
+async def test_min_limit_fires_below(monitor, vehicle):
+    vehicle.readings["oil_pressure"] = 10.0
+    await _tick(monitor)
+
+    (violation,) = monitor.active_violations
+    assert violation.rule_name == "oil_pressure_critical"
+    assert violation.limit_value == 15.0
+    assert "10.0 < 15.0" in violation.description
+    assert violation.action_taken
+
+
+@pytest.mark.asyncio
+async def test_violations_clear_when_readings_recover(monitor, vehicle):
+    vehicle.readings["engine_rpm"] = 7500.0
+    await _tick(monitor)
+    assert monitor.current_safety_level == SafetyLevel.CRITICAL
+
+    vehicle.readings["engine_rpm"] = 2500.0
+    await _tick(monitor)
+    assert monitor.active_violations == []
+    assert monitor.current_safety_level == SafetyLevel.SAFE
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("bad_value", [float("nan"), "n/a", None])
+async def test_unreadable_value_never_fires(monitor, vehicle, bad_value):
+    vehicle.readings["engine_temp"] = bad_value
+    await _tick(monitor)
+    assert monitor.active_violations == []
+
+
+@pytest.mark.asyncio
+async def test_infinite_value_fires(monitor, vehicle):
+    vehicle.readings["boost_pressure"] = float("inf")
+    await _tick(monitor)
+    assert [v.rule_name for v in monitor.active_violations] == ["boost_pressure_limit"]
+
+
+@pytest.mark.asyncio
+async def test_quiet_ticks_slow_the_monitor(monitor):
+    for _ in range(MONITOR_QUIET_TICKS):
+        assert monitor._next_interval() == monitor.monitoring_interval
+        await _tick(monitor)
+    assert monitor._next_interval() > monitor.monitoring_interval
+
+
+@pytest.mark.asyncio
+async def test_near_limit_resets_quiet_ticks(monitor, vehicle):
+    for _ in range(MONITOR_QUIET_TICKS):
+        await _tick(monitor)
+
+    vehicle.readings["engine_temp"] = 100.0  # within 10% of the 105 °C warning
+    await _tick(monitor)
+    assert monitor._quiet_ticks == 0
+    assert monitor._next_interval() == monitor.monitoring_interval
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("missing", ["nan", "failed_read"])
+async def test_missing_data_resets_quiet_ticks(monitor, vehicle, missing):
+    for _ in range(MONITOR_QUIET_TICKS):
+        await _tick(monitor)
+
+    if missing == "nan":
+        vehicle.readings["oil_pressure"] = np.nan
+    else:
+        vehicle.fail = True
+    await _tick(monitor)
+    assert monitor._quiet_ticks == 0
+
+
+@pytest.mark.asyncio
+async def test_status_violations_are_copies(monitor, vehicle):
+    vehicle.readings["engine_rpm"] = 7500.0
+    await _tick(monitor)
+
+    status = monitor.get_safety_status()
+    status["recent_violations"][0]["rule"] = "tampered"
+    assert monitor.get_safety_status()["recent_violations"][0]["rule"] != "tampered"
+
+
+@pytest.mark.asyncio
+async def test_never_reported_parameters_dont_block_back_off():
+    # No interface provides oil pressure, and boost/HVAC only appear after a CAN write
+    readings = {name: value for name, value in NORMAL_READINGS.items()
+                if name not in ("oil_pressure", "boost_pressure", "hvac_temp_set")}
+    monitor = SafetyMonitor(settings=None, vehicle_manager=FakeVehicleManager(readings))
+    for _ in range(MONITOR_QUIET_TICKS):
+        await _tick(monitor)
+    assert monitor._next_interval() == MONITOR_IDLE_INTERVAL
+
+
+@pytest.mark.asyncio
+async def test_mock_vehicle_backs_off():
+    vehicle = VehicleManager()
+    assert await vehicle.initialize()
+    try:
+        monitor = SafetyMonitor(settings=None, vehicle_manager=vehicle)
+        for _ in range(MONITOR_QUIET_TICKS + 3):
+            await _tick(monitor)
+        assert monitor._next_interval() == MONITOR_IDLE_INTERVAL
+    finally:
+        await vehicle.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_level_callbacks_fire_on_changes_only(monitor, vehicle):
+    levels = []
+    monitor.register_level_callback(levels.append)
+    
+    vehicle.readings["engine_rpm"] = 7500.0
+    await _tick(monitor)
+    await _tick(monitor)
+    vehicle.readings["engine_rpm"] = 2500.0
+    await _tick(monitor)
+    assert levels == [SafetyLevel.CRITICAL, SafetyLevel.SAFE]
@@ -0,0 +1,176 @@
+"""Unit tests for the system controller's job scheduler, speech queue and status."""
+
+import asyncio
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("pyaudio")
+
+import controllers.system_controller as system_controller
+from controllers.hvac_controller import HVACController
+from controllers.system_controller import SystemController
+
+
+def _controller(jobs):
+    """A controller with only the scheduler's state, running the given (interval, job) pairs."""
+    controller = SystemController.__new__(SystemController)
+    controller.logger = logging.getLogger(__name__)
+    controller.running = True
+    controller._periodic_jobs = jobs
+    controller._due_now = set()
+    controller._scheduler_wakeup = asyncio.Event()
+    return controller
+
+
+def _counter(runs, name, fail=False):
+    async def job():
+        runs.append(name)
+        if fail:
+            raise RuntimeError("job failed")
+    return job
+
+
+async def _run_for(controller, seconds):
+    task = asyncio.create_task(controller._periodic_scheduler())
+    await asyncio.sleep(seconds)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.fixture(autouse=True)
+def short_batch_window(monkeypatch):
+    monkeypatch.setattr(system_controller, "PERIODIC_BATCH_WINDOW", 0.01)
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_at_their_intervals():
+    runs = []
+    controller = _controller({
+        "fast": (0.05, _counter(runs, "fast")),
+        "slow": (10.0, _counter(runs, "slow")),
+    })
+    await _run_for(controller, 0.23)
+    assert runs.count("slow") == 1
+    assert 3 <= runs.count("fast") <= 5
+
+
+@pytest.mark.asyncio
+async def test_woken_job_runs_immediately():
+    runs = []
+    controller = _controller({"hvac": (10.0, _counter(runs, "hvac"))})
+    task = asyncio.create_task(controller._periodic_scheduler())
+    await asyncio.sleep(0.02)
+    assert runs == ["hvac"]
+
+    controller._wake_periodic_job("hvac")
+    await asyncio.sleep(0.02)
+    assert runs == ["hvac", "hvac"]
+
+    # The superseded deadline doesn't run it a third time
+    await asyncio.sleep(0.05)
+    assert runs == ["hvac", "hvac"]
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_failing_job_keeps_its_schedule():
+    runs = []
+    controller = _controller({
+        "broken": (0.05, _counter(runs, "broken", fail=True)),
+        "health": (0.05, _counter(runs, "health")),
+    })
+    await _run_for(controller, 0.13)
+    assert runs.count("broken") >= 2
+    assert runs.count("health") >= 2
+
+
+def _speaker_controller():
+    controller = _controller({})
+    controller._speak_q = asyncio.Queue(maxsize=2)
+    return controller
+
+
+def _queued(controller):
+    items = [controller._speak_q.get_nowait() for _ in range(controller._speak_q.qsize())]
+    return [text for text, _, _ in items]
+
+
+@pytest.mark.asyncio
+async def test_droppable_reply_displaces_only_droppable_replies():
+    controller = _speaker_controller()
+    await controller._say("Blocked for safety")
+    await controller._say("Engine temperature is 90 degrees", droppable=True)
+    await controller._say("One moment.", droppable=True)
+    assert _queued(controller) == ["Blocked for safety", "One moment."]
+
+
+@pytest.mark.asyncio
+async def test_droppable_reply_never_evicts_required_replies():
+    controller = _speaker_controller()
+    await controller._say("Blocked for safety")
+    await controller._say("Please confirm")
+    await controller._say("One moment.", droppable=True)
+    assert _queued(controller) == ["Blocked for safety", "Please confirm"]
+
+
+@pytest.mark.asyncio
+async def test_required_reply_waits_for_room():
+    controller = _speaker_controller()
+    await controller._say("Engine temperature is 90 degrees", droppable=True)
+    await controller._say("Blocked for safety")
+    waiting = asyncio.create_task(controller._say("Please confirm"))
+    await asyncio.sleep(0.01)
+    assert not waiting.done()
+    
+    controller._speak_q.get_nowait()
+    await asyncio.wait_for(waiting, 1.0)
+    assert _queued(controller) == ["Blocked for safety", "Please confirm"]
+
+
+@pytest.mark.asyncio
+async def test_vehicle_and_safety_changes_wake_their_jobs():
+    controller = _controller({"hvac_auto": (30.0, None), "health": (60.0, None)})
+    controller._on_vehicle_change("hvac_fan_speed")
+    controller._on_vehicle_change("engine_rpm")
+    assert controller._due_now == {"hvac_auto"}
+    
+    controller._on_safety_level_change(system_controller.SafetyLevel.WARNING)
+    assert controller._due_now == {"hvac_auto", "health"}
+    assert controller._scheduler_wakeup.is_set()
+
+
+def _status_controller(hvac_controller=None):
+    """A controller with only what get_detailed_status reads."""
+    controller = _controller({})
+    controller._cached_detail = None
+    controller.get_system_status = lambda: SimpleNamespace(initialized=True)
+    controller.safety_monitor = SimpleNamespace(get_safety_status=lambda: {"safety_level": "safe"})
+    controller.stats = system_controller.SystemStats()
+    controller.voice_manager = controller.llm_controller = None
+    controller.hvac_controller = hvac_controller
+    return controller
+
+
+def test_detailed_status_callers_get_copies():
+    controller = _status_controller()
+    first = controller.get_detailed_status()
+    first["safety"]["safety_level"] = "tampered"
+    first["stats"].clear()
+    first["extra"] = {}
+    
+    second = controller.get_detailed_status()
+    assert second["safety"]["safety_level"] == "safe"
+    assert second["stats"]["commands_processed"] == 0
+    assert "extra" not in second
+
+
+def test_detailed_status_includes_hvac_state():
+    controller = _status_controller(HVACController(vehicle_manager=None))
+    status = controller.get_detailed_status()
+    assert status["hvac_state"]["mode"] == controller.hvac_controller.current_state.mode.value
+    assert "fan_speed" in status["hvac_state"]
@@ -0,0 +1,178 @@
+"""Unit tests for the vehicle interfaces' CAN payloads and OBD reading cache."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+import interfaces.vehicle as vehicle_module
+from interfaces.vehicle import (
+    CAN_DECODERS, CAN_ENCODERS, OBD_AVAILABLE, OBD_READING_TTL, OBD_STALE_WINDOW,
+    CANInterface, OBDInterface, VehicleManager
+)
+
+
+@pytest.mark.parametrize("name, value", [
+    ("hvac_temp_set", 21.5),
+    ("hvac_temp_set", -10.0),
+    ("hvac_fan_speed", 8),
+    ("interior_lights", 100),
+    ("audio_volume", 30),
+    ("boost_pressure", 14.7),
+])
+def test_can_payload_round_trip(name, value):
+    data = bytearray(8)
+    CAN_ENCODERS[name](data, value)
+    assert CAN_DECODERS[name](bytes(data)) == pytest.approx(value)
+
+
+def test_can_tables_cover_the_same_parameters():
+    assert CAN_ENCODERS.keys() == CAN_DECODERS.keys()
+
+
+def test_hvac_temp_wire_format():
+    data = bytearray(8)
+    CAN_ENCODERS["hvac_temp_set"](data, 22.0)
+    assert data == bytes([124, 0, 0, 0, 0, 0, 0, 0])  # (22 + 40) * 2
+
+
+@pytest.fixture
+def obd_interface():
+    if not OBD_AVAILABLE:
+        pytest.skip("python-obd not installed")
+
+    interface = OBDInterface()
+    interface.mock_mode = False
+    interface.connection = object()
+    interface.refreshed = []
+    interface.background = []
+
+    async def refresh(names):
+        interface.refreshed.append(list(names))
+        return {name: (1.0, "", time.monotonic()) for name in names}
+
+    interface._refresh = refresh
+    interface._refresh_in_background = interface.background.append
+    return interface
+
+
+def _store(interface, name, age):
+    interface._readings[name] = (90.0, "degC", time.monotonic() - age)
+
+
+@pytest.mark.asyncio
+async def test_fresh_reading_is_served_from_cache(obd_interface):
+    _store(obd_interface, "engine_temp", OBD_READING_TTL["engine_temp"] / 2)
+    params = await obd_interface.get_parameters_batch(["engine_temp"])
+    assert params["engine_temp"].value == 90.0
+    assert obd_interface.refreshed == [] and obd_interface.background == []
+
+
+@pytest.mark.asyncio
+async def test_stale_reading_is_served_and_refreshed_behind(obd_interface):
+    _store(obd_interface, "engine_temp", OBD_READING_TTL["engine_temp"] + OBD_STALE_WINDOW / 2)
+    params = await obd_interface.get_parameters_batch(["engine_temp"])
+    assert params["engine_temp"].value == 90.0
+    assert obd_interface.background == [["engine_temp"]]
+    assert obd_interface.refreshed == []
+
+
+@pytest.mark.asyncio
+async def test_expired_and_missing_readings_are_read_directly(obd_interface):
+    _store(obd_interface, "engine_temp", OBD_READING_TTL["engine_temp"] + OBD_STALE_WINDOW + 1)
+    params = await obd_interface.get_parameters_batch(["engine_temp", "engine_rpm", "not_a_pid"])
+    assert obd_interface.refreshed == [["engine_temp", "engine_rpm"]]
+    assert params.keys() == {"engine_temp", "engine_rpm"}
+    assert params["engine_temp"].value == 1.0
+
+
+def _frame(arbitration_id, first_byte):
+    return SimpleNamespace(arbitration_id=arbitration_id, data=bytearray([first_byte] + [0] * 7),
+                           timestamp=time.time(), is_extended_id=False)
+
+
+@pytest.mark.asyncio
+async def test_received_changes_reach_change_callbacks():
+    vehicle = VehicleManager()
+    changes = []
+    vehicle.register_change_callback(changes.append)
+    
+    fan = vehicle.can.message_definitions["hvac_fan_speed"]["id"]
+    batches = [[_frame(fan, 3)], [_frame(fan, 3)], [_frame(fan, 5)]]
+    
+    def recv_batch():
+        if batches:
+            return batches.pop(0)
+        time.sleep(0.01)
+        return []
+    vehicle.can._recv_batch = recv_batch
+    
+    rx = asyncio.create_task(vehicle.can._rx_loop())
+    await asyncio.sleep(0.1)
+    rx.cancel()
+    
+    # The repeated frame carried no change
+    assert changes == ["hvac_fan_speed", "hvac_fan_speed"]
+    assert vehicle.can._state_values[vehicle.can._state_index["hvac_fan_speed"]] == 5
+
+
+class FakeBus:
+    """CAN bus whose sends succeed, or block until released when stalled."""
+    
+    def __init__(self):
+        self.sent = []
+        self.release = threading.Event()
+        self.release.set()
+    
+    def send(self, message, timeout=None):
+        self.release.wait()
+        self.sent.append(bytes(message.data))
+    
+    def shutdown(self):
+        pass
+
+
+@pytest_asyncio.fixture
+async def can_interface():
+    interface = CANInterface()
+    if not interface.can_available:
+        pytest.skip("python-can not installed")
+    bus = interface.bus = FakeBus()
+    interface.mock_mode = False
+    interface._tx_task = asyncio.create_task(interface._tx_loop())
+    yield interface
+    bus.release.set()
+    await interface.disconnect()
+
+
+def _can_value(interface, name):
+    return interface._state_values[interface._state_index[name]]
+
+
+@pytest.mark.asyncio
+async def test_can_set_applies_state_after_send(can_interface):
+    assert await can_interface.set_parameter("audio_volume", 12)
+    assert can_interface.bus.sent == [bytes([12, 0, 0, 0, 0, 0, 0, 0])]
+    assert _can_value(can_interface, "audio_volume") == 12
+
+
+@pytest.mark.asyncio
+async def test_can_set_after_disconnect_fails_fast(can_interface):
+    await can_interface.disconnect()
+    assert await asyncio.wait_for(can_interface.set_parameter("audio_volume", 12), 1.0) is False
+
+
+@pytest.mark.asyncio
+async def test_can_set_times_out_on_stalled_bus(can_interface, monkeypatch):
+    monkeypatch.setattr(vehicle_module, "CAN_SET_TIMEOUT", 0.05)
+    can_interface.bus.release.clear()
+    assert await can_interface.set_parameter("audio_volume", 12) is False
+    
+    # Queued behind the stalled send, then skipped once the bus recovers
+    assert await can_interface.set_parameter("audio_volume", 20) is False
+    can_interface.bus.release.set()
+    await asyncio.wait_for(can_interface._tx_q.join(), 1.0)
+    assert len(can_interface.bus.sent) == 1
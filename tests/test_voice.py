@@ -0,0 +1,219 @@
+"""Unit tests for the voice pipeline."""
+
+import asyncio
+import math
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pyaudio")
+
+from voice.manager import (
+    AudioConfig, SpeechToText, VoiceManager, VoiceState,
+    STT_MIN_CONFIDENCE, DEFAULT_STT_MIN_CONFIDENCE
+)
+
+CHUNK = AudioConfig().chunk_size
+
+
+class FakeFasterWhisper:
+    """Stands in for a faster-whisper model returning fixed segments."""
+    
+    def __init__(self, *avg_logprobs):
+        self.segments = [
+            SimpleNamespace(text=f" part {i}", avg_logprob=lp) for i, lp in enumerate(avg_logprobs)
+        ]
+    
+    def transcribe(self, audio, **kwargs):
+        assert audio.dtype == np.float32
+        return iter(self.segments), None
+
+
+def _faster_whisper_stt():
+    stt = SpeechToText.__new__(SpeechToText)
+    stt.backend = "faster_whisper"
+    stt.mock_mode = False
+    return stt
+
+
+def test_faster_whisper_confidence_is_mean_logprob():
+    audio = np.zeros(1600, dtype=np.int16)
+    text, confidence = SpeechToText._run_model("faster_whisper", FakeFasterWhisper(-0.2, -0.6), audio)
+    assert text == "part 0 part 1"
+    assert confidence == pytest.approx(math.exp(-0.4))
+
+
+def test_typical_in_car_logprob_is_understood():
+    # Ordinary commands often decode around avg_logprob -0.5; the old fixed
+    # 0.7 cutoff (avg_logprob > -0.36) rejected them
+    stt = _faster_whisper_stt()
+    _, confidence = SpeechToText._run_model("faster_whisper", FakeFasterWhisper(-0.5), np.zeros(10, np.int16))
+    assert confidence < DEFAULT_STT_MIN_CONFIDENCE
+    assert confidence > stt.min_confidence
+
+
+def test_faster_whisper_rejects_below_whisper_cutoff():
+    stt = _faster_whisper_stt()
+    _, confidence = SpeechToText._run_model("faster_whisper", FakeFasterWhisper(-1.3), np.zeros(10, np.int16))
+    assert confidence < stt.min_confidence
+    assert stt.min_confidence == pytest.approx(math.exp(-1.0))
+
+
+def test_fixed_score_backends_keep_default_cutoff():
+    stt = _faster_whisper_stt()
+    stt.backend = "whisper"
+    assert stt.min_confidence == DEFAULT_STT_MIN_CONFIDENCE
+    stt.mock_mode = True
+    stt.backend = "faster_whisper"
+    assert stt.min_confidence == DEFAULT_STT_MIN_CONFIDENCE
+    assert "whisper" not in STT_MIN_CONFIDENCE
+
+
+class FakeInputStream:
+    """Plays back fixed chunks, then stops the capture loop."""
+    
+    def __init__(self, manager, chunks):
+        self.manager = manager
+        self.chunks = list(chunks)
+    
+    def read(self, frames, exception_on_overflow=True):
+        if len(self.chunks) == 1:
+            self.manager.recording = False
+        return self.chunks.pop(0).tobytes()
+    
+    def stop_stream(self):
+        pass
+    
+    def close(self):
+        pass
+
+
+def _chunks(count, amplitude=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    return [(rng.standard_normal(CHUNK) * amplitude).astype(np.int16) for _ in range(count)]
+
+
+def _capture(manager, chunks):
+    """Run the capture thread body on this thread over the given chunks."""
+    manager.audio = SimpleNamespace(open=lambda **kwargs: FakeInputStream(manager, chunks))
+    manager.recording = True
+    manager._audio_capture_thread()
+
+
+def _push(manager, chunk):
+    """Publish one chunk the way the capture thread does while a command is collected."""
+    head = manager._ring_head
+    manager._ring_slots[head % manager._ring_size][:] = chunk.tobytes()
+    manager._ring_head = head + 1
+    manager._audio_ready.set()
+
+
+@pytest.fixture
+def manager():
+    manager = VoiceManager(AudioConfig(), lambda command: None)
+    manager.state = VoiceState.PROCESSING  # keep the wake word detector out of the capture loop
+    return manager
+
+
+def test_read_chunk_is_fifo(manager):
+    chunks = _chunks(3)
+    for chunk in chunks:
+        _push(manager, chunk)
+    for chunk in chunks:
+        np.testing.assert_array_equal(manager._read_chunk(), chunk)
+    assert manager._read_chunk() is None
+
+
+def test_capture_keeps_only_pre_roll_while_idle(manager):
+    _capture(manager, _chunks(40))
+    assert manager._ring_tail == manager._ring_head == 40
+    assert manager._ring_keep == 40 - manager._pre_roll_chunks
+    assert manager.dropped_chunks == 0
+
+
+@pytest.mark.asyncio
+async def test_capture_drops_chunks_when_ring_is_full(manager):
+    manager._loop = asyncio.get_running_loop()
+    manager._wake_pending = True
+    chunks = _chunks(manager._ring_size + 3)
+    _capture(manager, chunks)
+    
+    # Nothing collected for the command was overwritten
+    assert manager.dropped_chunks == 3
+    assert manager._ring_head == manager._ring_size
+    np.testing.assert_array_equal(manager._ring[0], chunks[0])
+
+
+@pytest.mark.asyncio
+async def test_collect_command_includes_pre_roll(manager):
+    manager.stt.mock_mode = True
+    pre_roll = _chunks(manager._pre_roll_chunks + 5, seed=1)
+    _capture(manager, pre_roll)
+    manager.recording = True
+    
+    spoken = _chunks(8, seed=2)
+    silence = [np.zeros(CHUNK, np.int16)] * 30
+    for chunk in spoken + silence:
+        _push(manager, chunk)
+    audio, pre_roll_samples, draft = await manager._collect_command()
+    
+    assert pre_roll_samples == manager._pre_roll_chunks * CHUNK
+    expected = np.concatenate(pre_roll[-manager._pre_roll_chunks:] + spoken)
+    np.testing.assert_array_equal(audio, expected)
+    assert draft is None  # mock STT never starts a draft
+
+
+@pytest.mark.asyncio
+async def test_overlapping_reply_never_restores_a_stale_state(manager):
+    release = asyncio.Event()
+    
+    async def play(audio_data):
+        await release.wait()
+    manager._play_audio = play
+    manager.cached_speech["done"] = ("Done.", np.zeros(CHUNK, np.int16))
+    
+    # The speaker starts a reply while a command is being handled...
+    manager.state = VoiceState.PROCESSING
+    reply = asyncio.create_task(manager.play_cached("done"))
+    await asyncio.sleep(0)
+    assert manager._speaking == 1
+    
+    # ...the handler finishes first, then the reply ends
+    manager.state = VoiceState.LISTENING
+    release.set()
+    await reply
+    assert manager.state == VoiceState.LISTENING
+    assert manager._speaking == 0
+
+
+@pytest.mark.asyncio
+async def test_wake_word_detection_pauses_while_speaking(manager):
+    heard = []
+    manager.wake_word_detector = SimpleNamespace(process_audio=heard.append)
+    manager.state = VoiceState.LISTENING
+    
+    manager._speaking = 1
+    _capture(manager, _chunks(3))
+    assert heard == []
+    
+    manager._speaking = 0
+    _capture(manager, _chunks(3))
+    assert len(heard) == 3
+
+
+@pytest.mark.asyncio
+async def test_replies_go_through_the_reply_sink(manager):
+    queued = []
+    
+    async def sink(text, canned_key):
+        queued.append((text, canned_key))
+    manager.reply_sink = sink
+    manager.cached_speech["not_understood"] = ("Sorry, I didn't understand that command.", None)
+    
+    await manager._reply("not_understood")
+    await manager._reply("error")
+    assert queued == [
+        ("Sorry, I didn't understand that command.", "not_understood"),
+        ("Sorry, there was an error processing your command.", None),
+    ]